@@ -27,7 +27,8 @@
 class LlmCache:
     """File-based cache for LLM responses.
 
-    Cache keys are based on the test nodeid and source hash.
+    Cache keys are based on the provider, model, test nodeid and source
+    hash, so switching models never serves another model's annotations.
     """
 
     def __init__(self, config: Config) -> None:
@@ -39,6 +40,7 @@ def __init__(self, config: Config) -> None:
         self.config = config
         self.cache_dir = Path(config.cache_dir)
         self.ttl_seconds = config.llm_cache_ttl_seconds
+        self._key_prefix = f"{config.provider}:{config.model or ''}"
 
     def get(self, nodeid: str, source_hash: str) -> LlmAnnotation | None:
         """Get a cached annotation.
@@ -52,11 +54,8 @@ def get(self, nodeid: str, source_hash: str) -> LlmAnnotation | None:
         """
         cache_path = self._get_cache_path(nodeid, source_hash)
 
-        if not cache_path.exists():
-            return None
-
         try:
-            # Check TTL
+            # Check TTL (a missing entry raises here, saving a separate exists())
             mtime = cache_path.stat().st_mtime
             age = time.time() - mtime
             if age > self.ttl_seconds:
@@ -114,8 +113,8 @@ def _get_cache_path(self, nodeid: str, source_hash: str) -> Path:
         Returns:
             Path to cache file.
         """
-        # Create a stable key from nodeid + source hash
-        key = f"{nodeid}:{source_hash}"
+        # Create a stable key from provider/model + nodeid + source hash
+        key = f"{self._key_prefix}:{nodeid}:{source_hash}"
         key_hash = hashlib.sha256(key.encode()).hexdigest()[:16]
 
         return self.cache_dir / f"{key_hash}.json"
@@ -146,6 +146,9 @@ def _extract_contexts(self, data: CoverageData) -> dict[str, list[CoverageEntry]
             return result
 
         repo_root = self.config.repo_root or Path.cwd()
+        # Contexts repeat on every line a test covers; parse each one once and
+        # share the resulting nodeid string across all files.
+        context_nodeids: dict[str, str | None] = {}
 
         for file_path in measured_files:
             # Skip non-Python files
@@ -177,7 +180,10 @@ def _extract_contexts(self, data: CoverageData) -> dict[str, list[CoverageEntry]
 
             for line_no, line_contexts in contexts.items():
                 for ctx in line_contexts:
-                    nodeid = self._extract_nodeid(ctx)
+                    if ctx in context_nodeids:
+                        nodeid = context_nodeids[ctx]
+                    else:
+                        nodeid = context_nodeids[ctx] = self._extract_nodeid(ctx)
                     if nodeid:
                         if nodeid not in nodeid_lines:
                             nodeid_lines[nodeid] = []
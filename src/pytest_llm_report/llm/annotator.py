@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import time
 from collections.abc import Callable, Iterable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
@@ -11,6 +10,7 @@
 
 from pytest_llm_report.cache import LlmCache, hash_source
 from pytest_llm_report.llm.base import LlmProvider, get_provider
+from pytest_llm_report.llm.ratelimit import TokenBucket
 from pytest_llm_report.models import LlmAnnotation, TestCaseResult
 from pytest_llm_report.prompts import ContextAssembler
 
@@ -48,6 +48,26 @@ def annotate_tests(
         return
 
     provider = get_provider(config)
+    try:
+        _annotate_with_provider(tests, config, provider, progress)
+    finally:
+        provider.close()
+
+
+def _annotate_with_provider(
+    tests: Iterable[TestCaseResult],
+    config: Config,
+    provider: LlmProvider,
+    progress: Callable[[str], None] | None,
+) -> None:
+    """Annotate test cases in-place with an already created provider.
+
+    Args:
+        tests: Test cases to annotate.
+        config: Plugin configuration.
+        provider: LLM provider instance.
+        progress: Optional callback for progress reporting.
+    """
     if not provider.is_available():
         print(
             "pytest-llm-report: LLM provider "
@@ -72,6 +92,7 @@ def annotate_tests(
     # Create map for fast lookups
     node_map = {t.nodeid: t for t in limited_tests}
     assembler = ContextAssembler(config)
+    assembler.prefetch(limited_tests, config.repo_root)
 
     def get_source_helper(nodeid: str) -> str:
         test_obj = node_map.get(nodeid)
@@ -178,12 +199,16 @@ def get_source_helper(nodeid: str) -> str:
                         source_hash=source_hash,
                     )
                 )
+    assembler.release_prefetched()
+
     first_error: str | None = None
     failures = 0
 
     if uncached_tasks:
-        # Use concurrent processing for local providers or when concurrency > 1
-        use_concurrent = provider.is_local() and config.llm_max_concurrency > 1
+        # Use concurrent processing when the provider allows it and concurrency > 1
+        use_concurrent = (
+            config.llm_max_concurrency > 1 and provider.supports_concurrency()
+        )
 
         if use_concurrent:
             annotated_count, failures, first_error = _annotate_concurrent(
@@ -223,6 +248,132 @@ def get_source_helper(nodeid: str) -> str:
         print(message)
 
 
+def _chunk_tasks(
+    tasks: list[_AnnotationTask], batch_size: int
+) -> list[list[_AnnotationTask]]:
+    """Group single-test tasks so each chunk becomes one LLM request.
+
+    A batched request sends only each test's nodeid and source, so tasks
+    with context files or several tests get a chunk to themselves.
+
+    Args:
+        tasks: List of annotation tasks.
+        batch_size: Maximum tasks per chunk.
+
+    Returns:
+        List of task chunks in request order.
+    """
+    chunks: list[list[_AnnotationTask]] = []
+    pending: list[_AnnotationTask] = []
+    for task in tasks:
+        if (
+            batch_size <= 1
+            or len(task.batch_tests or [task.test]) > 1
+            or task.context_files
+        ):
+            chunks.append([task])
+            continue
+        pending.append(task)
+        if len(pending) == batch_size:
+            chunks.append(pending)
+            pending = []
+    if pending:
+        chunks.append(pending)
+    return chunks
+
+
+def _batch_size(provider: LlmProvider, config: Config) -> int:
+    """Return how many distinct tests to send per request.
+
+    Args:
+        provider: LLM provider instance.
+        config: Plugin configuration.
+
+    Returns:
+        The configured batch size, or 1 if the provider cannot batch.
+    """
+    return config.llm_batch_size if provider.supports_batching() else 1
+
+
+def _rate_limiter(provider: LlmProvider, config: Config) -> TokenBucket | None:
+    """Build the request rate limiter for a provider.
+
+    Args:
+        provider: LLM provider instance.
+        config: Plugin configuration.
+
+    Returns:
+        Token bucket using the provider's or configured rate limit, or None
+        for local providers, which need no rate limiting.
+    """
+    if provider.is_local():
+        return None
+    rate_limits = provider.get_rate_limits()
+    requests_per_minute = (
+        rate_limits.requests_per_minute
+        if rate_limits and rate_limits.requests_per_minute
+        else config.llm_requests_per_minute
+    )
+    return TokenBucket(requests_per_minute)
+
+
+def _annotate_task(
+    provider: LlmProvider, task: _AnnotationTask, limiter: TokenBucket | None
+) -> LlmAnnotation:
+    """Annotate one task with its own provider request.
+
+    Args:
+        provider: LLM provider instance.
+        task: Task to annotate.
+        limiter: Request rate limiter, if any.
+
+    Returns:
+        Annotation for the task.
+    """
+    if limiter:
+        limiter.acquire()
+    return provider.annotate(
+        task.test,
+        task.test_source,
+        task.context_files,
+        prompt_override=task.prompt_override,
+    )
+
+
+def _request_chunk(
+    provider: LlmProvider,
+    chunk: list[_AnnotationTask],
+    limiter: TokenBucket | None,
+) -> list[LlmAnnotation]:
+    """Annotate one chunk of tasks with a single provider request.
+
+    Tests the batched reply leaves out are annotated individually, each
+    as a separate rate-limited request.
+
+    Args:
+        provider: LLM provider instance.
+        chunk: Tasks produced by ``_chunk_tasks``.
+        limiter: Request rate limiter, if any.
+
+    Returns:
+        One annotation per task, in chunk order.
+    """
+    if len(chunk) == 1:
+        return [_annotate_task(provider, chunk[0], limiter)]
+    if limiter:
+        limiter.acquire()
+    annotations = provider.annotate_batch(
+        [task.test for task in chunk],
+        [task.test_source for task in chunk],
+    )
+    return [
+        annotation
+        if annotation is not None
+        else _annotate_task(provider, task, limiter)
+        for task, annotation in zip(chunk, annotations, strict=True)
+    ]
+
+
 def _annotate_sequential(
     tasks: list[_AnnotationTask],
     provider: LlmProvider,
@@ -248,57 +399,38 @@ def _annotate_sequential(
     """
     failures = 0
     first_error: str | None = None
-    last_request_time: float | None = None
     newly_annotated = 0
+    limiter = _rate_limiter(provider, config)
 
-    rate_limits = provider.get_rate_limits()
-    requests_per_minute = (
-        rate_limits.requests_per_minute
-        if rate_limits and rate_limits.requests_per_minute
-        else config.llm_requests_per_minute
-    )
-    request_interval = 60.0 / requests_per_minute
+    for chunk in _chunk_tasks(tasks, _batch_size(provider, config)):
+        annotations = _request_chunk(provider, chunk, limiter)
 
-    for task in tasks:
-        # Skip rate limiting for local providers
-        if not provider.is_local() and last_request_time is not None:
-            elapsed = time.monotonic() - last_request_time
-            if elapsed < request_interval:
-                time.sleep(request_interval - elapsed)
-
-        last_request_time = time.monotonic()
-        annotation = provider.annotate(
-            task.test,
-            task.test_source,
-            task.context_files,
-            prompt_override=task.prompt_override,
-        )
-
-        if task.batch_tests:
-            for t in task.batch_tests:
-                t.llm_annotation = annotation
-                # Assuming all tests in batch share same source (template)
-                cache.set(t.nodeid, task.source_hash, annotation)
+        for task, annotation in zip(chunk, annotations, strict=True):
+            if task.batch_tests:
+                for t in task.batch_tests:
+                    t.llm_annotation = annotation
+                    # Assuming all tests in batch share same source (template)
+                    cache.set(t.nodeid, task.source_hash, annotation)
 
-            newly_annotated += len(task.batch_tests)
-            completed += len(task.batch_tests) - 1  # +1 is done below
-        else:
-            task.test.llm_annotation = annotation
-            cache.set(task.test.nodeid, task.source_hash, annotation)
+                newly_annotated += len(task.batch_tests)
+                completed += len(task.batch_tests) - 1  # +1 is done below
+            else:
+                task.test.llm_annotation = annotation
+                cache.set(task.test.nodeid, task.source_hash, annotation)
 
-        newly_annotated += 1 if not task.batch_tests else 0  # Managed above
-        completed += 1
+            newly_annotated += 1 if not task.batch_tests else 0  # Managed above
+            completed += 1
 
-        if progress:
-            progress(
-                f"pytest-llm-report: LLM annotation {completed}/{total} "
-                f"({config.provider}): {task.test.nodeid}"
-            )
+            if progress:
+                progress(
+                    f"pytest-llm-report: LLM annotation {completed}/{total} "
+                    f"({config.provider}): {task.test.nodeid}"
+                )
 
-        if annotation.error:
-            failures += 1
-            if first_error is None:
-                first_error = annotation.error
+            if annotation.error:
+                failures += 1
+                if first_error is None:
+                    first_error = annotation.error
 
     return newly_annotated, failures, first_error
 
@@ -328,18 +460,12 @@ def _annotate_concurrent(
     """
     failures = 0
     first_error: str | None = None
-    max_workers = config.llm_max_concurrency
     newly_annotated = 0
-
-    def _process_task(task: _AnnotationTask) -> tuple[_AnnotationTask, LlmAnnotation]:
-        """Process a single annotation task."""
-        annotation = provider.annotate(
-            task.test,
-            task.test_source,
-            task.context_files,
-            prompt_override=task.prompt_override,
-        )
-        return task, annotation
+    chunks = _chunk_tasks(tasks, _batch_size(provider, config))
+    # No point starting more threads than there are requests to make
+    max_workers = min(config.llm_max_concurrency, len(chunks))
+    # Remote providers overlap request latency but still honor the rate limit
+    limiter = _rate_limiter(provider, config)
 
     if progress:
         progress(
@@ -348,34 +474,36 @@ def _process_task(task: _AnnotationTask) -> tuple[_AnnotationTask, LlmAnnotation
         )
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(_process_task, task): task for task in tasks}
+        futures = {
+            executor.submit(_request_chunk, provider, chunk, limiter): chunk
+            for chunk in chunks
+        }
 
         for future in as_completed(futures):
-            task, annotation = future.result()
-
-            if task.batch_tests:
-                for t in task.batch_tests:
-                    t.llm_annotation = annotation
-                    cache.set(t.nodeid, task.source_hash, annotation)
-
-                newly_annotated += len(task.batch_tests)
-                completed += len(task.batch_tests) - 1  # +1 is done below
-            else:
-                task.test.llm_annotation = annotation
-                cache.set(task.test.nodeid, task.source_hash, annotation)
+            for task, annotation in zip(futures[future], future.result(), strict=True):
+                if task.batch_tests:
+                    for t in task.batch_tests:
+                        t.llm_annotation = annotation
+                        cache.set(t.nodeid, task.source_hash, annotation)
+
+                    newly_annotated += len(task.batch_tests)
+                    completed += len(task.batch_tests) - 1  # +1 is done below
+                else:
+                    task.test.llm_annotation = annotation
+                    cache.set(task.test.nodeid, task.source_hash, annotation)
 
-            newly_annotated += 1 if not task.batch_tests else 0  # Managed above
-            completed += 1
+                newly_annotated += 1 if not task.batch_tests else 0  # Managed above
+                completed += 1
 
-            if progress:
-                progress(
-                    f"pytest-llm-report: LLM annotation {completed}/{total} "
-                    f"({config.provider}): {task.test.nodeid}"
-                )
+                if progress:
+                    progress(
+                        f"pytest-llm-report: LLM annotation {completed}/{total} "
+                        f"({config.provider}): {task.test.nodeid}"
+                    )
 
-            if annotation.error:
-                failures += 1
-                if first_error is None:
-                    first_error = annotation.error
+                if annotation.error:
+                    failures += 1
+                    if first_error is None:
+                        first_error = annotation.error
 
     return newly_annotated, failures, first_error
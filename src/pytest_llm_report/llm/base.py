@@ -13,11 +13,12 @@
 from __future__ import annotations
 
 import json
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from pytest_llm_report.models import LlmAnnotation
+from pytest_llm_report.models import LlmAnnotation, LlmTokenUsage
 
 if TYPE_CHECKING:
     from pytest_llm_report.models import TestCaseResult
@@ -46,9 +47,63 @@
 # Legacy alias for backward compatibility
 SYSTEM_PROMPT = STANDARD_SYSTEM_PROMPT
 
+# Prompt for annotating several distinct tests in one request
+BATCH_SYSTEM_PROMPT = """You are a helpful assistant that analyzes Python test code.
+You are given a JSON list of tests, each with an "id", "nodeid" and "source".
+For EVERY test, provide a structured annotation with:
+1. scenario: What the test verifies (1-3 sentences)
+2. why_needed: What bug or regression this test prevents (1-3 sentences)
+3. key_assertions: The critical checks performed (3-8 bullet points)
+
+Respond ONLY with valid JSON in this exact format:
+{
+  "annotations": [
+    {"id": 0, "scenario": "...", "why_needed": "...", "key_assertions": ["..."]}
+  ]
+}"""
+
 # Threshold for determining simple vs complex tests
 COMPLEXITY_THRESHOLD = 10
 
+# Complexity indicators and their weights, compiled once for every prompt
+_COMPLEXITY_PATTERNS = (
+    (re.compile(r"\bassert\b"), 3),
+    (re.compile(r"\bmock\b", re.IGNORECASE), 5),
+    (re.compile(r"\bpatch\b"), 5),
+    (re.compile(r"\bfixture\b"), 2),
+)
+
+
+class LlmRequestError(Exception):
+    """An LLM request failed for good; the message is the user-facing error."""
+
+
+def _split_token_usage(usage: LlmTokenUsage, parts: int) -> list[LlmTokenUsage]:
+    """Split one request's token usage across the tests it annotated.
+
+    Counts are divided as evenly as possible, so the shares always add up
+    to the original usage.
+
+    Args:
+        usage: Token usage reported for the request.
+        parts: Number of annotations sharing the request.
+
+    Returns:
+        One LlmTokenUsage per annotation.
+    """
+
+    def share(total: int, index: int) -> int:
+        return total // parts + (1 if index < total % parts else 0)
+
+    return [
+        LlmTokenUsage(
+            prompt_tokens=share(usage.prompt_tokens, i),
+            completion_tokens=share(usage.completion_tokens, i),
+            total_tokens=share(usage.total_tokens, i),
+        )
+        for i in range(parts)
+    ]
+
 
 class LlmProvider(ABC):
     """Abstract base class for LLM providers.
@@ -104,6 +159,37 @@ def annotate(
 
         return annotation
 
+    def annotate_batch(
+        self,
+        tests: list[TestCaseResult],
+        sources: list[str],
+    ) -> list[LlmAnnotation | None]:
+        """Annotate several distinct tests with a single LLM request.
+
+        Only the test source is sent, so callers batch tests that have no
+        context files or prompt override. Providers that return True from
+        ``supports_batching`` override this; the default answers no test.
+
+        Args:
+            tests: Tests to annotate.
+            sources: Source code for each test, in the same order.
+
+        Returns:
+            One entry per test, in input order. Tests the reply skips or
+            answers invalidly are None so the caller can annotate them
+            individually; when the request itself fails, every entry is an
+            error annotation, as with ``annotate``.
+        """
+        return [None for _ in tests]
+
+    def supports_batching(self) -> bool:
+        """Check if the provider can annotate several tests in one request.
+
+        Returns:
+            True if the provider implements ``annotate_batch``.
+        """
+        return False
+
     @abstractmethod
     def _annotate_internal(
         self,
@@ -173,6 +259,21 @@ def is_local(self) -> bool:
         """
         return False
 
+    def supports_concurrency(self) -> bool:
+        """Check if the provider can serve requests from several threads.
+
+        Returns:
+            True if the annotator may issue concurrent requests.
+        """
+        return self.is_local()
+
+    def close(self) -> None:
+        """Release resources held by the provider, such as HTTP clients.
+
+        Called once the annotation run is finished. The default does nothing.
+        """
+        return None
+
     def _estimate_test_complexity(self, test_source: str | None) -> int:
         """Estimate test complexity for prompt tier selection.
 
@@ -185,14 +286,11 @@ def _estimate_test_complexity(self, test_source: str | None) -> int:
         if not test_source:
             return 0
 
-        import re
-
         # Count complexity indicators using word boundaries for accuracy
-        score = 0
-        score += len(re.findall(r"\bassert\b", test_source)) * 3
-        score += len(re.findall(r"\bmock\b", test_source, re.IGNORECASE)) * 5
-        score += len(re.findall(r"\bpatch\b", test_source)) * 5
-        score += len(re.findall(r"\bfixture\b", test_source)) * 2
+        score = sum(
+            len(pattern.findall(test_source)) * weight
+            for pattern, weight in _COMPLEXITY_PATTERNS
+        )
         score += test_source.count("pytest.raises") * 3
         score += test_source.count("@") * 2  # Decorators
         score += len(test_source) // 100  # Length factor
@@ -313,6 +411,84 @@ def _build_prompt(
 
         return "\n".join(parts)
 
+    def _build_batch_prompt(
+        self,
+        tests: list[TestCaseResult],
+        sources: list[str],
+    ) -> str:
+        """Build the prompt for a batch of distinct tests.
+
+        Args:
+            tests: Tests to annotate.
+            sources: Source code for each test, in the same order.
+
+        Returns:
+            Prompt string listing the tests as JSON.
+        """
+        entries = [
+            {"id": i, "nodeid": test.nodeid, "source": source}
+            for i, (test, source) in enumerate(zip(tests, sources, strict=True))
+        ]
+        return "Tests:\n" + json.dumps(entries, indent=2)
+
+    def _parse_batch_response(self, response: str) -> dict[int, LlmAnnotation]:
+        """Parse a batched LLM response into annotations keyed by test id.
+
+        Entries that are malformed or fail validation are left out so the
+        caller can retry those tests individually.
+
+        Args:
+            response: Raw LLM response.
+
+        Returns:
+            Mapping of test id to successfully parsed LlmAnnotation.
+        """
+        from pytest_llm_report.llm.schemas import extract_json_from_response
+
+        json_str = extract_json_from_response(response)
+        if not json_str:
+            return {}
+
+        try:
+            data = json.loads(json_str)
+        except json.JSONDecodeError:
+            return {}
+
+        entries = data.get("annotations") if isinstance(data, dict) else None
+        if not isinstance(entries, list):
+            return {}
+
+        results: dict[int, LlmAnnotation] = {}
+        for entry in entries:
+            if not isinstance(entry, dict) or not isinstance(entry.get("id"), int):
+                continue
+            annotation = self._annotation_from_data(entry)
+            if not annotation.error:
+                results[entry["id"]] = annotation
+        return results
+
+    def _batch_annotations(
+        self, response: str, token_usage: LlmTokenUsage | None, count: int
+    ) -> list[LlmAnnotation | None]:
+        """Map a batch reply onto its tests and split the token usage.
+
+        Args:
+            response: Raw LLM response for a batch prompt.
+            token_usage: Token usage reported for the request, if any.
+            count: Number of tests in the batch.
+
+        Returns:
+            One entry per test, None where the reply has no valid annotation.
+        """
+        results = self._parse_batch_response(response)
+        annotations = [results.get(i) for i in range(count)]
+        parsed = [annotation for annotation in annotations if annotation is not None]
+        if token_usage and parsed:
+            shares = _split_token_usage(token_usage, len(parsed))
+            for annotation, share in zip(parsed, shares, strict=True):
+                annotation.token_usage = share
+        return annotations
+
     def _parse_response(self, response: str) -> LlmAnnotation:
         """Parse the LLM response into an annotation.
 
@@ -332,32 +508,45 @@ def _parse_response(self, response: str) -> LlmAnnotation:
 
         try:
             data = json.loads(json_str)
+        except json.JSONDecodeError:
+            return LlmAnnotation(error="Failed to parse LLM response as JSON")
+
+        if not isinstance(data, dict):
+            return LlmAnnotation(error="Invalid response: expected a JSON object")
 
-            # Validate response structure
-            scenario = data.get("scenario", "")
-            why_needed = data.get("why_needed", "")
-            key_assertions = data.get("key_assertions", [])
-
-            # Ensure types are correct
-            if not isinstance(scenario, str):
-                scenario = str(scenario) if scenario else ""
-            if not isinstance(why_needed, str):
-                why_needed = str(why_needed) if why_needed else ""
-            if not isinstance(key_assertions, list):
-                return LlmAnnotation(
-                    error="Invalid response: key_assertions must be a list"
-                )
-            # Ensure all assertions are strings
-            key_assertions = [str(a) for a in key_assertions if a]
+        return self._annotation_from_data(data)
+
+    def _annotation_from_data(self, data: dict[str, Any]) -> LlmAnnotation:
+        """Validate a decoded response object and build an annotation.
+
+        Args:
+            data: Decoded JSON object from the LLM.
 
+        Returns:
+            LlmAnnotation, with an error set if validation fails.
+        """
+        scenario = data.get("scenario", "")
+        why_needed = data.get("why_needed", "")
+        key_assertions = data.get("key_assertions", [])
+
+        # Ensure types are correct
+        if not isinstance(scenario, str):
+            scenario = str(scenario) if scenario else ""
+        if not isinstance(why_needed, str):
+            why_needed = str(why_needed) if why_needed else ""
+        if not isinstance(key_assertions, list):
             return LlmAnnotation(
-                scenario=scenario,
-                why_needed=why_needed,
-                key_assertions=key_assertions,
-                confidence=0.8,  # Default confidence for successful parse
+                error="Invalid response: key_assertions must be a list"
             )
-        except json.JSONDecodeError:
-            return LlmAnnotation(error="Failed to parse LLM response as JSON")
+        # Ensure all assertions are strings
+        key_assertions = [str(a) for a in key_assertions if a]
+
+        return LlmAnnotation(
+            scenario=scenario,
+            why_needed=why_needed,
+            key_assertions=key_assertions,
+            confidence=0.8,  # Default confidence for successful parse
+        )
 
 
 @dataclass(frozen=True)
@@ -50,9 +50,7 @@ def _get_base_nodeid(nodeid: str) -> str:
     Returns:
         Base nodeid without params: "tests/test_foo.py::test_add"
     """
-    if "[" in nodeid:
-        return nodeid.split("[")[0]
-    return nodeid
+    return nodeid.partition("[")[0]
 
 
 def _compute_source_hash(source: str) -> str:
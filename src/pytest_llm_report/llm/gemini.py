@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
 from collections import deque
 from dataclasses import dataclass
@@ -16,6 +17,8 @@
 from pytest_llm_report.models import LlmAnnotation, LlmTokenUsage
 
 if TYPE_CHECKING:
+    import httpx
+
     from pytest_llm_report.models import TestCaseResult
     from pytest_llm_report.options import Config
 
@@ -142,6 +145,9 @@ def __init__(self, config: Config) -> None:
         # Track when each model hit its daily limit (for recovery after 24h)
         self._model_exhausted_at: dict[str, float] = {}
         self._cooldowns: dict[str, float] = {}
+        # Created on first use so httpx stays optional
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
 
     def _annotate_internal(
         self,
@@ -323,6 +329,26 @@ def _annotate_internal(
             error="Gemini rate limits reached for all available models"
         )
 
+    def _get_client(self) -> httpx.Client:
+        """Return the HTTP client shared by this provider's requests.
+
+        Raises:
+            ImportError: If httpx is not installed.
+        """
+        with self._client_lock:
+            if self._client is None:
+                import httpx
+
+                self._client = httpx.Client()
+            return self._client
+
+    def close(self) -> None:
+        """Close the HTTP client, if one was created."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
     def _check_availability(self) -> bool:
         """Check if Gemini provider is available.
 
@@ -380,8 +406,6 @@ def _call_gemini(
         Returns:
             Response text and token usage if available.
         """
-        import httpx
-
         model = self._normalize_model_name(model)
         url = (
             "https://generativelanguage.googleapis.com/v1beta/models/"
@@ -407,7 +431,7 @@ def _call_gemini(
                 },
             },
         }
-        response = httpx.post(
+        response = self._get_client().post(
             url, json=payload, timeout=self.config.llm_timeout_seconds
         )
         if response.status_code == 429:
@@ -432,13 +456,11 @@ def _call_gemini(
         return text, token_usage
 
     def _fetch_rate_limits(self, api_token: str, model: str) -> _GeminiRateLimitConfig:
-        import httpx
-
         url = (
             "https://generativelanguage.googleapis.com/v1beta/models/"
             f"{self._normalize_model_name(model)}?key={api_token}"
         )
-        response = httpx.get(url, timeout=self.config.llm_timeout_seconds)
+        response = self._get_client().get(url, timeout=self.config.llm_timeout_seconds)
         response.raise_for_status()
         data = response.json()
         return self._parse_rate_limits(data.get("rateLimits", []))
@@ -534,11 +556,10 @@ def _parse_preferred_models(self) -> list[str]:
     def _fetch_available_models(
         self, api_token: str
     ) -> tuple[list[str], dict[str, int]]:
-        import httpx
-
+        client = self._get_client()
         url = f"https://generativelanguage.googleapis.com/v1beta/models?key={api_token}"
         try:
-            response = httpx.get(url, timeout=self.config.llm_timeout_seconds)
+            response = client.get(url, timeout=self.config.llm_timeout_seconds)
             response.raise_for_status()
             data = response.json()
         except Exception:
@@ -7,9 +7,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-
-from pytest_llm_report.llm.base import LlmProvider
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from pytest_llm_report.llm.base import (
+    BATCH_SYSTEM_PROMPT,
+    LlmProvider,
+    LlmRequestError,
+)
 from pytest_llm_report.models import LlmAnnotation, LlmTokenUsage
 
 if TYPE_CHECKING:
@@ -17,6 +22,8 @@
     from pytest_llm_report.models import TestCaseResult
     from pytest_llm_report.options import Config
 
+_T = TypeVar("_T")
+
 
 class LiteLLMProvider(LlmProvider):
     """LiteLLM provider for multiple LLM backends.
@@ -36,6 +43,7 @@ def __init__(self, config: Config) -> None:
         """
         super().__init__(config)
         self._token_refresher: TokenRefresher | None = None
+        self._litellm: Any = None
 
         # Initialize token refresher if command is configured
         if config.litellm_token_refresh_command:
@@ -48,6 +56,21 @@ def __init__(self, config: Config) -> None:
                 json_key=config.litellm_token_json_key,
             )
 
+    def _get_litellm(self) -> Any:
+        """Return the litellm module, importing it on first use.
+
+        litellm stays an optional dependency; after the first successful
+        import the module is reused without going through the import system.
+
+        Raises:
+            ImportError: If litellm is not installed.
+        """
+        if self._litellm is None:
+            import litellm
+
+            self._litellm = litellm
+        return self._litellm
+
     def _get_api_key(self, force_refresh: bool = False) -> str | None:
         """Get the API key, refreshing if using dynamic tokens.
 
@@ -80,14 +103,12 @@ def _annotate_internal(
             LlmAnnotation with parsed response.
         """
         try:
-            import litellm
+            litellm = self._get_litellm()
         except ImportError:
             return LlmAnnotation(
                 error="litellm not installed. Install with: pip install litellm"
             )
 
-        import time
-
         # Select appropriate system prompt based on test complexity
         system_prompt = self._select_system_prompt(test_source)
 
@@ -97,6 +118,35 @@ def _annotate_internal(
         else:
             prompt = self._build_prompt(test, test_source, context_files)
 
+        try:
+            # _make_request handles the API call and response parsing.
+            # It returns an LlmAnnotation on success or for non-retriable
+            # parsing errors, so only API errors reach the retry loop.
+            return self._with_retries(
+                litellm,
+                lambda force_refresh: self._make_request(
+                    litellm, prompt, system_prompt, force_refresh=force_refresh
+                ),
+            )
+        except LlmRequestError as e:
+            return LlmAnnotation(error=str(e))
+
+    def _with_retries(self, litellm: Any, send: Callable[[bool], _T]) -> _T:
+        """Run a request with retries and token refresh on 401.
+
+        Args:
+            litellm: The litellm module.
+            send: Makes one request; receives whether to force a token refresh.
+
+        Returns:
+            The first successful result of ``send``.
+
+        Raises:
+            LlmRequestError: With the user-facing error once retries are exhausted
+                or the error is not worth retrying.
+        """
+        import time
+
         max_retries = self.config.llm_max_retries
         last_error = None
 
@@ -105,11 +155,7 @@ def _annotate_internal(
 
         for attempt in range(max_retries):
             try:
-                # _make_request handles the API call and response parsing.
-                # It returns an LlmAnnotation on success or for non-retriable
-                # parsing errors. We can return this directly. The surrounding
-                # retry loop is for transient API errors caught as exceptions.
-                return self._make_request(litellm, prompt, system_prompt)
+                return send(False)
 
             except Exception as e:
                 # Check if this is an authentication error (401)
@@ -123,26 +169,24 @@ def _annotate_internal(
                         # Force refresh and retry once
                         self._token_refresher.invalidate()
                         try:
-                            return self._make_request(
-                                litellm, prompt, system_prompt, force_refresh=True
-                            )
+                            return send(True)
                         except Exception as retry_e:
                             last_error = f"Auth retry failed: {retry_e}"
                     else:
-                        return LlmAnnotation(
-                            error="Authentication failed. Check API key or token."
-                        )
+                        raise LlmRequestError(
+                            "Authentication failed. Check API key or token."
+                        ) from e
                 elif isinstance(e, (RuntimeError, ValueError, AttributeError)):
                     # Common errors that are likely not transient
-                    return LlmAnnotation(error=str(e))
+                    raise LlmRequestError(str(e)) from e
                 else:
                     last_error = str(e)
 
             if attempt < max_retries - 1:
                 time.sleep(2 * (attempt + 1))
 
-        return LlmAnnotation(
-            error=f"Failed after {max_retries} retries. Last error: {last_error}"
+        raise LlmRequestError(
+            f"Failed after {max_retries} retries. Last error: {last_error}"
         )
 
     def _make_request(
@@ -166,8 +210,45 @@ def _make_request(
         Raises:
             Exception: On API errors (caller should handle).
         """
-        # Build completion kwargs
-        kwargs = {
+        kwargs = self._completion_kwargs(prompt, system_prompt, force_refresh)
+        response = litellm.completion(**kwargs)
+
+        content = response.choices[0].message.content
+        annotation = self._parse_response(content)
+
+        # Extract token usage if available
+        token_usage = self._token_usage(response)
+        if token_usage:
+            annotation.token_usage = token_usage
+
+        if annotation.error:
+            # If "context too long", fail immediately so base class can fallback
+            if "context too long" in annotation.error.lower():
+                return annotation
+
+            # Fail immediately on other parsing errors.
+            # Retrying with the same prompt won't help with bad JSON.
+            return annotation
+
+        return annotation
+
+    def _completion_kwargs(
+        self,
+        prompt: str,
+        system_prompt: str,
+        force_refresh: bool = False,
+    ) -> dict[str, Any]:
+        """Build keyword arguments for ``litellm.completion``.
+
+        Args:
+            prompt: User prompt.
+            system_prompt: System prompt.
+            force_refresh: If True, force token refresh before request.
+
+        Returns:
+            Completion keyword arguments.
+        """
+        kwargs: dict[str, Any] = {
             "model": self.config.model or "gpt-3.5-turbo",
             "messages": [
                 {"role": "system", "content": system_prompt},
@@ -187,30 +268,80 @@ def _make_request(
         if api_key:
             kwargs["api_key"] = api_key
 
-        response = litellm.completion(**kwargs)
+        return kwargs
 
-        content = response.choices[0].message.content
-        annotation = self._parse_response(content)
+    def _token_usage(self, response: Any) -> LlmTokenUsage | None:
+        """Extract token usage from a LiteLLM response.
 
-        # Extract token usage if available
-        if hasattr(response, "usage") and response.usage:
-            usage = response.usage
-            annotation.token_usage = LlmTokenUsage(
-                prompt_tokens=getattr(usage, "prompt_tokens", 0),
-                completion_tokens=getattr(usage, "completion_tokens", 0),
-                total_tokens=getattr(usage, "total_tokens", 0),
-            )
+        Args:
+            response: LiteLLM completion response.
 
-        if annotation.error:
-            # If "context too long", fail immediately so base class can fallback
-            if "context too long" in annotation.error.lower():
-                return annotation
+        Returns:
+            LlmTokenUsage, or None if the response reports no usage.
+        """
+        if not (hasattr(response, "usage") and response.usage):
+            return None
+        usage = response.usage
+        return LlmTokenUsage(
+            prompt_tokens=getattr(usage, "prompt_tokens", 0),
+            completion_tokens=getattr(usage, "completion_tokens", 0),
+            total_tokens=getattr(usage, "total_tokens", 0),
+        )
 
-            # Fail immediately on other parsing errors.
-            # Retrying with the same prompt won't help with bad JSON.
-            return annotation
+    def annotate_batch(
+        self,
+        tests: list[TestCaseResult],
+        sources: list[str],
+    ) -> list[LlmAnnotation | None]:
+        """Annotate several distinct tests with a single LiteLLM request.
 
-        return annotation
+        Args:
+            tests: Tests to annotate.
+            sources: Source code for each test, in the same order.
+
+        Returns:
+            One entry per test, None where the reply has no valid annotation,
+            or an error annotation for every test if the request fails.
+        """
+        prompt = self._build_batch_prompt(tests, sources)
+        try:
+            response, token_usage = self._complete(prompt, BATCH_SYSTEM_PROMPT)
+        except Exception as e:
+            return [LlmAnnotation(error=str(e)) for _ in tests]
+        return self._batch_annotations(response, token_usage, len(tests))
+
+    def supports_batching(self) -> bool:
+        """LiteLLM can answer several tests from one prompt.
+
+        Returns:
+            True, so the annotator may batch tests without context files.
+        """
+        return True
+
+    def _complete(
+        self, prompt: str, system_prompt: str
+    ) -> tuple[str, LlmTokenUsage | None]:
+        """Send a raw prompt through LiteLLM and return the response text.
+
+        Args:
+            prompt: User prompt.
+            system_prompt: System prompt.
+
+        Returns:
+            Tuple of (raw response text, token usage if reported).
+
+        Raises:
+            LlmRequestError: If the request fails after retries.
+        """
+        litellm = self._get_litellm()
+        response = self._with_retries(
+            litellm,
+            lambda force_refresh: litellm.completion(
+                **self._completion_kwargs(prompt, system_prompt, force_refresh)
+            ),
+        )
+        content = cast(str, response.choices[0].message.content or "")
+        return content, self._token_usage(response)
 
     def get_max_context_tokens(self) -> int:
         """Get the maximum number of input tokens allowed for the current model.
@@ -219,8 +350,7 @@ def get_max_context_tokens(self) -> int:
             Max input tokens.
         """
         try:
-            import litellm
-
+            litellm = self._get_litellm()
             model = self.config.model or "gpt-3.5-turbo"
             # litellm.get_max_tokens() returns dict sometimes or int?
             # It usually returns total context window.
@@ -233,6 +363,14 @@ def get_max_context_tokens(self) -> int:
             pass
         return 4096
 
+    def supports_concurrency(self) -> bool:
+        """LiteLLM completion calls are safe to run from worker threads.
+
+        Returns:
+            True, so remote models can overlap request latency.
+        """
+        return True
+
     def _check_availability(self) -> bool:
         """Check if LiteLLM is available.
 
@@ -240,8 +378,7 @@ def _check_availability(self) -> bool:
             True if litellm is installed.
         """
         try:
-            import litellm  # noqa: F401
-
+            self._get_litellm()
             return True
         except ImportError:
             return False
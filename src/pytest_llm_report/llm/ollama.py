@@ -6,13 +6,24 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
-
-from pytest_llm_report.llm.base import LlmProvider
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from pytest_llm_report.llm.base import (
+    BATCH_SYSTEM_PROMPT,
+    LlmProvider,
+    LlmRequestError,
+)
 from pytest_llm_report.models import LlmAnnotation, LlmTokenUsage
 
 if TYPE_CHECKING:
+    import httpx
+
     from pytest_llm_report.models import TestCaseResult
+    from pytest_llm_report.options import Config
+
+_T = TypeVar("_T")
 
 
 class OllamaProvider(LlmProvider):
@@ -21,6 +32,39 @@ class OllamaProvider(LlmProvider):
     Connects to a local or remote Ollama server.
     """
 
+    def __init__(self, config: Config) -> None:
+        """Initialize the Ollama provider.
+
+        Args:
+            config: Plugin configuration.
+        """
+        super().__init__(config)
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """Return the HTTP client shared by this provider's requests.
+
+        Reusing one client keeps connections to the Ollama server alive
+        between annotations instead of reconnecting for every test.
+
+        Raises:
+            ImportError: If httpx is not installed.
+        """
+        with self._client_lock:
+            if self._client is None:
+                import httpx
+
+                self._client = httpx.Client()
+            return self._client
+
+    def close(self) -> None:
+        """Close the HTTP client, if one was created."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
     def _annotate_internal(
         self,
         test: TestCaseResult,
@@ -46,8 +90,6 @@ def _annotate_internal(
                 error="httpx not installed. Install with: pip install httpx"
             )
 
-        import time
-
         # Build prompt with current context defined or use override
         if prompt_override:
             prompt = prompt_override
@@ -57,51 +99,128 @@ def _annotate_internal(
         # Select appropriate system prompt based on test complexity
         system_prompt = self._select_system_prompt(test_source)
 
+        try:
+            response_data = self._with_retries(
+                lambda: self._call_ollama(prompt, system_prompt)
+            )
+        except LlmRequestError as e:
+            return LlmAnnotation(error=str(e))
+
+        # Parsing errors, including "context too long", are returned as-is:
+        # retrying the same prompt won't fix bad JSON, and the base class
+        # handles the context fallback.
+        annotation = self._parse_response(response_data.get("response", ""))
+        token_usage = self._token_usage(response_data)
+        if token_usage:
+            annotation.token_usage = token_usage
+        return annotation
+
+    def _with_retries(self, send: Callable[[], _T]) -> _T:
+        """Run a request, retrying transient failures.
+
+        Args:
+            send: Makes one request.
+
+        Returns:
+            The first successful result of ``send``.
+
+        Raises:
+            LlmRequestError: With the user-facing error once retries are
+                exhausted or the error is not worth retrying.
+        """
+        import time
+
         max_retries = self.config.llm_max_retries
         last_error = None
 
         for attempt in range(max_retries):
             try:
-                response_data = self._call_ollama(prompt, system_prompt)
-                response_text = response_data.get("response", "")
-                annotation = self._parse_response(response_text)
-
-                # Extract token usage
-                if (
-                    "prompt_eval_count" in response_data
-                    or "eval_count" in response_data
-                ):
-                    prompt_tokens = response_data.get("prompt_eval_count", 0)
-                    completion_tokens = response_data.get("eval_count", 0)
-                    total = prompt_tokens + completion_tokens
-                    annotation.token_usage = LlmTokenUsage(
-                        prompt_tokens=prompt_tokens,
-                        completion_tokens=completion_tokens,
-                        total_tokens=total,
-                    )
-
-                if annotation.error:
-                    # If "context too long", fail immediately so base class can fallback
-                    if "context too long" in annotation.error.lower():
-                        return annotation
-
-                    # Fail immediately on other parsing errors.
-                    # Retrying with the same prompt won't help with bad JSON.
-                    return annotation
-
-                return annotation
-
+                return send()
             except (RuntimeError, ValueError, AttributeError) as e:
                 # Common errors that are likely not transient (e.g. mock failures, code bugs)
-                return LlmAnnotation(error=str(e))
+                raise LlmRequestError(str(e)) from e
             except Exception as e:
                 last_error = str(e)
 
             if attempt < max_retries - 1:
                 time.sleep(2 * (attempt + 1))
 
-        return LlmAnnotation(
-            error=f"Failed after {max_retries} retries. Last error: {last_error}"
+        raise LlmRequestError(
+            f"Failed after {max_retries} retries. Last error: {last_error}"
+        )
+
+    def _token_usage(self, response_data: dict[str, Any]) -> LlmTokenUsage | None:
+        """Extract token usage from an Ollama response.
+
+        Args:
+            response_data: Decoded response body.
+
+        Returns:
+            LlmTokenUsage, or None if the response reports no counts.
+        """
+        if (
+            "prompt_eval_count" not in response_data
+            and "eval_count" not in response_data
+        ):
+            return None
+        prompt_tokens = response_data.get("prompt_eval_count", 0)
+        completion_tokens = response_data.get("eval_count", 0)
+        return LlmTokenUsage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+
+    def annotate_batch(
+        self,
+        tests: list[TestCaseResult],
+        sources: list[str],
+    ) -> list[LlmAnnotation | None]:
+        """Annotate several distinct tests with a single Ollama request.
+
+        Args:
+            tests: Tests to annotate.
+            sources: Source code for each test, in the same order.
+
+        Returns:
+            One entry per test, None where the reply has no valid annotation,
+            or an error annotation for every test if the request fails.
+        """
+        prompt = self._build_batch_prompt(tests, sources)
+        try:
+            response, token_usage = self._complete(prompt, BATCH_SYSTEM_PROMPT)
+        except Exception as e:
+            return [LlmAnnotation(error=str(e)) for _ in tests]
+        return self._batch_annotations(response, token_usage, len(tests))
+
+    def supports_batching(self) -> bool:
+        """Ollama can answer several tests from one prompt.
+
+        Returns:
+            True, so the annotator may batch tests without context files.
+        """
+        return True
+
+    def _complete(
+        self, prompt: str, system_prompt: str
+    ) -> tuple[str, LlmTokenUsage | None]:
+        """Send a raw prompt to Ollama and return the response text.
+
+        Args:
+            prompt: User prompt.
+            system_prompt: System prompt.
+
+        Returns:
+            Tuple of (raw response text, token usage if reported).
+
+        Raises:
+            LlmRequestError: If the request fails after retries.
+        """
+        response_data = self._with_retries(
+            lambda: self._call_ollama(prompt, system_prompt)
+        )
+        return cast(str, response_data.get("response", "")), self._token_usage(
+            response_data
         )
 
     def _check_availability(self) -> bool:
@@ -111,10 +230,8 @@ def _check_availability(self) -> bool:
             True if available.
         """
         try:
-            import httpx
-
             url = f"{self.config.ollama_host}/api/tags"
-            response = httpx.get(url, timeout=5.0)
+            response = self._get_client().get(url, timeout=5.0)
             return response.status_code == 200
         except Exception:
             return False
@@ -135,13 +252,11 @@ def get_max_context_tokens(self) -> int:
         Returns:
             Max input tokens.
         """
-        import httpx
-
         model = self.config.model or "llama3.2"
         # Try to show model info
         url = f"{self.config.ollama_host}/api/show"
         try:
-            response = httpx.post(
+            response = self._get_client().post(
                 url,
                 json={"name": model},
                 timeout=2.0,  # Quick timeout for metadata
@@ -187,8 +302,6 @@ def _call_ollama(self, prompt: str, system_prompt: str) -> dict[str, Any]:
         Returns:
             Full response dictionary.
         """
-        import httpx
-
         url = f"{self.config.ollama_host}/api/generate"
         payload = {
             "model": self.config.model or "llama3.2",
@@ -201,7 +314,7 @@ def _call_ollama(self, prompt: str, system_prompt: str) -> dict[str, Any]:
             },
         }
 
-        response = httpx.post(
+        response = self._get_client().post(
             url,
             json=payload,
             timeout=self.config.llm_timeout_seconds,
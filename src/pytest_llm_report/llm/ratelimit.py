@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: MIT
+"""Request rate limiting for LLM providers.
+
+Component Contract:
+    Input: requests-per-minute budget
+    Output: blocking acquire() that spaces requests
+    Dependencies: none
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every request of a run.
+
+    Each request consumes one token; tokens refill continuously at the
+    configured rate up to ``burst``. Callers that find the bucket empty
+    reserve the next free slot and sleep until it arrives, so concurrent
+    workers never exceed the rate between them.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = 1) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate_per_minute: Sustained requests allowed per minute.
+            burst: Requests that may start back-to-back when the bucket is full.
+        """
+        self._interval = 60.0 / rate_per_minute
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated: float | None = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller may start its request."""
+        with self._lock:
+            now = time.monotonic()
+            if self._updated is not None:
+                refill = (now - self._updated) / self._interval
+                self._tokens = min(self._burst, self._tokens + refill)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens * self._interval if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
@@ -38,6 +38,12 @@ def extract_json_from_response(response: str) -> str | None:
     if not response:
         return None
 
+    # Fast path: JSON-mode responses are usually a bare object, so skip the
+    # fence regex entirely when there is nothing around it
+    stripped = response.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        return stripped
+
     # Try to find JSON inside code fences first
     match = _CODE_FENCE_PATTERN.search(response)
     if match:
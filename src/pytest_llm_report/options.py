@@ -18,7 +18,36 @@
     import pytest
 
 
-@dataclass
+# Fields restricted to a fixed set of values: (field, allowed values)
+_CHOICE_CHECKS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("provider", ("none", "ollama", "litellm", "gemini")),
+    ("llm_context_mode", ("minimal", "balanced", "complete")),
+    ("aggregate_policy", ("latest", "merge", "all")),
+    ("include_phase", ("run", "setup", "teardown", "all")),
+    ("litellm_token_output_format", ("text", "json")),
+    ("prompt_tier", ("minimal", "standard", "auto")),
+    ("context_compression", ("none", "lines")),
+)
+
+# Numeric fields with a lower bound: (field, minimum, error message)
+_RANGE_CHECKS: tuple[tuple[str, int, str], ...] = (
+    (
+        "litellm_token_refresh_interval",
+        60,
+        "litellm_token_refresh_interval must be at least 60 seconds",
+    ),
+    ("llm_context_bytes", 1000, "llm_context_bytes must be at least 1000"),
+    ("llm_max_tests", 0, "llm_max_tests must be 0 (no limit) or positive"),
+    ("llm_requests_per_minute", 1, "llm_requests_per_minute must be at least 1"),
+    ("llm_timeout_seconds", 1, "llm_timeout_seconds must be at least 1"),
+    ("llm_max_retries", 0, "llm_max_retries must be 0 or positive"),
+    ("batch_max_tests", 1, "batch_max_tests must be at least 1"),
+    ("llm_batch_size", 1, "llm_batch_size must be at least 1"),
+    ("context_line_padding", 0, "context_line_padding must be 0 or positive"),
+)
+
+
+@dataclass(slots=True)
 class Config:
     """Configuration for pytest-llm-report.
 
@@ -64,6 +93,7 @@ class Config:
         llm_timeout_seconds: Timeout for LLM requests.
         llm_max_retries: Maximum retries for LLM requests.
         llm_cache_ttl_seconds: Cache TTL in seconds.
+        llm_batch_size: Distinct tests sent per LLM request (1 = no batching).
         cache_dir: Directory for LLM cache.
 
         # Coverage settings
@@ -151,6 +181,7 @@ class Config:
     # Token optimization settings
     batch_parametrized_tests: bool = True
     batch_max_tests: int = 5
+    llm_batch_size: int = 1  # 1 = one test per request
     context_compression: str = "lines"  # "none", "lines"
     context_line_padding: int = 2
 
@@ -196,83 +227,16 @@ def validate(self) -> list[str]:
         Returns:
             List of validation error messages (empty if valid).
         """
-        errors = []
-
-        # Validate provider
-        valid_providers = ("none", "ollama", "litellm", "gemini")
-        if self.provider not in valid_providers:
-            errors.append(
-                f"Invalid provider '{self.provider}'. Must be one of: {valid_providers}"
-            )
-
-        # Validate context mode
-        valid_modes = ("minimal", "balanced", "complete")
-        if self.llm_context_mode not in valid_modes:
-            errors.append(
-                f"Invalid llm_context_mode '{self.llm_context_mode}'. "
-                f"Must be one of: {valid_modes}"
-            )
-
-        # Validate aggregation policy
-        valid_policies = ("latest", "merge", "all")
-        if self.aggregate_policy not in valid_policies:
-            errors.append(
-                f"Invalid aggregate_policy '{self.aggregate_policy}'. "
-                f"Must be one of: {valid_policies}"
-            )
-
-        # Validate include_phase
-        valid_phases = ("run", "setup", "teardown", "all")
-        if self.include_phase not in valid_phases:
-            errors.append(
-                f"Invalid include_phase '{self.include_phase}'. "
-                f"Must be one of: {valid_phases}"
-            )
-
-        # Validate LiteLLM token output format
-        valid_output_formats = ("text", "json")
-        if self.litellm_token_output_format not in valid_output_formats:
-            errors.append(
-                f"Invalid litellm_token_output_format '{self.litellm_token_output_format}'. "
-                f"Must be one of: {valid_output_formats}"
-            )
-
-        # Validate token refresh interval
-        if self.litellm_token_refresh_interval < 60:
-            errors.append("litellm_token_refresh_interval must be at least 60 seconds")
-
-        # Validate numeric ranges
-        if self.llm_context_bytes < 1000:
-            errors.append("llm_context_bytes must be at least 1000")
-        if self.llm_max_tests < 0:
-            errors.append("llm_max_tests must be 0 (no limit) or positive")
-        if self.llm_requests_per_minute < 1:
-            errors.append("llm_requests_per_minute must be at least 1")
-        if self.llm_timeout_seconds < 1:
-            errors.append("llm_timeout_seconds must be at least 1")
-        if self.llm_max_retries < 0:
-            errors.append("llm_max_retries must be 0 or positive")
-
-        # Validate prompt_tier
-        valid_tiers = ("minimal", "standard", "auto")
-        if self.prompt_tier not in valid_tiers:
-            errors.append(
-                f"Invalid prompt_tier '{self.prompt_tier}'. "
-                f"Must be one of: {valid_tiers}"
-            )
-
-        # Validate token optimization settings
-        valid_compression = ("none", "lines")
-        if self.context_compression not in valid_compression:
-            errors.append(
-                f"Invalid context_compression '{self.context_compression}'. "
-                f"Must be one of: {valid_compression}"
-            )
-        if self.batch_max_tests < 1:
-            errors.append("batch_max_tests must be at least 1")
-        if self.context_line_padding < 0:
-            errors.append("context_line_padding must be 0 or positive")
-
+        errors = [
+            f"Invalid {name} '{value}'. Must be one of: {allowed}"
+            for name, allowed in _CHOICE_CHECKS
+            if (value := getattr(self, name)) not in allowed
+        ]
+        errors.extend(
+            message
+            for name, minimum, message in _RANGE_CHECKS
+            if getattr(self, name) < minimum
+        )
         return errors
 
     def is_llm_enabled(self) -> bool:
@@ -399,6 +363,8 @@ def load_config(config: "pytest.Config") -> Config:
                     ]
                 if "batch_max_tests" in tool_config:
                     cfg.batch_max_tests = tool_config["batch_max_tests"]
+                if "batch_size" in tool_config:
+                    cfg.llm_batch_size = tool_config["batch_size"]
                 if "context_compression" in tool_config:
                     cfg.context_compression = tool_config["context_compression"]
                 if "context_line_padding" in tool_config:
@@ -316,6 +316,18 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
 
 
+def _is_worker(config: pytest.Config) -> bool:
+    """Check whether this process is an xdist worker.
+
+    Args:
+        config: pytest configuration object.
+
+    Returns:
+        True when running inside an xdist worker.
+    """
+    return hasattr(config, "workerinput")
+
+
 def pytest_configure(config: pytest.Config) -> None:
     """Configure the plugin.
 
@@ -338,17 +350,15 @@ def pytest_configure(config: pytest.Config) -> None:
         "requirement(*ids): Associate test with requirement IDs",
     )
 
-    # Check if we're a worker on xdist - if so, don't set up report generation
-    if hasattr(config, "workerinput"):
+    # xdist workers never write reports, so skip loading configuration
+    # entirely; every later hook sees the plugin as disabled
+    if _is_worker(config):
         return
 
     # Load configuration
-    cfg = Config.load(config) if hasattr(Config, "load") else None
-    if not cfg:
-        # Fallback if I messed up the import in my thought process, but better to import explicitly
-        from pytest_llm_report.options import load_config
+    from pytest_llm_report.options import load_config
 
-        cfg = load_config(config)
+    cfg = load_config(config)
 
     # Validate configuration
     errors = cfg.validate()
@@ -396,7 +406,7 @@ def pytest_terminal_summary(
         config: pytest configuration.
     """
     # Skip report generation on workers (xdist)
-    if hasattr(config, "workerinput"):
+    if _is_worker(config):
         return
 
     # Skip if report not enabled
@@ -13,14 +13,69 @@
 from __future__ import annotations
 
 import fnmatch
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from pytest_llm_report.models import TestCaseResult
+    from collections.abc import Iterable, Iterator
+
+    from pytest_llm_report.models import CoverageEntry, TestCaseResult
     from pytest_llm_report.options import Config
 
 
+_GLOB_CHARS = frozenset("*?[")
+
+# Function definitions, for indexing where each test starts
+_DEF_RE = re.compile(r"def (\w+)\(")
+
+# Threads used to read covered files ahead of assembly
+_PREFETCH_WORKERS = 8
+
+# Complete mode uses very large limits, relying on the provider's context
+# limit enforcement to handle the final truncation safely.
+_COMPLETE_MAX_BYTES = 10_000_000  # ~10MB should be enough for any model
+_COMPLETE_MAX_FILES = 100
+
+
+@cache
+def _compile_excludes(
+    globs: tuple[str, ...],
+) -> tuple[frozenset[str], tuple[str, ...], re.Pattern[str] | None]:
+    """Split exclude globs by the cheapest check that matches them.
+
+    Globs without wildcards only match that exact path and ``prefix*``
+    globs match anything starting with the prefix (``*`` also crosses
+    ``/`` in fnmatch), so both are answered by set and ``startswith``
+    lookups. The remaining globs are joined into one compiled regex.
+    Results are memoized, so assemblers built from the same globs share them.
+
+    Args:
+        globs: fnmatch-style exclude patterns.
+
+    Returns:
+        Tuple of (exact paths, path prefixes, regex or None).
+    """
+    names: set[str] = set()
+    prefixes: list[str] = []
+    wildcards: list[str] = []
+    for glob in globs:
+        glob = os.path.normcase(glob)
+        head = glob[:-1] if glob.endswith("*") else None
+        if not _GLOB_CHARS.intersection(glob):
+            names.add(glob)
+        elif head is not None and not _GLOB_CHARS.intersection(head):
+            prefixes.append(head)
+        else:
+            wildcards.append(fnmatch.translate(glob))
+    regex = re.compile("|".join(wildcards)) if wildcards else None
+    return frozenset(names), tuple(prefixes), regex
+
+
 class ContextAssembler:
     """Assembles context for LLM prompts."""
 
@@ -31,6 +86,64 @@ def __init__(self, config: Config) -> None:
             config: Plugin configuration.
         """
         self.config = config
+        self._exclude_names, self._exclude_prefixes, self._exclude_re = (
+            _compile_excludes(tuple(config.llm_context_exclude_globs))
+        )
+        # Test modules hold many tests; keep each file's lines and the line
+        # each function definition starts on, per mtime.
+        self._source_lines: dict[Path, tuple[int, list[str], dict[str, int]]] = {}
+        # Covered files repeat across tests; keep each one's prepared text,
+        # keyed by joined path string so lookups need no Path objects.
+        self._context_sources: dict[
+            tuple[str, int | None], tuple[str, list[str]] | None
+        ] = {}
+        # Entries loaded by prefetch() that assembly has not used yet.
+        self._prefetched: set[tuple[str, int | None]] = set()
+
+    def prefetch(
+        self, tests: Iterable[TestCaseResult], repo_root: Path | None = None
+    ) -> None:
+        """Load the context files of ``tests`` concurrently.
+
+        Context assembly runs test by test, so each covered file would
+        otherwise be read serially on first use. Loading them up front on a
+        small thread pool overlaps the I/O. Only the reads assembly will
+        make are done: files within each test's file limit, bounded by its
+        byte budget. Files that fail to read are left for assembly to handle.
+
+        Args:
+            tests: Tests that will be assembled.
+            repo_root: Repository root path.
+        """
+        root = os.fspath(repo_root or self.config.repo_root or Path.cwd())
+        keys: set[tuple[str, int | None]] = set()
+        for test in tests:
+            mode = test.llm_context_override or self.config.llm_context_mode
+            keys.update(
+                (path, max_chars)
+                for _, path, _, max_chars in self._context_reads(
+                    test, root, *self._context_limits(mode)
+                )
+            )
+        keys.difference_update(self._context_sources)
+        if not keys:
+            return
+
+        workers = min(_PREFETCH_WORKERS, len(keys))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(lambda key: self._load_context_source(*key), keys):
+                pass
+        self._prefetched.update(keys)
+
+    def release_prefetched(self) -> None:
+        """Drop prefetched files that assembly did not use.
+
+        A test's context stops growing once its byte budget is spent, so
+        some prefetched files may never be needed.
+        """
+        for key in self._prefetched:
+            self._context_sources.pop(key, None)
+        self._prefetched.clear()
 
     def assemble(
         self,
@@ -79,28 +192,21 @@ def _get_test_source(self, nodeid: str, repo_root: Path) -> str:
         if not parts:
             return ""
 
-        file_path = repo_root / parts[0]
-        if not file_path.exists():
+        source = self._read_source(repo_root / parts[0])
+        if source is None:
             return ""
+        lines, def_index = source
 
-        try:
-            source = file_path.read_text()
-        except Exception:
-            return ""
-
-        # Find the test function
-        test_name = parts[-1]
-        # Remove any [param] suffix
-        if "[" in test_name:
-            test_name = test_name.split("[")[0]
+        # Find the test function, without any [param] suffix
+        test_name = parts[-1].partition("[")[0]
 
-        # Simple extraction: find def test_name
-        lines = source.split("\n")
+        # Simple extraction: find def test_name, starting from its indexed
+        # line (names the index cannot hold are scanned for from the top)
         in_func = False
         func_lines = []
         indent = 0
 
-        for line in lines:
+        for line in islice(lines, def_index.get(test_name, 0), None):
             if f"def {test_name}(" in line:
                 in_func = True
                 indent = len(line) - len(line.lstrip())
@@ -115,6 +221,32 @@ def _get_test_source(self, nodeid: str, repo_root: Path) -> str:
 
         return "\n".join(func_lines)
 
+    def _read_source(self, file_path: Path) -> tuple[list[str], dict[str, int]] | None:
+        """Read a source file as lines, reusing earlier reads of it.
+
+        Args:
+            file_path: File to read.
+
+        Returns:
+            Tuple of (lines, first line index of each ``def name(``), or
+            None if the file cannot be read.
+        """
+        try:
+            mtime = file_path.stat().st_mtime_ns
+            cached = self._source_lines.get(file_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1], cached[2]
+            lines = file_path.read_text().split("\n")
+        except Exception:
+            return None
+        def_index: dict[str, int] = {}
+        for i, line in enumerate(lines):
+            if "def " in line:
+                for match in _DEF_RE.finditer(line):
+                    def_index.setdefault(match[1], i)
+        self._source_lines[file_path] = (mtime, lines, def_index)
+        return lines, def_index
+
     def _get_balanced_context(
         self,
         test: TestCaseResult,
@@ -141,49 +273,28 @@ def _get_balanced_context(
 
         context = {}
         total_bytes = 0
-        current_max_bytes = (
-            max_bytes if max_bytes is not None else self.config.llm_context_bytes
-        )
-        current_max_files = (
-            max_files if max_files is not None else self.config.llm_context_file_limit
-        )
+        default_bytes, default_files = self._context_limits("balanced")
+        current_max_bytes = max_bytes if max_bytes is not None else default_bytes
+        current_max_files = max_files if max_files is not None else default_files
 
-        # Check for compression mode
-        compression_mode = getattr(self.config, "context_compression", "none")
         line_padding = getattr(self.config, "context_line_padding", 2)
+        root = os.fspath(repo_root)
 
-        for entry in test.coverage[:current_max_files]:
+        for entry, path, covered_lines, max_chars in self._context_reads(
+            test, root, current_max_bytes, current_max_files
+        ):
             if total_bytes >= current_max_bytes:
                 break
 
-            file_path = repo_root / entry.file_path
-            if not file_path.exists():
-                continue
-
-            if self._should_exclude(entry.file_path):
+            source = self._load_context_source(path, max_chars)
+            if source is None:
                 continue
+            full_content, lines = source
 
             try:
-                full_content = file_path.read_text()
-
-                # Apply docstring stripping if enabled
-                if getattr(self.config, "llm_strip_docstrings", True):
-                    from pytest_llm_report.context_util import optimize_context
-
-                    full_content = optimize_context(
-                        full_content, strip_docs=True, strip_comms=False
-                    )
-
-                lines = full_content.split("\n")
-
-                # Apply compression if enabled and we have line range info
-                if (
-                    compression_mode == "lines"
-                    and hasattr(entry, "lines")
-                    and entry.lines
-                ):
+                if covered_lines:
                     content = self._extract_covered_lines(
-                        lines, entry.lines, line_padding
+                        lines, covered_lines, line_padding
                     )
                 else:
                     content = full_content
@@ -200,6 +311,103 @@ def _get_balanced_context(
 
         return context
 
+    def _context_limits(self, mode: str) -> tuple[int, int]:
+        """Return the context limits for a context mode.
+
+        Assembly and prefetch both read their limits from here, so prefetch
+        loads exactly the files assembly will ask for.
+
+        Args:
+            mode: Context mode ("minimal", "balanced" or "complete").
+
+        Returns:
+            Tuple of (max bytes, max files).
+        """
+        if mode == "minimal":
+            return 0, 0
+        if mode == "balanced":
+            return self.config.llm_context_bytes, self.config.llm_context_file_limit
+        return _COMPLETE_MAX_BYTES, _COMPLETE_MAX_FILES
+
+    def _context_reads(
+        self, test: TestCaseResult, root: str, max_bytes: int, max_files: int
+    ) -> Iterator[tuple[CoverageEntry, str, list[int], int | None]]:
+        """Yield the covered files context assembly reads for a test.
+
+        Args:
+            test: Test result.
+            root: Repository root path.
+            max_bytes: Context byte budget.
+            max_files: Maximum coverage entries to consider.
+
+        Yields:
+            Tuple of (entry, file path, covered lines to extract or empty
+            when not compressing, characters to read or None for the
+            whole file).
+        """
+        compression_mode = getattr(self.config, "context_compression", "none")
+        strip_docs = getattr(self.config, "llm_strip_docstrings", True)
+
+        # islice rejects negative limits; keep list-slice semantics for them
+        entries = (
+            islice(test.coverage, max_files)
+            if max_files >= 0
+            else test.coverage[:max_files]
+        )
+        for entry in entries:
+            if self._should_exclude(entry.file_path):
+                continue
+
+            # Apply compression if enabled and we have line range info
+            covered_lines: list[int] = []
+            if compression_mode == "lines":
+                covered_lines = getattr(entry, "lines", None) or []
+            # Stripping and line extraction need the whole file; otherwise
+            # reading one character past the budget is enough to truncate.
+            max_chars = None if strip_docs or covered_lines else max_bytes + 1
+            yield entry, os.path.join(root, entry.file_path), covered_lines, max_chars
+
+    def _load_context_source(
+        self, path: str, max_chars: int | None = None
+    ) -> tuple[str, list[str]] | None:
+        """Read a covered file for context, once per assembler.
+
+        Args:
+            path: Covered file to read.
+            max_chars: Read at most this many characters (whole file if None).
+
+        Returns:
+            Tuple of (content, lines) with docstrings stripped if enabled,
+            or None if the file is missing or unreadable.
+        """
+        key = (path, max_chars)
+        if key in self._context_sources:
+            self._prefetched.discard(key)
+            return self._context_sources[key]
+
+        source = None
+        file_path = Path(path)
+        try:
+            if max_chars is None:
+                full_content = file_path.read_text()
+            else:
+                with file_path.open() as f:
+                    full_content = f.read(max_chars)
+
+            # Apply docstring stripping if enabled
+            if getattr(self.config, "llm_strip_docstrings", True):
+                from pytest_llm_report.context_util import optimize_context
+
+                full_content = optimize_context(
+                    full_content, strip_docs=True, strip_comms=False
+                )
+
+            source = (full_content, full_content.split("\n"))
+        except Exception:
+            pass
+        self._context_sources[key] = source
+        return source
+
     def _extract_covered_lines(
         self, lines: list[str], covered_lines: set[int] | list[int], padding: int = 2
     ) -> str:
@@ -265,11 +473,9 @@ def _get_complete_context(
         # Complete mode: Use very large limits, relying on the provider
         # (and our new context limit enforcement) to handle the final truncation safely.
         # This ensures we don't artificially limit context in the collection phase.
+        max_bytes, max_files = self._context_limits("complete")
         return self._get_balanced_context(
-            test,
-            repo_root,
-            max_bytes=10_000_000,  # ~10MB should be enough for any model
-            max_files=100,
+            test, repo_root, max_bytes=max_bytes, max_files=max_files
         )
 
     def _should_exclude(self, path: str) -> bool:
@@ -281,7 +487,7 @@ def _should_exclude(self, path: str) -> bool:
         Returns:
             True if path should be excluded.
         """
-        for pattern in self.config.llm_context_exclude_globs:
-            if fnmatch.fnmatch(path, pattern):
-                return True
-        return False
+        path = os.path.normcase(path)
+        if path in self._exclude_names or path.startswith(self._exclude_prefixes):
+            return True
+        return self._exclude_re is not None and self._exclude_re.match(path) is not None
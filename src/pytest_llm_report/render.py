@@ -12,14 +12,29 @@
 
 from __future__ import annotations
 
+from functools import cache
 from importlib.resources import files
 from typing import TYPE_CHECKING
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pytest_llm_report.models import ReportRoot
 
+# Characters of rendered HTML gathered before each streamed chunk
+_STREAM_CHUNK_CHARS = 1 << 16
+
+_OUTCOME_CSS_CLASSES = {
+    "passed": "outcome-passed",
+    "failed": "outcome-failed",
+    "skipped": "outcome-skipped",
+    "xfailed": "outcome-xfailed",
+    "xpassed": "outcome-xpassed",
+    "error": "outcome-error",
+}
+
 
 def get_template_dir() -> str:
     """Get the path to the templates directory.
@@ -53,6 +68,19 @@ def create_jinja_env() -> Environment:
     return env
 
 
+@cache
+def _shared_jinja_env() -> Environment:
+    """Return the process-wide Jinja2 environment.
+
+    Reusing one environment keeps compiled templates in its cache, so the
+    HTML and PDF outputs of a run compile each template only once.
+
+    Returns:
+        Configured Jinja2 environment.
+    """
+    return create_jinja_env()
+
+
 def format_duration(seconds: float) -> str:
     """Format duration in human-readable form.
 
@@ -76,15 +104,7 @@ def outcome_to_css_class(outcome: str) -> str:
     Returns:
         CSS class name.
     """
-    mapping = {
-        "passed": "outcome-passed",
-        "failed": "outcome-failed",
-        "skipped": "outcome-skipped",
-        "xfailed": "outcome-xfailed",
-        "xpassed": "outcome-xpassed",
-        "error": "outcome-error",
-    }
-    return mapping.get(outcome, "outcome-unknown")
+    return _OUTCOME_CSS_CLASSES.get(outcome, "outcome-unknown")
 
 
 def render_html(report: ReportRoot) -> str:
@@ -96,15 +116,42 @@ def render_html(report: ReportRoot) -> str:
     Returns:
         Rendered HTML string.
     """
-    env = create_jinja_env()
+    return "".join(iter_html(report))
+
+
+def iter_html(report: ReportRoot) -> Iterator[str]:
+    """Render the HTML report in chunks.
+
+    Jinja emits many small fragments; they are gathered into chunks of
+    roughly ``_STREAM_CHUNK_CHARS`` so callers can write the report without
+    holding the whole document in memory.
+
+    Args:
+        report: Report data to render.
+
+    Yields:
+        Consecutive pieces of the rendered HTML.
+    """
+    env = _shared_jinja_env()
 
     try:
         template = env.get_template("report.html.j2")
     except Exception:
         # Fallback to inline template if file not found
-        return render_fallback_html(report)
-
-    return template.render(report=report)
+        yield render_fallback_html(report)
+        return
+
+    buffer: list[str] = []
+    size = 0
+    for fragment in template.generate(report=report):
+        buffer.append(fragment)
+        size += len(fragment)
+        if size >= _STREAM_CHUNK_CHARS:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer)
 
 
 def render_fallback_html(report: ReportRoot) -> str:
@@ -128,29 +175,29 @@ def render_fallback_html(report: ReportRoot) -> str:
             files = [f"{c.file_path} ({c.line_count} lines)" for c in test.coverage]
             coverage_html = f'<div class="coverage">{", ".join(files)}</div>'
 
-        annotation_html = ""
+        annotation_parts: list[str] = []
         if test.llm_annotation:
             a = test.llm_annotation
-            annotation_html = f"""
+            annotation_parts.append(f"""
             <div class="llm-annotation">
                 <strong>Scenario:</strong> {a.scenario}<br>
                 <strong>Why needed:</strong> {a.why_needed}
             </div>
-            """
+            """)
             if a.confidence is not None:
                 confidence_pct = int(round(a.confidence * 100))
-                annotation_html += f"""
+                annotation_parts.append(f"""
                 <div class="confidence-score" style="font-size: 0.85em; color: #666; margin-top: 5px;">
                     <strong>Confidence:</strong> {confidence_pct}%
                 </div>
-                """
+                """)
             if a.token_usage:
                 tu = a.token_usage
-                annotation_html += f"""
+                annotation_parts.append(f"""
                 <div class="token-usage" style="font-size: 0.85em; color: #666; margin-top: 5px; border-top: 1px dashed #ccc; padding-top: 5px;">
                     <strong>Tokens:</strong> {tu.prompt_tokens} input + {tu.completion_tokens} output = {tu.total_tokens} total
                 </div>
-                """
+                """)
 
         error_html = ""
         if test.error_message:
@@ -164,7 +211,7 @@ def render_fallback_html(report: ReportRoot) -> str:
             <span class="duration">{duration}</span>
             {error_html}
             {coverage_html}
-            {annotation_html}
+            {"".join(annotation_parts)}
         </div>
         """
         )
@@ -207,21 +254,21 @@ def render_fallback_html(report: ReportRoot) -> str:
         </tbody>
     </table>
 """
-    llm_meta_html = ""
+    llm_meta_parts: list[str] = []
     if report.run_meta.llm_annotations_enabled:
-        llm_meta_html = f"""
+        llm_meta_parts.append(f"""
         <div class="meta">
             <strong>LLM:</strong> {report.run_meta.llm_provider} / {report.run_meta.llm_model}
             ({report.run_meta.llm_context_mode} context, {report.run_meta.llm_annotations_count} annotated)
-        """
+        """)
         if report.run_meta.llm_total_tokens:
-            llm_meta_html += f"""
+            llm_meta_parts.append(f"""
             <br><strong>Token Usage:</strong> {report.run_meta.llm_total_input_tokens} input,
             {report.run_meta.llm_total_output_tokens} output (Total: {report.run_meta.llm_total_tokens})
-            """
-        llm_meta_html += "</div>"
+            """)
+        llm_meta_parts.append("</div>")
 
-    fallback_html = f"""<!DOCTYPE html>
+    header_html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -264,9 +311,8 @@ def render_fallback_html(report: ReportRoot) -> str:
         {"[dirty]" if report.run_meta.repo_git_dirty else ""}
     </div>
     """
-    fallback_html += llm_meta_html
 
-    fallback_html += f"""
+    body_html = f"""
     <div class="summary">
         <div class="summary-item"><div class="count">{summary.total}</div>Total</div>
         <div class="summary-item" style="color:#22c55e"><div class="count">{summary.passed}</div>Passed</div>
@@ -282,4 +328,4 @@ def render_fallback_html(report: ReportRoot) -> str:
 </body>
 </html>
 """
-    return fallback_html
+    return "".join([header_html, *llm_meta_parts, body_html])
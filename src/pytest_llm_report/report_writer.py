@@ -20,9 +20,10 @@
 import subprocess
 import sys
 import tempfile
+from collections import Counter
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from pytest_llm_report.__about__ import __version__
 from pytest_llm_report.errors import WARNING_MESSAGES, WarningCode
@@ -35,8 +36,11 @@
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from pytest_llm_report.models import (
         CollectionError,
+        CoverageEntry,
         SourceCoverageEntry,
         TestCaseResult,
     )
@@ -55,6 +59,21 @@ def compute_sha256(content: bytes) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
+def _dumps_json(data: Any) -> bytes:
+    """Serialize report data as UTF-8 JSON with two-space indent and sorted keys.
+
+    Always uses the stdlib encoder so the report bytes, and the hash embedded
+    in them, do not depend on which optional packages are installed.
+
+    Args:
+        data: JSON-compatible data.
+
+    Returns:
+        Encoded JSON.
+    """
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
 def get_git_info(path: str | Path = ".") -> tuple[str | None, bool | None]:
     """Get git commit SHA and dirty flag for a path.
 
@@ -64,27 +83,30 @@ def get_git_info(path: str | Path = ".") -> tuple[str | None, bool | None]:
     Returns:
         Tuple of (sha, dirty) or (None, None) if git is unavailable.
     """
+    # One porcelain v2 call reports both HEAD ("# branch.oid") and the
+    # changed entries, saving a second git process per report.
     try:
-        sha = subprocess.check_output(
-            ["git", "rev-parse", "HEAD"],
-            cwd=str(path),
-            stderr=subprocess.DEVNULL,
-            text=True,
-            timeout=5,
-        ).strip()
-
         status = subprocess.check_output(
-            ["git", "status", "--porcelain"],
+            ["git", "status", "--porcelain=v2", "--branch"],
             cwd=str(path),
             stderr=subprocess.DEVNULL,
             text=True,
             timeout=5,
         )
-        dirty = bool(status.strip())
-        return sha, dirty
     except Exception:
         return None, None
 
+    sha = None
+    dirty = False
+    for line in status.splitlines():
+        if line.startswith("# branch.oid "):
+            sha = line[len("# branch.oid ") :]
+        elif not line.startswith("#"):
+            dirty = True
+    if sha is None or sha == "(initial)":
+        return None, None
+    return sha, dirty
+
 
 def get_repo_version(root_path: Path) -> str | None:
     """Get version of the analyzed repository from pyproject.toml.
@@ -160,7 +182,7 @@ def __init__(self, config: Config) -> None:
     def write_report(
         self,
         tests: list[TestCaseResult],
-        coverage: dict[str, list] | None = None,
+        coverage: dict[str, list[CoverageEntry]] | None = None,
         coverage_percent: float | None = None,
         source_coverage: list[SourceCoverageEntry] | None = None,
         collection_errors: list[CollectionError] | None = None,
@@ -185,8 +207,7 @@ def write_report(
         # Merge coverage into tests
         if coverage:
             for test in tests:
-                if test.nodeid in coverage:
-                    test.coverage = coverage[test.nodeid]
+                test.coverage = coverage.get(test.nodeid, test.coverage)
 
         # Build run metadata
         run_meta = self._build_run_meta(
@@ -316,25 +337,17 @@ def _build_summary(self, tests: list[TestCaseResult]) -> Summary:
         Returns:
             Summary instance.
         """
-        summary = Summary(total=len(tests))
-
-        for test in tests:
-            summary.total_duration += test.duration
-
-            if test.outcome == "passed":
-                summary.passed += 1
-            elif test.outcome == "failed":
-                summary.failed += 1
-            elif test.outcome == "skipped":
-                summary.skipped += 1
-            elif test.outcome == "xfailed":
-                summary.xfailed += 1
-            elif test.outcome == "xpassed":
-                summary.xpassed += 1
-            elif test.outcome == "error":
-                summary.error += 1
-
-        return summary
+        counts = Counter(test.outcome for test in tests)
+        return Summary(
+            total=len(tests),
+            passed=counts["passed"],
+            failed=counts["failed"],
+            skipped=counts["skipped"],
+            xfailed=counts["xfailed"],
+            xpassed=counts["xpassed"],
+            error=counts["error"],
+            total_duration=sum((test.duration for test in tests), 0.0),
+        )
 
     def write_json(self, report: ReportRoot, path: str) -> None:
         """Write JSON report to file.
@@ -348,8 +361,7 @@ def write_json(self, report: ReportRoot, path: str) -> None:
 
         # Serialize to JSON
         report_dict = report.to_dict()
-        json_content = json.dumps(report_dict, indent=2, sort_keys=True)
-        json_bytes = json_content.encode("utf-8")
+        json_bytes = _dumps_json(report_dict)
 
         # Compute hash
         sha256 = compute_sha256(json_bytes)
@@ -357,8 +369,7 @@ def write_json(self, report: ReportRoot, path: str) -> None:
 
         # Re-serialize with hash included
         report_dict["sha256"] = sha256
-        json_content = json.dumps(report_dict, indent=2, sort_keys=True)
-        json_bytes = json_content.encode("utf-8")
+        json_bytes = _dumps_json(report_dict)
 
         # Write atomically
         self._atomic_write(path, json_bytes)
@@ -380,26 +391,22 @@ def write_html(self, report: ReportRoot, path: str) -> None:
             path: Output path.
         """
         # Import render lazily to avoid circular import
-        from pytest_llm_report.render import render_html
-
-        html_content = render_html(report)
-        html_bytes = html_content.encode("utf-8")
+        from pytest_llm_report.render import iter_html
 
         # Ensure directory exists
         self._ensure_dir(path)
 
-        # Compute hash
-        sha256 = compute_sha256(html_bytes)
-
-        # Write atomically
-        self._atomic_write(path, html_bytes)
+        # Stream the rendered page to disk, hashing as it is written
+        sha256, size = self._atomic_write_stream(
+            path, lambda: (chunk.encode("utf-8") for chunk in iter_html(report))
+        )
 
         # Track artifact
         self.artifacts.append(
             ArtifactEntry(
                 path=path,
                 sha256=sha256,
-                size_bytes=len(html_bytes),
+                size_bytes=size,
             )
         )
 
@@ -499,18 +506,46 @@ def _atomic_write(self, path: str, content: bytes) -> None:
             path: Target file path.
             content: Content to write.
         """
+        self._atomic_write_stream(path, lambda: (content,))
+
+    def _atomic_write_stream(
+        self, path: str, chunks: Callable[[], Iterable[bytes]]
+    ) -> tuple[str, int]:
+        """Write chunks atomically (temp file then rename).
+
+        Args:
+            path: Target file path.
+            chunks: Returns the chunks to write; called again if the atomic
+                write fails and the content is written directly instead.
+
+        Returns:
+            Tuple of (SHA256 hex digest, size in bytes) of the written content.
+        """
+
+        def write_to(f: BinaryIO) -> tuple[str, int]:
+            hasher = hashlib.sha256()
+            size = 0
+            for chunk in chunks():
+                hasher.update(chunk)
+                size += len(chunk)
+                f.write(chunk)
+            return hasher.hexdigest(), size
+
         dir_path = Path(path).parent
 
         try:
             # Write to temp file in same directory
             fd, temp_path = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
             try:
-                os.write(fd, content)
-            finally:
-                os.close(fd)
-
-            # Rename atomically
-            os.replace(temp_path, path)
+                with os.fdopen(fd, "wb") as f:
+                    written = write_to(f)
+
+                # Rename atomically
+                os.replace(temp_path, path)
+            except BaseException:
+                # Never leave the temp file behind, whatever failed
+                Path(temp_path).unlink(missing_ok=True)
+                raise
         except OSError:
             # Fall back to direct write
             self.warnings.append(
@@ -520,4 +555,5 @@ def _atomic_write(self, path: str, content: bytes) -> None:
                 )
             )
             with open(path, "wb") as f:
-                f.write(content)
+                written = write_to(f)
+        return written
@@ -41,11 +41,8 @@ def compute_file_sha256(path: Path | str) -> str:
     Returns:
         Hex digest string.
     """
-    hasher = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def compute_hmac(content: bytes, key: bytes) -> str:
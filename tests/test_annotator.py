@@ -73,6 +73,7 @@ def test_skips_if_provider_unavailable(
 
         captured = capsys.readouterr()
         assert "is not available" in captured.out
+        mock_provider.close.assert_called_once_with()
 
     def test_sequential_annotation(
         self, mock_provider: MagicMock, mock_cache: MagicMock, mock_assembler: MagicMock
@@ -92,6 +93,106 @@ def test_sequential_annotation(
         # Verify annotations were set on tests
         assert tests[0].llm_annotation is not None
         assert tests[1].llm_annotation is not None
+        mock_provider.close.assert_called_once_with()
+
+    def test_sequential_annotation_batches_distinct_tests(
+        self, mock_provider: MagicMock, mock_cache: MagicMock, mock_assembler: MagicMock
+    ):
+        """Should send up to llm_batch_size distinct tests per request."""
+        mock_provider.annotate_batch.side_effect = lambda tests, sources: [
+            LlmAnnotation(scenario=t.nodeid) for t in tests
+        ]
+        config = Config(provider="gemini", llm_batch_size=2)
+        tests = [TestCaseResult(nodeid=f"test_{i}", outcome="passed") for i in range(3)]
+
+        annotate_tests(tests, config)
+
+        assert mock_provider.annotate_batch.call_count == 1
+        assert mock_provider.annotate.call_count == 1
+        assert mock_cache.set.call_count == 3
+        assert [t.llm_annotation and t.llm_annotation.scenario for t in tests[:2]] == [
+            "test_0",
+            "test_1",
+        ]
+
+    def test_batch_fallback_is_rate_limited(
+        self,
+        mock_provider: MagicMock,
+        mock_cache: MagicMock,
+        mock_assembler: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Tests left out of a batched reply are re-requested with their prompt."""
+        mock_provider.annotate_batch.side_effect = lambda tests, sources: [
+            LlmAnnotation(scenario=tests[0].nodeid),
+            None,
+        ]
+        config = Config(provider="gemini", llm_batch_size=2, llm_requests_per_minute=60)
+        tests = [TestCaseResult(nodeid=f"test_{i}", outcome="passed") for i in range(2)]
+        sleep_calls: list[float] = []
+        monkeypatch.setattr(
+            "pytest_llm_report.llm.ratelimit.time.monotonic", lambda: 0.0
+        )
+        monkeypatch.setattr(
+            "pytest_llm_report.llm.ratelimit.time.sleep", sleep_calls.append
+        )
+
+        annotate_tests(tests, config)
+
+        assert mock_provider.annotate_batch.call_count == 1
+        args, kwargs = mock_provider.annotate.call_args
+        assert args[0] is tests[1]
+        assert "test_1" in kwargs["prompt_override"]
+        # One token for the batch and one for the fallback request
+        assert sleep_calls == [1.0]
+
+    def test_tests_with_context_are_not_batched(
+        self,
+        mock_provider: MagicMock,
+        mock_cache: MagicMock,
+        mock_assembler: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Tests with context files keep their own request."""
+        monkeypatch.setattr(
+            "pytest_llm_report.llm.ratelimit.time.sleep", lambda seconds: None
+        )
+        mock_assembler.assemble.return_value = (
+            "def test_foo(): pass",
+            {"src/app.py": "def app(): ..."},
+        )
+        mock_provider.get_max_context_tokens.return_value = 4096
+        config = Config(provider="gemini", llm_batch_size=2)
+        tests = [TestCaseResult(nodeid=f"test_{i}", outcome="passed") for i in range(2)]
+
+        annotate_tests(tests, config)
+
+        assert mock_provider.annotate_batch.call_count == 0
+        assert mock_provider.annotate.call_count == 2
+        assert all(
+            call.args[2] == {"src/app.py": "def app(): ..."}
+            for call in mock_provider.annotate.call_args_list
+        )
+
+    def test_providers_without_batching_annotate_individually(
+        self,
+        mock_provider: MagicMock,
+        mock_cache: MagicMock,
+        mock_assembler: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Batch size is ignored when the provider cannot batch requests."""
+        monkeypatch.setattr(
+            "pytest_llm_report.llm.ratelimit.time.sleep", lambda seconds: None
+        )
+        mock_provider.supports_batching.return_value = False
+        config = Config(provider="gemini", llm_batch_size=2)
+        tests = [TestCaseResult(nodeid=f"test_{i}", outcome="passed") for i in range(2)]
+
+        annotate_tests(tests, config)
+
+        assert mock_provider.annotate_batch.call_count == 0
+        assert mock_provider.annotate.call_count == 2
 
     def test_concurrent_annotation(
         self, mock_provider: MagicMock, mock_cache: MagicMock, mock_assembler: MagicMock
@@ -113,6 +214,27 @@ def test_concurrent_annotation(
         assert tests[1].llm_annotation is not None
         assert tests[2].llm_annotation is not None
 
+    def test_concurrent_annotation_fans_out_batches(
+        self, mock_provider: MagicMock, mock_cache: MagicMock, mock_assembler: MagicMock
+    ):
+        """Should run one worker per batched request, capped by concurrency."""
+        mock_provider.is_local.return_value = True
+        mock_provider.annotate_batch.side_effect = lambda tests, sources: [
+            LlmAnnotation(scenario=t.nodeid) for t in tests
+        ]
+        config = Config(provider="ollama", llm_max_concurrency=8, llm_batch_size=2)
+        tests = [TestCaseResult(nodeid=f"test_{i}", outcome="passed") for i in range(4)]
+        messages: list[str] = []
+
+        annotate_tests(tests, config, progress=messages.append)
+
+        assert mock_provider.annotate_batch.call_count == 2
+        assert mock_provider.annotate.call_count == 0
+        assert [t.llm_annotation and t.llm_annotation.scenario for t in tests] == [
+            t.nodeid for t in tests
+        ]
+        assert any("with 2 concurrent workers" in m for m in messages)
+
     def test_cached_tests_are_skipped(
         self, mock_provider: MagicMock, mock_cache: MagicMock, mock_assembler: MagicMock
     ):
@@ -225,10 +347,10 @@ def test_respects_rate_limit(
         times = iter([0.0, 0.0, 2.0])
 
         monkeypatch.setattr(
-            "pytest_llm_report.llm.annotator.time.monotonic", lambda: next(times)
+            "pytest_llm_report.llm.ratelimit.time.monotonic", lambda: next(times)
         )
         monkeypatch.setattr(
-            "pytest_llm_report.llm.annotator.time.sleep", sleep_calls.append
+            "pytest_llm_report.llm.ratelimit.time.sleep", sleep_calls.append
         )
 
         annotate_tests(tests, config)
@@ -236,6 +358,33 @@ def test_respects_rate_limit(
         assert mock_provider.annotate.call_count == 2
         assert sleep_calls == [2.0]
 
+    def test_concurrent_remote_requests_are_paced(
+        self,
+        mock_provider: MagicMock,
+        mock_cache: MagicMock,
+        mock_assembler: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Concurrent remote requests should start one rate-limit interval apart."""
+        mock_provider.supports_concurrency.return_value = True
+        config = Config(
+            provider="litellm", llm_max_concurrency=4, llm_requests_per_minute=60
+        )
+        tests = [TestCaseResult(nodeid=f"test_{i}", outcome="passed") for i in range(3)]
+        sleep_calls: list[float] = []
+
+        monkeypatch.setattr(
+            "pytest_llm_report.llm.ratelimit.time.monotonic", lambda: 0.0
+        )
+        monkeypatch.setattr(
+            "pytest_llm_report.llm.ratelimit.time.sleep", sleep_calls.append
+        )
+
+        annotate_tests(tests, config)
+
+        assert mock_provider.annotate.call_count == 3
+        assert sorted(sleep_calls) == [1.0, 2.0]
+
     def test_reports_progress_messages(
         self,
         mock_provider: MagicMock,
@@ -54,6 +54,19 @@ def test_set_and_get(self, tmp_path):
         assert result.scenario == "Tests login"
         assert result.confidence == 0.9
 
+    def test_entries_are_scoped_to_model(self, tmp_path):
+        """Should not serve annotations cached for a different model."""
+        cache_dir = str(tmp_path / "cache")
+        LlmCache(Config(cache_dir=cache_dir, provider="ollama", model="a")).set(
+            "test::foo", "abc123", LlmAnnotation(scenario="From model a")
+        )
+
+        other = LlmCache(Config(cache_dir=cache_dir, provider="ollama", model="b"))
+        same = LlmCache(Config(cache_dir=cache_dir, provider="ollama", model="a"))
+
+        assert other.get("test::foo", "abc123") is None
+        assert same.get("test::foo", "abc123").scenario == "From model a"
+
     def test_does_not_cache_errors(self, tmp_path):
         """Should not cache annotations with errors."""
         config = Config(cache_dir=str(tmp_path / "cache"))
@@ -151,6 +151,31 @@ def contexts_side_effect(path):
         # Should handle exception gracefully
         assert result == {}
 
+    def test_each_context_parsed_once(self, monkeypatch):
+        """Contexts repeated across lines and files are parsed once."""
+        config = Config(repo_root=Path("/project"))
+        mapper = CoverageMapper(config)
+        parsed = []
+        extract = mapper._extract_nodeid
+
+        def recording_extract(context):
+            parsed.append(context)
+            return extract(context)
+
+        monkeypatch.setattr(mapper, "_extract_nodeid", recording_extract)
+        mock_data = MagicMock()
+        mock_data.measured_files.return_value = ["/project/a.py", "/project/b.py"]
+        mock_data.contexts_by_lineno.return_value = {
+            1: ["t.py::test_x|run", "t.py::test_x|setup"],
+            2: ["t.py::test_x|run"],
+        }
+
+        result = mapper._extract_contexts(mock_data)
+
+        assert sorted(parsed) == ["t.py::test_x|run", "t.py::test_x|setup"]
+        assert [e.file_path for e in result["t.py::test_x"]] == ["a.py", "b.py"]
+        assert [e.line_ranges for e in result["t.py::test_x"]] == ["1-2", "1-2"]
+
 
 class TestMapSourceCoverage:
     """Tests for map_source_coverage edge cases."""
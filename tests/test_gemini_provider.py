@@ -131,8 +131,8 @@ def test_seconds_until_tpm_available_branches(self):
 
 
 class TestGeminiProvider:
-    @patch("httpx.post")
-    @patch("httpx.get")
+    @patch("httpx.Client.post")
+    @patch("httpx.Client.get")
     def test_annotate_success(self, mock_get, mock_post, mock_config):
         # Mock model list fetch
         mock_get.return_value.status_code = 200
@@ -190,8 +190,8 @@ def test_annotate_success(self, mock_get, mock_post, mock_config):
                         assert annotation.scenario == "Success Scenario"
                         assert not annotation.error
 
-    @patch("httpx.post")
-    @patch("httpx.get")
+    @patch("httpx.Client.post")
+    @patch("httpx.Client.get")
     def test_annotate_rate_limit_retry(self, mock_get, mock_post, mock_config):
         # Mock model list fetch
         mock_get.return_value.status_code = 200
@@ -293,7 +293,7 @@ def test_annotate_import_error(self):
 class TestGeminiProviderDetailed:
     """Detailed coverage tests for Gemini provider."""
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_fetch_available_models_error(self, mock_get):
         mock_get.side_effect = Exception("Network error")
         provider = GeminiProvider(Config(provider="gemini"))
@@ -301,7 +301,7 @@ def test_fetch_available_models_error(self, mock_get):
         assert models == []
         assert limit_map == {}
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_fetch_available_models_invalid_json(self, mock_get):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {
@@ -528,7 +528,7 @@ def test_coverage_gaps(self, mock_config):
             assert provider._models == ["fallback"]
 
         # 5. Input limits logic (Flash vs Pro)
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_get.return_value.status_code = 200
             # Case A: inputTokenLimit provided
             mock_get.return_value.json.return_value = {
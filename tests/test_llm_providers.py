@@ -5,7 +5,12 @@
 
 import json
 import os
-from types import SimpleNamespace
+import socket
+import sys
+import time
+from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -16,166 +21,319 @@
 from pytest_llm_report.models import TestCaseResult as CaseResult
 from pytest_llm_report.options import Config
 
+if TYPE_CHECKING:
+    import httpx
+
+
+@dataclass(frozen=True, slots=True)
+class _FakeMessage:
+    content: str
+
+
+@dataclass(frozen=True, slots=True)
+class _FakeChoice:
+    message: _FakeMessage
+
 
 class FakeLiteLLMResponse:
     """Fake LiteLLM response payload."""
 
+    __slots__ = ("choices",)
+
     def __init__(self, content: str) -> None:
-        self.choices = [SimpleNamespace(message=SimpleNamespace(content=content))]
+        self.choices = (_FakeChoice(_FakeMessage(content)),)
 
 
-class FakeGeminiResponse:
-    """Fake Gemini response payload."""
+class FakeHttpResponse:
+    """Fake httpx response for the Ollama tests."""
 
-    def __init__(
-        self, data: dict, status_code: int = 200, headers: dict | None = None
-    ) -> None:
-        self._data = data
+    def __init__(self, payload: dict | None = None, status_code: int = 200) -> None:
+        self._payload = payload or {}
         self.status_code = status_code
-        self.headers = headers or {}
 
     def raise_for_status(self) -> None:
         if self.status_code >= 400:
             raise RuntimeError(f"HTTP {self.status_code}")
 
     def json(self) -> dict:
-        return self._data
+        return self._payload
+
+
+def fake_httpx_module(**methods) -> SimpleNamespace:
+    """Build a stand-in ``httpx`` module whose ``Client`` exposes ``methods``."""
+    return SimpleNamespace(Client=lambda **_kwargs: SimpleNamespace(**methods))
+
+
+# Canonical annotation payload; built once and shared read-only by every test.
+_LOGIN_PAYLOAD = MappingProxyType(
+    {
+        "scenario": "Checks login",
+        "why_needed": "Stops regressions",
+        "key_assertions": ("status ok", "redirect"),
+    }
+)
+_LOGIN_RESPONSE_JSON = json.dumps(dict(_LOGIN_PAYLOAD))
+_OK_RESPONSE_JSON = json.dumps(
+    {"scenario": "Test", "why_needed": "Reason", "key_assertions": ["a"]}
+)
+_LITELLM_LOGIN = FakeLiteLLMResponse(_LOGIN_RESPONSE_JSON)
+_LITELLM_OK = FakeLiteLLMResponse(_OK_RESPONSE_JSON)
+_LITELLM_BAD_KEY_ASSERTIONS = FakeLiteLLMResponse(
+    json.dumps({"scenario": "", "why_needed": "", "key_assertions": "oops"})
+)
+_GEMINI_LOGIN_PAYLOAD = {
+    "candidates": [{"content": {"parts": [{"text": _LOGIN_RESPONSE_JSON}]}}]
+}
+
+
+_MODELS_PAYLOAD_PRO = {
+    "models": [
+        {
+            "name": "models/gemini-1.5-pro",
+            "supportedGenerationMethods": ["generateContent"],
+        }
+    ]
+}
+_MODELS_PAYLOAD_PRO_FLASH = {
+    "models": [
+        {
+            "name": "models/gemini-1.5-pro",
+            "supportedGenerationMethods": ["generateContent"],
+        },
+        {
+            "name": "models/gemini-1.5-flash",
+            "supportedGenerationMethods": ["generateContent"],
+        },
+    ]
+}
+_RPD_1 = {"rateLimits": [{"name": "requestsPerDay", "value": 1}]}
+_RPM_60 = {"rateLimits": [{"name": "requestsPerMinute", "value": 60}]}
+_TPM_1000 = {"rateLimits": [{"name": "tokensPerMinute", "value": 1000}]}
+
+
+class FakeGeminiApi:
+    """Fake Gemini REST API served through ``httpx.MockTransport``.
+
+    Each route replies with a JSON payload, an ``httpx.Response`` or raises
+    an exception instance. Queued ``generate_replies`` are served first, then
+    ``generate_payload`` for every further generateContent call.
+    """
+
+    def __init__(self) -> None:
+        self.models_payload: object = _MODELS_PAYLOAD_PRO
+        self.rate_limits_payload: object = {"rateLimits": []}
+        self.generate_payload: object = _GEMINI_LOGIN_PAYLOAD
+        self.generate_replies: list[object] = []
+        self.requests: list[httpx.Request] = []
+        # httpx is only needed by the Gemini tests; skip them if it is missing
+        self._httpx = pytest.importorskip("httpx")
+        self._response_cls: type[httpx.Response] = self._httpx.Response
+        self.transport = self._httpx.MockTransport(self._handle)
+
+    @property
+    def models_requests(self) -> list[httpx.Request]:
+        return [r for r in self.requests if r.url.path.endswith("/models")]
+
+    @property
+    def generate_requests(self) -> list[httpx.Request]:
+        return [r for r in self.requests if r.method == "POST"]
+
+    def response(self, status_code: int, **kwargs) -> httpx.Response:
+        """Build a raw reply for ``generate_replies``."""
+        return self._response_cls(status_code, **kwargs)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "POST":
+            if self.generate_replies:
+                reply = self.generate_replies.pop(0)
+            else:
+                reply = self.generate_payload
+        elif request.url.path.endswith("/models"):
+            reply = self.models_payload
+        else:
+            reply = self.rate_limits_payload
+
+        if isinstance(reply, Exception):
+            raise reply
+        if isinstance(reply, self._response_cls):
+            return reply
+        return self._response_cls(200, json=reply)
+
+
+def _raise_boom(**_kwargs):
+    raise RuntimeError("boom")
+
+
+class FakeClock:
+    """Deterministic stand-in for ``time.time`` and ``time.sleep``."""
+
+    def __init__(self, start: float = 1_000_000.0) -> None:
+        self.now = start
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
 
 
 class MockGenerationFailure(Exception):
     pass
 
 
-@pytest.fixture
-def mock_import_error(monkeypatch: pytest.MonkeyPatch):
-    """Return a factory that makes imports raise ImportError for a module."""
-    import builtins
+@pytest.fixture(autouse=True)
+def _block_network(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail fast if any provider test tries to reach a real host."""
+
+    def _refuse(*_args, **_kwargs):
+        raise RuntimeError("network access is disabled in provider tests")
+
+    monkeypatch.setattr(socket.socket, "connect", _refuse)
+    monkeypatch.setattr(socket, "create_connection", _refuse)
+    monkeypatch.setattr(socket, "getaddrinfo", _refuse)
+
 
-    real_import = builtins.__import__
+@pytest.fixture(scope="module")
+def login_case() -> CaseResult:
+    """Passing login test shared by every test in the module."""
+    return CaseResult(nodeid="tests/test_auth.py::test_login", outcome="passed")
 
-    def _factory(module_name: str) -> None:
-        def fake_import(name, *args, **kwargs):
-            if name == module_name:
-                raise ImportError(f"No module named {module_name}")
-            return real_import(name, *args, **kwargs)
 
-        monkeypatch.setattr(builtins, "__import__", fake_import)
+@pytest.fixture(scope="module")
+def sample_case() -> CaseResult:
+    """Generic passing test shared by every test in the module."""
+    return CaseResult(nodeid="tests/test_sample.py::test_case", outcome="passed")
 
-    return _factory
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Patch ``time.time``/``time.sleep`` so no test ever really sleeps."""
+    clock = FakeClock()
+    monkeypatch.setattr(time, "time", clock.time)
+    monkeypatch.setattr(time, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.fixture
+def gemini_httpx(monkeypatch: pytest.MonkeyPatch):
+    """Route the Gemini provider's HTTP client to a fake API."""
+    httpx = pytest.importorskip("httpx")
+    api = FakeGeminiApi()
+    client = httpx.Client(transport=api.transport)
+    monkeypatch.setattr(GeminiProvider, "_get_client", lambda self: client)
+    yield api
+    client.close()
 
 
 class TestLiteLLMProvider:
     """Tests for the LiteLLM provider."""
 
-    def test_annotate_success_with_mock_response(self, monkeypatch: pytest.MonkeyPatch):
+    def test_annotate_success_with_mock_response(
+        self, login_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """LiteLLM provider parses a valid response payload."""
         captured = {}
 
         def fake_completion(**kwargs):
             captured.update(kwargs)
-            response_data = {
-                "scenario": "Checks login",
-                "why_needed": "Stops regressions",
-                "key_assertions": ["status ok", "redirect"],
-            }
-            return FakeLiteLLMResponse(json.dumps(response_data))
+            return _LITELLM_LOGIN
 
         fake_litellm = SimpleNamespace(completion=fake_completion)
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(provider="litellm", model="gpt-4o")
         provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="tests/test_auth.py::test_login", outcome="passed")
-        annotation = provider.annotate(test, "def test_login(): assert True")
+        annotation = provider.annotate(login_case, "def test_login(): assert True")
 
         assert isinstance(annotation, LlmAnnotation)
-        assert annotation.scenario == "Checks login"
-        assert annotation.why_needed == "Stops regressions"
-        assert annotation.key_assertions == ["status ok", "redirect"]
+        assert annotation.scenario == _LOGIN_PAYLOAD["scenario"]
+        assert annotation.why_needed == _LOGIN_PAYLOAD["why_needed"]
+        assert annotation.key_assertions == list(_LOGIN_PAYLOAD["key_assertions"])
         assert annotation.confidence == 0.8
         assert captured["model"] == "gpt-4o"
         assert captured["messages"][0]["role"] == "system"
         assert "tests/test_auth.py::test_login" in captured["messages"][1]["content"]
         assert "def test_login()" in captured["messages"][1]["content"]
 
-    def test_annotate_invalid_key_assertions(self, monkeypatch: pytest.MonkeyPatch):
-        """LiteLLM provider rejects invalid key_assertions payloads."""
-        response_data = {
-            "scenario": "",
-            "why_needed": "",
-            "key_assertions": "oops",
-        }
-        fake_litellm = SimpleNamespace(
-            completion=lambda **_: FakeLiteLLMResponse(json.dumps(response_data))
-        )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
-
-        config = Config(provider="litellm")
-        provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="tests/test_sample.py::test_case", outcome="passed")
-        annotation = provider.annotate(test, "def test_case(): assert True")
-
-        assert annotation.error is not None
-        assert "Invalid response: key_assertions must be a list" in annotation.error
-
-    def test_annotate_handles_completion_error(self, monkeypatch: pytest.MonkeyPatch):
-        """LiteLLM provider surfaces completion errors in annotation."""
+    def test_litellm_module_is_cached(self, monkeypatch: pytest.MonkeyPatch):
+        """The litellm module is imported once and reused by the provider."""
+        fake_litellm = SimpleNamespace(completion=lambda **_: _LITELLM_LOGIN)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
+        provider = LiteLLMProvider(Config(provider="litellm"))
 
-        def fake_completion(**_):
-            raise RuntimeError("boom")
+        assert provider._get_litellm() is fake_litellm
+        monkeypatch.setitem(sys.modules, "litellm", None)
+        assert provider._get_litellm() is fake_litellm
+        assert provider._check_availability() is True
 
-        fake_litellm = SimpleNamespace(completion=fake_completion)
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+    @pytest.mark.parametrize(
+        ("fake_litellm", "expected_error"),
+        [
+            pytest.param(
+                SimpleNamespace(completion=lambda **_: _LITELLM_BAD_KEY_ASSERTIONS),
+                "Invalid response: key_assertions must be a list",
+                id="invalid-key-assertions",
+            ),
+            pytest.param(
+                SimpleNamespace(completion=_raise_boom),
+                "boom",
+                id="completion-error",
+            ),
+            pytest.param(
+                # A None entry in sys.modules makes `import litellm` raise ImportError
+                None,
+                "litellm not installed. Install with: pip install litellm",
+                id="missing-dependency",
+            ),
+        ],
+    )
+    def test_annotate_reports_error(
+        self,
+        fake_litellm: SimpleNamespace | None,
+        expected_error: str,
+        sample_case: CaseResult,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """LiteLLM provider surfaces bad payloads, call errors and missing deps."""
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(provider="litellm")
         provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="tests/test_sample.py::test_case", outcome="passed")
-        annotation = provider.annotate(test, "def test_case(): assert True")
+        annotation = provider.annotate(sample_case, "def test_case(): assert True")
 
         assert annotation.error is not None
-        assert "boom" in annotation.error
-
-    def test_annotate_missing_dependency(self, mock_import_error):
-        """LiteLLM provider reports missing dependency cleanly."""
-        mock_import_error("litellm")
-
-        config = Config(provider="litellm")
-        provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="tests/test_sample.py::test_case", outcome="passed")
-        annotation = provider.annotate(test, "def test_case(): assert True")
-
-        assert (
-            annotation.error
-            == "litellm not installed. Install with: pip install litellm"
-        )
+        assert expected_error in annotation.error
 
     def test_is_available_with_module(self, monkeypatch: pytest.MonkeyPatch):
         """LiteLLM provider detects installed module."""
         fake_litellm = SimpleNamespace()
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(provider="litellm")
         provider = LiteLLMProvider(config)
 
         assert provider.is_available() is True
 
-    def test_api_base_passthrough(self, monkeypatch: pytest.MonkeyPatch):
+    def test_api_base_passthrough(
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """LiteLLM provider passes api_base to completion call."""
         captured = {}
 
         def fake_completion(**kwargs):
             captured.update(kwargs)
-            response_data = {
-                "scenario": "Test",
-                "why_needed": "Reason",
-                "key_assertions": ["a"],
-            }
-            return FakeLiteLLMResponse(json.dumps(response_data))
+            return _LITELLM_OK
 
         fake_litellm = SimpleNamespace(
             completion=fake_completion, AuthenticationError=Exception
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(
             provider="litellm",
@@ -183,28 +341,24 @@ def fake_completion(**kwargs):
             litellm_api_base="https://proxy.corp.com/v1",
         )
         provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="tests/test.py::test_case", outcome="passed")
-        provider.annotate(test, "def test_case(): pass")
+        provider.annotate(sample_case, "def test_case(): pass")
 
         assert captured["api_base"] == "https://proxy.corp.com/v1"
 
-    def test_api_key_passthrough(self, monkeypatch: pytest.MonkeyPatch):
+    def test_api_key_passthrough(
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """LiteLLM provider passes static api_key to completion call."""
         captured = {}
 
         def fake_completion(**kwargs):
             captured.update(kwargs)
-            response_data = {
-                "scenario": "Test",
-                "why_needed": "Reason",
-                "key_assertions": ["a"],
-            }
-            return FakeLiteLLMResponse(json.dumps(response_data))
+            return _LITELLM_OK
 
         fake_litellm = SimpleNamespace(
             completion=fake_completion, AuthenticationError=Exception
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(
             provider="litellm",
@@ -212,12 +366,13 @@ def fake_completion(**kwargs):
             litellm_api_key=os.getenv("TEST_KEY", "static-key-placeholder"),
         )
         provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="tests/test.py::test_case", outcome="passed")
-        provider.annotate(test, "def test_case(): pass")
+        provider.annotate(sample_case, "def test_case(): pass")
 
         assert captured["api_key"] == "static-key-placeholder"
 
-    def test_token_refresh_integration(self, monkeypatch: pytest.MonkeyPatch):
+    def test_token_refresh_integration(
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """LiteLLM provider uses TokenRefresher for dynamic tokens."""
         import subprocess
 
@@ -225,12 +380,7 @@ def test_token_refresh_integration(self, monkeypatch: pytest.MonkeyPatch):
 
         def fake_completion(**kwargs):
             captured.update(kwargs)
-            response_data = {
-                "scenario": "Test",
-                "why_needed": "Reason",
-                "key_assertions": ["a"],
-            }
-            return FakeLiteLLMResponse(json.dumps(response_data))
+            return _LITELLM_OK
 
         def fake_run(*args, **kwargs):
             return subprocess.CompletedProcess(
@@ -240,7 +390,7 @@ def fake_run(*args, **kwargs):
         fake_litellm = SimpleNamespace(
             completion=fake_completion, AuthenticationError=Exception
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
         monkeypatch.setattr(subprocess, "run", fake_run)
 
         config = Config(
@@ -250,12 +400,13 @@ def fake_run(*args, **kwargs):
             litellm_token_refresh_interval=3600,
         )
         provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="tests/test.py::test_case", outcome="passed")
-        provider.annotate(test, "def test_case(): pass")
+        provider.annotate(sample_case, "def test_case(): pass")
 
         assert captured["api_key"] == "dynamic-token-789"
 
-    def test_401_retry_with_token_refresh(self, monkeypatch: pytest.MonkeyPatch):
+    def test_401_retry_with_token_refresh(
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """LiteLLM provider retries on 401 after refreshing token."""
         import subprocess
 
@@ -271,12 +422,7 @@ def fake_completion(**kwargs):
             captured_keys.append(kwargs.get("api_key"))
             if call_count == 1:
                 raise FakeAuthError("401 Unauthorized")
-            response_data = {
-                "scenario": "Test",
-                "why_needed": "Reason",
-                "key_assertions": ["a"],
-            }
-            return FakeLiteLLMResponse(json.dumps(response_data))
+            return _LITELLM_OK
 
         token_count = 0
 
@@ -290,7 +436,7 @@ def fake_run(*args, **kwargs):
         fake_litellm = SimpleNamespace(
             completion=fake_completion, AuthenticationError=FakeAuthError
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
         monkeypatch.setattr(subprocess, "run", fake_run)
 
         config = Config(
@@ -300,8 +446,7 @@ def fake_run(*args, **kwargs):
             litellm_token_refresh_interval=3600,
         )
         provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="tests/test.py::test_case", outcome="passed")
-        annotation = provider.annotate(test, "def test_case(): pass")
+        annotation = provider.annotate(sample_case, "def test_case(): pass")
 
         assert annotation.error is None
         assert annotation.scenario == "Test"
@@ -309,7 +454,9 @@ def fake_run(*args, **kwargs):
         assert captured_keys[0] == "token-1"  # First token
         assert captured_keys[1] == "token-2"  # Refreshed token
 
-    def test_auth_error_without_refresher(self, monkeypatch: pytest.MonkeyPatch):
+    def test_auth_error_without_refresher(
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """LiteLLM provider returns auth error when no refresher configured."""
 
         class FakeAuthError(Exception):
@@ -321,17 +468,21 @@ def fake_completion(**kwargs):
         fake_litellm = SimpleNamespace(
             completion=fake_completion, AuthenticationError=FakeAuthError
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(provider="litellm", model="gpt-4o")  # No token refresh
         provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="t", outcome="passed")
-        annotation = provider.annotate(test, "src")
+        annotation = provider.annotate(sample_case, "src")
 
         assert annotation.error is not None
         assert "Authentication failed" in annotation.error
 
-    def test_auth_retry_fails_on_second_attempt(self, monkeypatch: pytest.MonkeyPatch):
+    def test_auth_retry_fails_on_second_attempt(
+        self,
+        sample_case: CaseResult,
+        fake_clock: FakeClock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
         """LiteLLM provider reports error when retry also fails with auth error."""
         import subprocess
 
@@ -349,7 +500,7 @@ def fake_run(*args, **kwargs):
         fake_litellm = SimpleNamespace(
             completion=fake_completion, AuthenticationError=FakeAuthError
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
         monkeypatch.setattr(subprocess, "run", fake_run)
 
         config = Config(
@@ -358,14 +509,15 @@ def fake_run(*args, **kwargs):
             llm_max_retries=2,
         )
         provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="t", outcome="passed")
-        annotation = provider.annotate(test, "src")
+        annotation = provider.annotate(sample_case, "src")
 
         # After refresh fails, continues loop and gets auth error again
         assert annotation.error is not None
         assert "Authentication failed" in annotation.error
 
-    def test_annotate_with_token_usage(self, monkeypatch: pytest.MonkeyPatch):
+    def test_annotate_with_token_usage(
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """LiteLLM provider extracts token usage from response."""
 
         class FakeUsage:
@@ -374,15 +526,7 @@ class FakeUsage:
             total_tokens = 150
 
         class FakeChoice:
-            message = SimpleNamespace(
-                content=json.dumps(
-                    {
-                        "scenario": "Test",
-                        "why_needed": "Reason",
-                        "key_assertions": ["a"],
-                    }
-                )
-            )
+            message = _FakeMessage(_OK_RESPONSE_JSON)
 
         class FakeResponseWithUsage:
             choices = [FakeChoice()]
@@ -394,46 +538,188 @@ def fake_completion(**kwargs):
         fake_litellm = SimpleNamespace(
             completion=fake_completion, AuthenticationError=Exception
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(provider="litellm")
         provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="t", outcome="passed")
-        annotation = provider.annotate(test, "src")
+        annotation = provider.annotate(sample_case, "src")
 
         assert annotation.token_usage is not None
         assert annotation.token_usage.prompt_tokens == 100
         assert annotation.token_usage.completion_tokens == 50
         assert annotation.token_usage.total_tokens == 150
 
-    def test_annotate_with_prompt_override(self, monkeypatch: pytest.MonkeyPatch):
+    def test_annotate_with_prompt_override(
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """LiteLLM provider uses prompt_override when provided."""
         captured_messages = []
 
         def fake_completion(**kwargs):
             captured_messages.append(kwargs.get("messages"))
-            return FakeLiteLLMResponse(
-                json.dumps(
-                    {"scenario": "ok", "why_needed": "ok", "key_assertions": ["a"]}
-                )
-            )
+            return _LITELLM_OK
 
         fake_litellm = SimpleNamespace(
             completion=fake_completion, AuthenticationError=Exception
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(provider="litellm")
         provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="t", outcome="passed")
 
         annotation = provider._annotate_internal(
-            test, "source", None, prompt_override="CUSTOM PROMPT"
+            sample_case, "source", None, prompt_override="CUSTOM PROMPT"
         )
 
         assert annotation.error is None
         assert captured_messages[0][1]["content"] == "CUSTOM PROMPT"
 
+    def test_annotate_batch_single_request(
+        self,
+        login_case: CaseResult,
+        sample_case: CaseResult,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """LiteLLM provider annotates several tests with one completion call."""
+        calls = []
+        batch_json = json.dumps(
+            {
+                "annotations": [
+                    {"id": 1, **json.loads(_OK_RESPONSE_JSON)},
+                    {"id": 0, **dict(_LOGIN_PAYLOAD)},
+                ]
+            }
+        )
+
+        def fake_completion(**kwargs):
+            calls.append(kwargs)
+            return FakeLiteLLMResponse(batch_json)
+
+        fake_litellm = SimpleNamespace(completion=fake_completion)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
+
+        provider = LiteLLMProvider(Config(provider="litellm"))
+        annotations = provider.annotate_batch(
+            [login_case, sample_case], ["def test_login(): ...", "def test_case(): ..."]
+        )
+
+        assert len(calls) == 1
+        prompt = json.loads(calls[0]["messages"][1]["content"].split("\n", 1)[1])
+        assert [entry["nodeid"] for entry in prompt] == [
+            login_case.nodeid,
+            sample_case.nodeid,
+        ]
+        assert [a.scenario if a else None for a in annotations] == [
+            _LOGIN_PAYLOAD["scenario"],
+            "Test",
+        ]
+
+    def test_annotate_batch_leaves_missing_ids_to_caller(
+        self,
+        login_case: CaseResult,
+        sample_case: CaseResult,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Tests missing from the batched reply come back as None."""
+        calls = []
+
+        def fake_completion(**kwargs):
+            calls.append(kwargs)
+            return FakeLiteLLMResponse(
+                json.dumps({"annotations": [{"id": 0, **dict(_LOGIN_PAYLOAD)}]})
+            )
+
+        fake_litellm = SimpleNamespace(
+            completion=fake_completion, AuthenticationError=None
+        )
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
+
+        provider = LiteLLMProvider(Config(provider="litellm"))
+        annotations = provider.annotate_batch(
+            [login_case, sample_case], ["def test_login(): ...", "def test_case(): ..."]
+        )
+
+        assert len(calls) == 1
+        assert [a.scenario if a else None for a in annotations] == [
+            _LOGIN_PAYLOAD["scenario"],
+            None,
+        ]
+
+    def test_annotate_batch_surfaces_request_errors(
+        self,
+        login_case: CaseResult,
+        sample_case: CaseResult,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """A failed batched request yields an error for every test."""
+
+        class FakeAuthError(Exception):
+            pass
+
+        def fake_completion(**kwargs):
+            raise FakeAuthError("401 Unauthorized")
+
+        fake_litellm = SimpleNamespace(
+            completion=fake_completion, AuthenticationError=FakeAuthError
+        )
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
+
+        provider = LiteLLMProvider(Config(provider="litellm"))
+        annotations = provider.annotate_batch(
+            [login_case, sample_case], ["def test_login(): ...", "def test_case(): ..."]
+        )
+
+        assert [a.error if a else None for a in annotations] == [
+            "Authentication failed. Check API key or token."
+        ] * 2
+
+    def test_annotate_batch_splits_token_usage(
+        self,
+        login_case: CaseResult,
+        sample_case: CaseResult,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """The batched request's token usage is shared by its annotations."""
+        batch_json = json.dumps(
+            {
+                "annotations": [
+                    {"id": 0, **dict(_LOGIN_PAYLOAD)},
+                    {"id": 1, **dict(_LOGIN_PAYLOAD)},
+                ]
+            }
+        )
+        response = SimpleNamespace(
+            choices=FakeLiteLLMResponse(batch_json).choices,
+            usage=SimpleNamespace(
+                prompt_tokens=101, completion_tokens=40, total_tokens=141
+            ),
+        )
+        fake_litellm = SimpleNamespace(completion=lambda **kwargs: response)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
+
+        provider = LiteLLMProvider(Config(provider="litellm"))
+        annotations = provider.annotate_batch(
+            [login_case, sample_case], ["def test_login(): ...", "def test_case(): ..."]
+        )
+
+        usages = [a.token_usage for a in annotations if a and a.token_usage]
+        assert [u.prompt_tokens for u in usages] == [51, 50]
+        assert sum(u.completion_tokens for u in usages) == 40
+        assert sum(u.total_tokens for u in usages) == 141
+
+    def test_supports_batching(self):
+        """Only providers implementing raw completions batch tests."""
+        assert LiteLLMProvider(Config(provider="litellm")).supports_batching()
+        assert OllamaProvider(Config(provider="ollama")).supports_batching()
+        assert not GeminiProvider(Config(provider="gemini")).supports_batching()
+
+    def test_supports_concurrency(self):
+        """LiteLLM provider allows concurrent requests despite being remote."""
+        provider = LiteLLMProvider(Config(provider="litellm"))
+
+        assert provider.is_local() is False
+        assert provider.supports_concurrency() is True
+
     def test_get_max_context_tokens_success(self, monkeypatch: pytest.MonkeyPatch):
         """LiteLLM provider gets max tokens from litellm module."""
 
@@ -443,7 +729,7 @@ def fake_get_max_tokens(model):
         fake_litellm = SimpleNamespace(
             get_max_tokens=fake_get_max_tokens, AuthenticationError=Exception
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(provider="litellm", model="gpt-4")
         provider = LiteLLMProvider(config)
@@ -460,7 +746,7 @@ def fake_get_max_tokens(model):
         fake_litellm = SimpleNamespace(
             get_max_tokens=fake_get_max_tokens, AuthenticationError=Exception
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(provider="litellm", model="gpt-4")
         provider = LiteLLMProvider(config)
@@ -479,7 +765,7 @@ def fake_get_max_tokens(model):
         fake_litellm = SimpleNamespace(
             get_max_tokens=fake_get_max_tokens, AuthenticationError=Exception
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(provider="litellm", model="unknown")
         provider = LiteLLMProvider(config)
@@ -487,9 +773,13 @@ def fake_get_max_tokens(model):
         result = provider.get_max_context_tokens()
         assert result == 4096  # Default fallback
 
-    def test_transient_error_retry(self, monkeypatch: pytest.MonkeyPatch):
+    def test_transient_error_retry(
+        self,
+        sample_case: CaseResult,
+        fake_clock: FakeClock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
         """LiteLLM provider retries on transient errors."""
-        monkeypatch.setattr("time.sleep", lambda s: None)
 
         call_count = 0
 
@@ -503,22 +793,17 @@ def fake_completion(**kwargs):
             call_count += 1
             if call_count < 3:
                 raise ConnectionError("Network error")
-            return FakeLiteLLMResponse(
-                json.dumps(
-                    {"scenario": "ok", "why_needed": "test", "key_assertions": ["a"]}
-                )
-            )
+            return _LITELLM_OK
 
         fake_litellm = SimpleNamespace(
             completion=fake_completion, AuthenticationError=FakeAuthError
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(provider="litellm", llm_max_retries=5)
         provider = LiteLLMProvider(config)
-        test = CaseResult(nodeid="t", outcome="passed")
 
-        annotation = provider.annotate(test, "src")
+        annotation = provider.annotate(sample_case, "src")
 
         assert annotation.error is None
         # 2 failures + 1 success = 3 calls
@@ -542,7 +827,7 @@ def fake_completion(**kwargs):
         fake_litellm = SimpleNamespace(
             completion=fake_completion, AuthenticationError=Exception
         )
-        monkeypatch.setitem(__import__("sys").modules, "litellm", fake_litellm)
+        monkeypatch.setitem(sys.modules, "litellm", fake_litellm)
 
         config = Config(provider="litellm")
         provider = LiteLLMProvider(config)
@@ -558,52 +843,21 @@ def fake_completion(**kwargs):
 class TestGeminiProvider:
     """Tests for the Gemini provider."""
 
-    def test_annotate_success_with_mock_response(self, monkeypatch: pytest.MonkeyPatch):
+    def test_annotate_success_with_mock_response(
+        self,
+        login_case: CaseResult,
+        gemini_httpx: FakeGeminiApi,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
         """Gemini provider parses a valid response payload."""
-        captured = {}
-
-        def fake_post(url, **kwargs):
-            captured["url"] = url
-            captured["json"] = kwargs.get("json")
-            response_data = {
-                "scenario": "Checks login",
-                "why_needed": "Stops regressions",
-                "key_assertions": ["status ok", "redirect"],
-            }
-            payload = {
-                "candidates": [
-                    {
-                        "content": {
-                            "parts": [{"text": json.dumps(response_data)}],
-                        }
-                    }
-                ]
-            }
-            return FakeGeminiResponse(payload)
-
-        def fake_get(url, **_kwargs):
-            if "models?" in url:
-                captured["models_url"] = url
-                models_payload = {
-                    "models": [
-                        {
-                            "name": "models/gemini-1.5-pro",
-                            "supportedGenerationMethods": ["generateContent"],
-                        }
-                    ]
-                }
-                return FakeGeminiResponse(models_payload)
-            captured["rate_url"] = url
-            rate_limits_payload = {
-                "rateLimits": [
-                    {"name": "requestsPerMinute", "value": 5},
-                    {"name": "tokensPerMinute", "value": 1000},
-                    {"name": "requestsPerDay", "value": 200},
-                ]
-            }
-            return FakeGeminiResponse(rate_limits_payload)
+        gemini_httpx.rate_limits_payload = {
+            "rateLimits": [
+                {"name": "requestsPerMinute", "value": 5},
+                {"name": "tokensPerMinute", "value": 1000},
+                {"name": "requestsPerDay", "value": 200},
+            ]
+        }
 
-        fake_httpx = SimpleNamespace(post=fake_post, get=fake_get)
         # Mock google.generativeai
         fake_genai = SimpleNamespace(
             configure=lambda api_key: None,
@@ -612,45 +866,46 @@ def fake_get(url, **_kwargs):
         )
         fake_google = SimpleNamespace(__path__=[])
         fake_google.generativeai = fake_genai
-        monkeypatch.setitem(__import__("sys").modules, "google", fake_google)
-        monkeypatch.setitem(
-            __import__("sys").modules, "google.generativeai", fake_genai
-        )
+        monkeypatch.setitem(sys.modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google.generativeai", fake_genai)
         monkeypatch.setitem(
-            __import__("sys").modules,
+            sys.modules,
             "google.api_core",
             SimpleNamespace(
                 exceptions=SimpleNamespace(ResourceExhausted=MockGenerationFailure)
             ),
         )
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
         monkeypatch.setenv("GEMINI_API_TOKEN", "test-token")
 
         config = Config(provider="gemini", model="gemini-1.5-pro")
         provider = GeminiProvider(config)
-        test = CaseResult(nodeid="tests/test_auth.py::test_login", outcome="passed")
 
-        annotation = provider.annotate(test, "def test_login(): assert True")
+        annotation = provider.annotate(login_case, "def test_login(): assert True")
 
         assert isinstance(annotation, LlmAnnotation)
-        assert annotation.scenario == "Checks login"
-        assert annotation.why_needed == "Stops regressions"
-        assert annotation.key_assertions == ["status ok", "redirect"]
+        assert annotation.scenario == _LOGIN_PAYLOAD["scenario"]
+        assert annotation.why_needed == _LOGIN_PAYLOAD["why_needed"]
+        assert annotation.key_assertions == list(_LOGIN_PAYLOAD["key_assertions"])
         assert annotation.confidence == 0.8
-        assert "gemini-1.5-pro" in captured["url"]
-        assert "key=test-token" in captured["url"]
-        assert "gemini-1.5-pro" in captured["rate_url"]
-        assert "models?key=test-token" in captured["models_url"]
-        assert captured["json"]["system_instruction"]["parts"][0]["text"]
+
+        models_request, rate_request, generate_request = gemini_httpx.requests
+        assert "models?key=test-token" in str(models_request.url)
+        assert "gemini-1.5-pro" in str(rate_request.url)
+        assert "gemini-1.5-pro" in str(generate_request.url)
+        assert "key=test-token" in str(generate_request.url)
+        payload = json.loads(generate_request.content)
+        assert payload["system_instruction"]["parts"][0]["text"]
         assert (
             "tests/test_auth.py::test_login"
-            in captured["json"]["contents"][0]["parts"][0]["text"]
+            in payload["contents"][0]["parts"][0]["text"]
         )
-        assert "def test_login()" in captured["json"]["contents"][0]["parts"][0]["text"]
+        assert "def test_login()" in payload["contents"][0]["parts"][0]["text"]
 
-    def test_annotate_missing_token(self, monkeypatch: pytest.MonkeyPatch):
+    def test_annotate_missing_token(
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """Gemini provider requires an API token."""
-        monkeypatch.setitem(__import__("sys").modules, "httpx", SimpleNamespace())
+        monkeypatch.setitem(sys.modules, "httpx", SimpleNamespace())
 
         # Mock google.generativeai
         fake_genai = SimpleNamespace(
@@ -660,12 +915,10 @@ def test_annotate_missing_token(self, monkeypatch: pytest.MonkeyPatch):
         )
         fake_google = SimpleNamespace(__path__=[])
         fake_google.generativeai = fake_genai
-        monkeypatch.setitem(__import__("sys").modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google.generativeai", fake_genai)
         monkeypatch.setitem(
-            __import__("sys").modules, "google.generativeai", fake_genai
-        )
-        monkeypatch.setitem(
-            __import__("sys").modules,
+            sys.modules,
             "google.api_core",
             SimpleNamespace(
                 exceptions=SimpleNamespace(ResourceExhausted=MockGenerationFailure)
@@ -675,14 +928,15 @@ def test_annotate_missing_token(self, monkeypatch: pytest.MonkeyPatch):
 
         config = Config(provider="gemini")
         provider = GeminiProvider(config)
-        test = CaseResult(nodeid="tests/test_sample.py::test_case", outcome="passed")
-        annotation = provider.annotate(test, "def test_case(): assert True")
+        annotation = provider.annotate(sample_case, "def test_case(): assert True")
 
         assert annotation.error == "GEMINI_API_TOKEN is not set"
 
-    def test_annotate_missing_dependency(self, mock_import_error, monkeypatch):
+    def test_annotate_missing_dependency(
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """Gemini provider reports missing httpx dependency."""
-        mock_import_error("httpx")
+        monkeypatch.setitem(sys.modules, "httpx", None)
 
         # Mock google.generativeai and google so we get past that check
         fake_genai = SimpleNamespace(
@@ -692,15 +946,13 @@ def test_annotate_missing_dependency(self, mock_import_error, monkeypatch):
         )
         fake_google = SimpleNamespace(__path__=[])
         fake_google.generativeai = fake_genai
-        monkeypatch.setitem(__import__("sys").modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google", fake_google)
         fake_google = SimpleNamespace(__path__=[])
         fake_google.generativeai = fake_genai
-        monkeypatch.setitem(__import__("sys").modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google.generativeai", fake_genai)
         monkeypatch.setitem(
-            __import__("sys").modules, "google.generativeai", fake_genai
-        )
-        monkeypatch.setitem(
-            __import__("sys").modules,
+            sys.modules,
             "google.api_core",
             SimpleNamespace(
                 exceptions=SimpleNamespace(ResourceExhausted=MockGenerationFailure)
@@ -710,77 +962,25 @@ def test_annotate_missing_dependency(self, mock_import_error, monkeypatch):
 
         config = Config(provider="gemini")
         provider = GeminiProvider(config)
-        test = CaseResult(nodeid="tests/test_sample.py::test_case", outcome="passed")
-        annotation = provider.annotate(test, "def test_case(): assert True")
+        annotation = provider.annotate(sample_case, "def test_case(): assert True")
 
         assert (
             annotation.error == "httpx not installed. Install with: pip install httpx"
         )
 
     def test_annotate_retries_on_rate_limit(
-        self, monkeypatch: pytest.MonkeyPatch
+        self,
+        login_case: CaseResult,
+        gemini_httpx: FakeGeminiApi,
+        fake_clock: FakeClock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Gemini provider retries when rate limited."""
-        calls = []
-
-        class FakeResponse:
-            def __init__(self, payload, status_code=200, headers=None):
-                self._payload = payload
-                self.status_code = status_code
-                self.headers = headers or {}
-
-            def raise_for_status(self):
-                if self.status_code >= 400:
-                    raise RuntimeError(f"HTTP {self.status_code}")
-
-            def json(self):
-                return self._payload
-
-        response_data = {
-            "scenario": "Checks login",
-            "why_needed": "Stops regressions",
-            "key_assertions": ["status ok", "redirect"],
-        }
-        success_payload = {
-            "candidates": [
-                {
-                    "content": {
-                        "parts": [{"text": json.dumps(response_data)}],
-                    }
-                }
-            ]
-        }
-        responses = iter(
-            [
-                FakeResponse({}, status_code=429, headers={"Retry-After": "0"}),
-                FakeResponse(success_payload),
-            ]
+        gemini_httpx.rate_limits_payload = _RPM_60
+        gemini_httpx.generate_replies.append(
+            gemini_httpx.response(429, json={}, headers={"Retry-After": "0"})
         )
 
-        def fake_post(url, **kwargs):
-            calls.append((url, kwargs))
-            return next(responses)
-
-        def fake_get(url, **_kwargs):
-            if "models?" in url:
-                models_payload = {
-                    "models": [
-                        {
-                            "name": "models/gemini-1.5-pro",
-                            "supportedGenerationMethods": ["generateContent"],
-                        }
-                    ]
-                }
-                return FakeGeminiResponse(models_payload)
-            rate_limits_payload = {
-                "rateLimits": [{"name": "requestsPerMinute", "value": 60}]
-            }
-            return FakeGeminiResponse(rate_limits_payload)
-
-        fake_httpx = SimpleNamespace(post=fake_post, get=fake_get)
-        sleep_calls: list[float] = []
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
-
         # Mock google.generativeai
         fake_genai = SimpleNamespace(
             configure=lambda api_key: None,
@@ -789,151 +989,58 @@ def fake_get(url, **_kwargs):
         )
         fake_google = SimpleNamespace(__path__=[])
         fake_google.generativeai = fake_genai
-        monkeypatch.setitem(__import__("sys").modules, "google", fake_google)
-        monkeypatch.setitem(
-            __import__("sys").modules, "google.generativeai", fake_genai
-        )
+        monkeypatch.setitem(sys.modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google.generativeai", fake_genai)
         monkeypatch.setitem(
-            __import__("sys").modules,
+            sys.modules,
             "google.api_core",
             SimpleNamespace(
                 exceptions=SimpleNamespace(ResourceExhausted=MockGenerationFailure)
             ),
         )
         monkeypatch.setenv("GEMINI_API_TOKEN", "test-token")
-        monkeypatch.setattr(
-            "pytest_llm_report.llm.gemini.time.sleep", sleep_calls.append
-        )
 
         config = Config(provider="gemini", model="gemini-1.5-pro")
         provider = GeminiProvider(config)
-        test = CaseResult(nodeid="tests/test_auth.py::test_login", outcome="passed")
-        annotation = provider.annotate(test, "def test_login(): assert True")
-
-        assert annotation.scenario == "Checks login"
-        assert len(calls) == 2
-        # assert sleep_calls == []  # Sleep might be called with 0 depending on implementation
-
-    def test_annotate_skips_on_daily_limit(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Gemini provider skips when daily limit is reached."""
-        calls = []
-
-        def fake_post(url, **kwargs):
-            calls.append((url, kwargs))
-            response_data = {
-                "scenario": "Checks login",
-                "why_needed": "Stops regressions",
-                "key_assertions": ["status ok", "redirect"],
-            }
-            payload = {
-                "candidates": [
-                    {"content": {"parts": [{"text": json.dumps(response_data)}]}}
-                ]
-            }
-            return FakeGeminiResponse(payload)
-
-        def fake_get(url, **_kwargs):
-            if "models?" in url:
-                models_payload = {
-                    "models": [
-                        {
-                            "name": "models/gemini-1.5-pro",
-                            "supportedGenerationMethods": ["generateContent"],
-                        }
-                    ]
-                }
-                return FakeGeminiResponse(models_payload)
-            rate_limits_payload = {
-                "rateLimits": [{"name": "requestsPerDay", "value": 1}]
-            }
-            return FakeGeminiResponse(rate_limits_payload)
-
-        fake_httpx = SimpleNamespace(post=fake_post, get=fake_get)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
-
-        # Mock google.generativeai
-        fake_genai = SimpleNamespace(
-            configure=lambda api_key: None,
-            GenerativeModel=lambda name: SimpleNamespace(),
-            types=SimpleNamespace(GenerationFailure=MockGenerationFailure),
-        )
-        fake_google = SimpleNamespace(__path__=[])
-        fake_google.generativeai = fake_genai
-        monkeypatch.setitem(__import__("sys").modules, "google", fake_google)
-        monkeypatch.setitem(
-            __import__("sys").modules, "google.generativeai", fake_genai
-        )
-        monkeypatch.setitem(
-            __import__("sys").modules,
-            "google.api_core",
-            SimpleNamespace(
-                exceptions=SimpleNamespace(ResourceExhausted=MockGenerationFailure)
+        annotation = provider.annotate(login_case, "def test_login(): assert True")
+
+        assert annotation.scenario == _LOGIN_PAYLOAD["scenario"]
+        assert len(gemini_httpx.generate_requests) == 2
+        # Retry-After: 0 means no real back-off is needed
+        assert all(seconds == 0 for seconds in fake_clock.sleeps)
+
+    @pytest.mark.parametrize(
+        ("model", "models_payload", "expected_models", "second_error"),
+        [
+            pytest.param(
+                "gemini-1.5-pro",
+                _MODELS_PAYLOAD_PRO,
+                ["gemini-1.5-pro"],
+                "Gemini requests-per-day limit reached; skipping annotation",
+                id="skips-single-model",
             ),
-        )
-        monkeypatch.setenv("GEMINI_API_TOKEN", "test-token")
-
-        config = Config(provider="gemini", model="gemini-1.5-pro")
-        provider = GeminiProvider(config)
-        test = CaseResult(nodeid="tests/test_auth.py::test_login", outcome="passed")
-
-        first = provider.annotate(test, "def test_login(): assert True")
-        second = provider.annotate(test, "def test_login(): assert True")
-
-        assert first.error is None
-        assert (
-            second.error == "Gemini requests-per-day limit reached; skipping annotation"
-        )
-        assert len(calls) == 1
-
-    def test_annotate_rotates_models_on_daily_limit(
-        self, monkeypatch: pytest.MonkeyPatch
+            pytest.param(
+                "all",
+                _MODELS_PAYLOAD_PRO_FLASH,
+                ["gemini-1.5-pro", "gemini-1.5-flash"],
+                None,
+                id="rotates-models",
+            ),
+        ],
+    )
+    def test_annotate_on_daily_limit(
+        self,
+        login_case: CaseResult,
+        model: str,
+        models_payload: dict,
+        expected_models: list[str],
+        second_error: str | None,
+        gemini_httpx: FakeGeminiApi,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Gemini provider rotates models when daily limit is exhausted."""
-        calls = []
-
-        def fake_post(url, **kwargs):
-            calls.append((url, kwargs))
-            response_data = {
-                "scenario": "Checks login",
-                "why_needed": "Stops regressions",
-                "key_assertions": ["status ok", "redirect"],
-            }
-            payload = {
-                "candidates": [
-                    {"content": {"parts": [{"text": json.dumps(response_data)}]}}
-                ]
-            }
-            return FakeGeminiResponse(payload)
-
-        def fake_get(url, **_kwargs):
-            if "models?" in url:
-                models_payload = {
-                    "models": [
-                        {
-                            "name": "models/gemini-1.5-pro",
-                            "supportedGenerationMethods": ["generateContent"],
-                        },
-                        {
-                            "name": "models/gemini-1.5-flash",
-                            "supportedGenerationMethods": ["generateContent"],
-                        },
-                    ]
-                }
-                return FakeGeminiResponse(models_payload)
-            if "gemini-1.5-pro" in url:
-                rate_limits_payload = {
-                    "rateLimits": [{"name": "requestsPerDay", "value": 1}]
-                }
-                return FakeGeminiResponse(rate_limits_payload)
-            rate_limits_payload = {
-                "rateLimits": [{"name": "requestsPerDay", "value": 1}]
-            }
-            return FakeGeminiResponse(rate_limits_payload)
-
-        fake_httpx = SimpleNamespace(post=fake_post, get=fake_get)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        """Gemini provider rotates models, or skips, once a daily limit is hit."""
+        gemini_httpx.models_payload = models_payload
+        gemini_httpx.rate_limits_payload = _RPD_1
 
         # Mock google.generativeai
         fake_genai = SimpleNamespace(
@@ -943,12 +1050,10 @@ def fake_get(url, **_kwargs):
         )
         fake_google = SimpleNamespace(__path__=[])
         fake_google.generativeai = fake_genai
-        monkeypatch.setitem(__import__("sys").modules, "google", fake_google)
-        monkeypatch.setitem(
-            __import__("sys").modules, "google.generativeai", fake_genai
-        )
+        monkeypatch.setitem(sys.modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google.generativeai", fake_genai)
         monkeypatch.setitem(
-            __import__("sys").modules,
+            sys.modules,
             "google.api_core",
             SimpleNamespace(
                 exceptions=SimpleNamespace(ResourceExhausted=MockGenerationFailure)
@@ -956,62 +1061,28 @@ def fake_get(url, **_kwargs):
         )
         monkeypatch.setenv("GEMINI_API_TOKEN", "test-token")
 
-        config = Config(provider="gemini", model="all")
+        config = Config(provider="gemini", model=model)
         provider = GeminiProvider(config)
-        test = CaseResult(nodeid="tests/test_auth.py::test_login", outcome="passed")
 
-        first = provider.annotate(test, "def test_login(): assert True")
-        second = provider.annotate(test, "def test_login(): assert True")
+        first = provider.annotate(login_case, "def test_login(): assert True")
+        second = provider.annotate(login_case, "def test_login(): assert True")
 
         assert first.error is None
-        assert second.error is None
-        assert "gemini-1.5-pro" in calls[0][0]
-        assert "gemini-1.5-flash" in calls[1][0]
+        assert second.error == second_error
+        generate_urls = [str(r.url) for r in gemini_httpx.generate_requests]
+        assert len(generate_urls) == len(expected_models)
+        for url, expected_model in zip(generate_urls, expected_models, strict=True):
+            assert f"/{expected_model}:generateContent" in url
 
     def test_exhausted_model_recovers_after_24h(
-        self, monkeypatch: pytest.MonkeyPatch
+        self,
+        login_case: CaseResult,
+        gemini_httpx: FakeGeminiApi,
+        fake_clock: FakeClock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Gemini provider recovers exhausted models after 24 hours."""
-        calls = []
-        fake_time = [1000000.0]  # Start time
-
-        def fake_time_time():
-            return fake_time[0]
-
-        monkeypatch.setattr("pytest_llm_report.llm.gemini.time.time", fake_time_time)
-
-        def fake_post(url, **kwargs):
-            calls.append((url, kwargs))
-            response_data = {
-                "scenario": "Checks login",
-                "why_needed": "Stops regressions",
-                "key_assertions": ["status ok", "redirect"],
-            }
-            payload = {
-                "candidates": [
-                    {"content": {"parts": [{"text": json.dumps(response_data)}]}}
-                ]
-            }
-            return FakeGeminiResponse(payload)
-
-        def fake_get(url, **_kwargs):
-            if "models?" in url:
-                models_payload = {
-                    "models": [
-                        {
-                            "name": "models/gemini-1.5-pro",
-                            "supportedGenerationMethods": ["generateContent"],
-                        }
-                    ]
-                }
-                return FakeGeminiResponse(models_payload)
-            rate_limits_payload = {
-                "rateLimits": [{"name": "requestsPerDay", "value": 1}]
-            }
-            return FakeGeminiResponse(rate_limits_payload)
-
-        fake_httpx = SimpleNamespace(post=fake_post, get=fake_get)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        gemini_httpx.rate_limits_payload = _RPD_1
 
         # Mock google.generativeai
         fake_genai = SimpleNamespace(
@@ -1021,12 +1092,10 @@ def fake_get(url, **_kwargs):
         )
         fake_google = SimpleNamespace(__path__=[])
         fake_google.generativeai = fake_genai
-        monkeypatch.setitem(__import__("sys").modules, "google", fake_google)
-        monkeypatch.setitem(
-            __import__("sys").modules, "google.generativeai", fake_genai
-        )
+        monkeypatch.setitem(sys.modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google.generativeai", fake_genai)
         monkeypatch.setitem(
-            __import__("sys").modules,
+            sys.modules,
             "google.api_core",
             SimpleNamespace(
                 exceptions=SimpleNamespace(ResourceExhausted=MockGenerationFailure)
@@ -1036,72 +1105,36 @@ def fake_get(url, **_kwargs):
 
         config = Config(provider="gemini", model="gemini-1.5-pro")
         provider = GeminiProvider(config)
-        test = CaseResult(nodeid="tests/test_auth.py::test_login", outcome="passed")
 
         # First call succeeds, uses daily limit
-        first = provider.annotate(test, "def test_login(): assert True")
+        first = provider.annotate(login_case, "def test_login(): assert True")
         assert first.error is None
-        assert len(calls) == 1
+        assert len(gemini_httpx.generate_requests) == 1
 
         # Second call fails - daily limit exhausted
-        second = provider.annotate(test, "def test_login(): assert True")
+        second = provider.annotate(login_case, "def test_login(): assert True")
         assert (
             second.error == "Gemini requests-per-day limit reached; skipping annotation"
         )
-        assert len(calls) == 1  # No new API call
+        assert len(gemini_httpx.generate_requests) == 1  # No new API call
 
         # Advance time by 24 hours + 1 second
-        fake_time[0] += 24 * 3600 + 1
+        fake_clock.advance(24 * 3600 + 1)
 
         # Third call should succeed - model has recovered
-        third = provider.annotate(test, "def test_login(): assert True")
+        third = provider.annotate(login_case, "def test_login(): assert True")
         assert third.error is None
-        assert len(calls) == 2  # New API call made
+        assert len(gemini_httpx.generate_requests) == 2  # New API call made
 
     def test_model_list_refreshes_after_interval(
-        self, monkeypatch: pytest.MonkeyPatch
+        self,
+        login_case: CaseResult,
+        gemini_httpx: FakeGeminiApi,
+        fake_clock: FakeClock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Gemini provider refreshes model list after 6 hours."""
-        model_fetches = []
-        fake_time = [1000000.0]
-
-        def fake_time_time():
-            return fake_time[0]
-
-        monkeypatch.setattr("pytest_llm_report.llm.gemini.time.time", fake_time_time)
-
-        def fake_post(url, **kwargs):
-            response_data = {
-                "scenario": "Checks login",
-                "why_needed": "Stops regressions",
-                "key_assertions": ["status ok"],
-            }
-            payload = {
-                "candidates": [
-                    {"content": {"parts": [{"text": json.dumps(response_data)}]}}
-                ]
-            }
-            return FakeGeminiResponse(payload)
-
-        def fake_get(url, **_kwargs):
-            if "models?" in url:
-                model_fetches.append(fake_time[0])
-                models_payload = {
-                    "models": [
-                        {
-                            "name": "models/gemini-1.5-pro",
-                            "supportedGenerationMethods": ["generateContent"],
-                        }
-                    ]
-                }
-                return FakeGeminiResponse(models_payload)
-            rate_limits_payload = {
-                "rateLimits": [{"name": "requestsPerMinute", "value": 60}]
-            }
-            return FakeGeminiResponse(rate_limits_payload)
-
-        fake_httpx = SimpleNamespace(post=fake_post, get=fake_get)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        gemini_httpx.rate_limits_payload = _RPM_60
 
         # Mock google.generativeai
         fake_genai = SimpleNamespace(
@@ -1111,12 +1144,10 @@ def fake_get(url, **_kwargs):
         )
         fake_google = SimpleNamespace(__path__=[])
         fake_google.generativeai = fake_genai
-        monkeypatch.setitem(__import__("sys").modules, "google", fake_google)
-        monkeypatch.setitem(
-            __import__("sys").modules, "google.generativeai", fake_genai
-        )
+        monkeypatch.setitem(sys.modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google.generativeai", fake_genai)
         monkeypatch.setitem(
-            __import__("sys").modules,
+            sys.modules,
             "google.api_core",
             SimpleNamespace(exceptions=SimpleNamespace(ResourceExhausted=Exception)),
         )
@@ -1124,61 +1155,35 @@ def fake_get(url, **_kwargs):
 
         config = Config(provider="gemini", model="gemini-1.5-pro")
         provider = GeminiProvider(config)
-        test = CaseResult(nodeid="tests/test_auth.py::test_login", outcome="passed")
 
         # First call fetches models
-        provider.annotate(test, "def test_login(): assert True")
-        assert len(model_fetches) == 1
+        provider.annotate(login_case, "def test_login(): assert True")
+        assert len(gemini_httpx.models_requests) == 1
 
         # Second call (same time) should not re-fetch
-        provider.annotate(test, "def test_login(): assert True")
-        assert len(model_fetches) == 1
+        provider.annotate(login_case, "def test_login(): assert True")
+        assert len(gemini_httpx.models_requests) == 1
 
         # Advance time by 6 hours + 1 second
-        fake_time[0] += 6 * 3600 + 1
+        fake_clock.advance(6 * 3600 + 1)
 
         # Third call should re-fetch models
-        provider.annotate(test, "def test_login(): assert True")
-        assert len(model_fetches) == 2
-
-    def test_annotate_records_tokens(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        provider.annotate(login_case, "def test_login(): assert True")
+        assert len(gemini_httpx.models_requests) == 2
+
+    def test_annotate_records_tokens(
+        self,
+        login_case: CaseResult,
+        gemini_httpx: FakeGeminiApi,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Gemini provider records token usage."""
-        captured = {}
-
-        def fake_post(url, **kwargs):
-            captured["json"] = kwargs.get("json")
-            response_data = {
-                "scenario": "Checks login",
-                "why_needed": "Stops regressions",
-                "key_assertions": ["status ok"],
-            }
-            # Response with usage metadata
-            payload = {
-                "candidates": [
-                    {"content": {"parts": [{"text": json.dumps(response_data)}]}}
-                ],
-                "usageMetadata": {"totalTokenCount": 123},
-            }
-            return FakeGeminiResponse(payload)
-
-        def fake_get(url, **_kwargs):
-            if "models?" in url:
-                models_payload = {
-                    "models": [
-                        {
-                            "name": "models/gemini-1.5-pro",
-                            "supportedGenerationMethods": ["generateContent"],
-                        }
-                    ]
-                }
-                return FakeGeminiResponse(models_payload)
-            rate_limits_payload = {
-                "rateLimits": [{"name": "tokensPerMinute", "value": 1000}]
-            }
-            return FakeGeminiResponse(rate_limits_payload)
-
-        fake_httpx = SimpleNamespace(post=fake_post, get=fake_get)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        gemini_httpx.rate_limits_payload = _TPM_1000
+        # Response with usage metadata
+        gemini_httpx.generate_payload = {
+            **_GEMINI_LOGIN_PAYLOAD,
+            "usageMetadata": {"totalTokenCount": 123},
+        }
 
         # Mock google.generativeai
         fake_genai = SimpleNamespace(
@@ -1188,12 +1193,10 @@ def fake_get(url, **_kwargs):
         )
         fake_google = SimpleNamespace(__path__=[])
         fake_google.generativeai = fake_genai
-        monkeypatch.setitem(__import__("sys").modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google.generativeai", fake_genai)
         monkeypatch.setitem(
-            __import__("sys").modules, "google.generativeai", fake_genai
-        )
-        monkeypatch.setitem(
-            __import__("sys").modules,
+            sys.modules,
             "google.api_core",
             SimpleNamespace(exceptions=SimpleNamespace(ResourceExhausted=Exception)),
         )
@@ -1201,10 +1204,9 @@ def fake_get(url, **_kwargs):
 
         config = Config(provider="gemini", model="gemini-1.5-pro")
         provider = GeminiProvider(config)
-        test = CaseResult(nodeid="tests/test_auth.py::test_login", outcome="passed")
 
         # Verify tokens recorded on limiter
-        provider.annotate(test, "def test_login(): assert True")
+        provider.annotate(login_case, "def test_login(): assert True")
         # Rate limits logic is internal, but we can check if it ran without error
         # To truly verify, we'd inspect provider._rate_limiters['gemini-1.5-pro']._token_usage
         limiter = provider._rate_limiters.get("gemini-1.5-pro")
@@ -1213,28 +1215,17 @@ def fake_get(url, **_kwargs):
         assert limiter._token_usage[0][1] == 123
 
     def test_annotate_handles_context_too_large(
-        self, monkeypatch: pytest.MonkeyPatch
+        self,
+        sample_case: CaseResult,
+        gemini_httpx: FakeGeminiApi,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Gemini provider handles 400 Context too large errors."""
+        # Simulate 400 error
+        gemini_httpx.generate_payload = RuntimeError(
+            "400 Bad Request: Context too large"
+        )
 
-        def fake_post(url, **kwargs):
-            # Simulate 400 error
-            raise RuntimeError("400 Bad Request: Context too large")
-
-        def fake_get(url, **_kwargs):
-            if "models?" in url:
-                models_payload = {
-                    "models": [
-                        {
-                            "name": "models/gemini-1.5-pro",
-                            "supportedGenerationMethods": ["generateContent"],
-                        }
-                    ]
-                }
-                return FakeGeminiResponse(models_payload)
-            return FakeGeminiResponse({"rateLimits": []})
-
-        fake_httpx = SimpleNamespace(post=fake_post, get=fake_get)
         # Mock google.generativeai
         fake_genai = SimpleNamespace(
             configure=lambda api_key: None,
@@ -1243,41 +1234,30 @@ def fake_get(url, **_kwargs):
         )
         fake_google = SimpleNamespace(__path__=[])
         fake_google.generativeai = fake_genai
-        monkeypatch.setitem(__import__("sys").modules, "google", fake_google)
-        monkeypatch.setitem(
-            __import__("sys").modules, "google.generativeai", fake_genai
-        )
+        monkeypatch.setitem(sys.modules, "google", fake_google)
+        monkeypatch.setitem(sys.modules, "google.generativeai", fake_genai)
         monkeypatch.setitem(
-            __import__("sys").modules,
+            sys.modules,
             "google.api_core",
             SimpleNamespace(
                 exceptions=SimpleNamespace(ResourceExhausted=MockGenerationFailure)
             ),
         )
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
         monkeypatch.setenv("GEMINI_API_TOKEN", "test-token")
 
         config = Config(provider="gemini")
         provider = GeminiProvider(config)
-        test = CaseResult(nodeid="tests/test.py::test_foo", outcome="passed")
 
-        annotation = provider.annotate(test, "def test_foo(): pass")
+        annotation = provider.annotate(sample_case, "def test_foo(): pass")
         assert annotation.error is not None
         assert "Context too large" in annotation.error
         assert "400" in annotation.error
 
     def test_fetch_available_models_error(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, gemini_httpx: FakeGeminiApi, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Gemini provider handles model fetch errors gracefully."""
-
-        def fake_get(url, **_kwargs):
-            if "models?" in url:
-                raise RuntimeError("Network error")
-            return FakeGeminiResponse({"rateLimits": []})
-
-        fake_httpx = SimpleNamespace(get=fake_get)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        gemini_httpx.models_payload = RuntimeError("Network error")
         monkeypatch.setenv("GEMINI_API_TOKEN", "test-token")
 
         config = Config(provider="gemini")
@@ -1289,6 +1269,27 @@ def fake_get(url, **_kwargs):
         assert len(models) == 1
         assert models[0] == "gemini-1.5-flash-latest"
 
+    def test_each_provider_owns_its_client(self, monkeypatch: pytest.MonkeyPatch):
+        """Gemini providers create, reuse and close their own HTTP client."""
+        clients = []
+
+        def make_client(**_kwargs):
+            client = SimpleNamespace(closed=False)
+            client.close = lambda: setattr(client, "closed", True)
+            clients.append(client)
+            return client
+
+        monkeypatch.setitem(sys.modules, "httpx", SimpleNamespace(Client=make_client))
+        first = GeminiProvider(Config(provider="gemini"))
+        second = GeminiProvider(Config(provider="gemini"))
+
+        assert first._get_client() is first._get_client()
+        assert second._get_client() is not first._get_client()
+
+        first.close()
+
+        assert [client.closed for client in clients] == [True, False]
+
 
 class TestOllamaProvider:
     """Tests for the Ollama provider."""
@@ -1333,34 +1334,79 @@ def test_parse_response_invalid_key_assertions(self):
 
         assert annotation.error == "Invalid response: key_assertions must be a list"
 
-    def test_annotate_missing_httpx(self, mock_import_error):
+    def test_parse_response_rejects_non_object(self):
+        """Ollama provider rejects JSON that is not an object."""
+        provider = OllamaProvider(Config(provider="ollama"))
+
+        annotation = provider._parse_response('```json\n["scenario"]\n```')
+
+        assert annotation.error == "Invalid response: expected a JSON object"
+
+    def test_annotate_batch_leaves_invalid_entries_to_caller(
+        self,
+        login_case: CaseResult,
+        sample_case: CaseResult,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Ollama provider returns None for tests whose batched entry is invalid."""
+        systems = []
+        batch_reply = {
+            "annotations": [
+                {"id": 0, **dict(_LOGIN_PAYLOAD)},
+                {"id": 1, "scenario": "x", "key_assertions": "oops"},
+            ]
+        }
+        replies = [batch_reply]
+
+        def fake_call(prompt, system_prompt):
+            systems.append(system_prompt)
+            return {"response": json.dumps(replies.pop(0))}
+
+        provider = OllamaProvider(Config(provider="ollama"))
+        monkeypatch.setitem(sys.modules, "httpx", SimpleNamespace())
+        monkeypatch.setattr(provider, "_call_ollama", fake_call)
+
+        annotations = provider.annotate_batch(
+            [login_case, sample_case], ["def test_login(): ...", "def test_case(): ..."]
+        )
+
+        assert len(systems) == 1
+        assert "JSON list of tests" in systems[0]
+        assert annotations[0] is not None
+        assert annotations[0].error is None
+        assert annotations[1] is None
+
+    def test_annotate_missing_httpx(
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """Ollama provider reports missing httpx dependency."""
-        mock_import_error("httpx")
+        monkeypatch.setitem(sys.modules, "httpx", None)
 
         config = Config(provider="ollama")
         provider = OllamaProvider(config)
-        test = CaseResult(nodeid="tests/test_sample.py::test_case", outcome="passed")
-        annotation = provider.annotate(test, "def test_case(): assert True")
+        annotation = provider.annotate(sample_case, "def test_case(): assert True")
 
         assert (
             annotation.error == "httpx not installed. Install with: pip install httpx"
         )
 
-    def test_annotate_handles_call_error(self, monkeypatch: pytest.MonkeyPatch):
+    def test_annotate_handles_call_error(
+        self,
+        sample_case: CaseResult,
+        fake_clock: FakeClock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
         """Ollama provider surfaces call errors in annotation."""
-        # Mock sleep to avoid waiting during retries
-        monkeypatch.setattr("time.sleep", lambda s: None)
 
         config = Config(provider="ollama", llm_max_retries=2)
         provider = OllamaProvider(config)
-        test = CaseResult(nodeid="tests/test_sample.py::test_case", outcome="passed")
-        monkeypatch.setitem(__import__("sys").modules, "httpx", SimpleNamespace())
+        monkeypatch.setitem(sys.modules, "httpx", SimpleNamespace())
 
         def fake_call(prompt: str, system_prompt: str) -> str:
             raise Exception("boom")
 
         monkeypatch.setattr(provider, "_call_ollama", fake_call)
-        annotation = provider.annotate(test, "def test_case(): assert True")
+        annotation = provider.annotate(sample_case, "def test_case(): assert True")
 
         assert annotation.error == "Failed after 2 retries. Last error: boom"
 
@@ -1402,23 +1448,24 @@ def test_parse_response_json_in_plain_fence(self):
         assert annotation.key_assertions == ["a", "b"]
 
     def test_annotate_fallbacks_on_context_length_error(
-        self, monkeypatch: pytest.MonkeyPatch
+        self,
+        sample_case: CaseResult,
+        fake_clock: FakeClock,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """Ollama provider falls back to minimal context on 'context too long' error."""
-        monkeypatch.setattr("time.sleep", lambda s: None)
 
         config = Config(provider="ollama")
         provider = OllamaProvider(config)
-        test = CaseResult(nodeid="tests/test_sample.py::test_case", outcome="passed")
-        monkeypatch.setitem(__import__("sys").modules, "httpx", SimpleNamespace())
+        monkeypatch.setitem(sys.modules, "httpx", SimpleNamespace())
 
         # Track calls to _build_prompt to verify context usage
         original_build_prompt = provider._build_prompt
         build_prompt_calls = []
 
-        def tracked_build_prompt(test, source, context):
+        def tracked_build_prompt(sample_case, source, context):
             build_prompt_calls.append(context)
-            return original_build_prompt(test, source, context)
+            return original_build_prompt(sample_case, source, context)
 
         monkeypatch.setattr(provider, "_build_prompt", tracked_build_prompt)
 
@@ -1447,7 +1494,7 @@ def fake_parse(response: str) -> LlmAnnotation:
         monkeypatch.setattr(provider, "_parse_response", fake_parse)
 
         context_files = {"file1.py": "content"}
-        annotation = provider.annotate(test, "def test(): pass", context_files)
+        annotation = provider.annotate(sample_case, "def test(): pass", context_files)
 
         assert annotation.error is None
         assert call_count == 2
@@ -1466,15 +1513,12 @@ def test_is_local_returns_true(self):
     def test_check_availability_success(self, monkeypatch: pytest.MonkeyPatch):
         """Ollama provider checks availability via /api/tags endpoint."""
 
-        class FakeResponse:
-            status_code = 200
-
         def fake_get(url, **kwargs):
             assert "/api/tags" in url
-            return FakeResponse()
+            return FakeHttpResponse()
 
-        fake_httpx = SimpleNamespace(get=fake_get)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(get=fake_get)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(provider="ollama", ollama_host="http://localhost:11434")
         provider = OllamaProvider(config)
@@ -1487,8 +1531,8 @@ def test_check_availability_failure(self, monkeypatch: pytest.MonkeyPatch):
         def fake_get(url, **kwargs):
             raise ConnectionError("Server not running")
 
-        fake_httpx = SimpleNamespace(get=fake_get)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(get=fake_get)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(provider="ollama")
         provider = OllamaProvider(config)
@@ -1498,14 +1542,11 @@ def fake_get(url, **kwargs):
     def test_check_availability_non_200(self, monkeypatch: pytest.MonkeyPatch):
         """Ollama provider returns False for non-200 status codes."""
 
-        class FakeResponse:
-            status_code = 500
-
         def fake_get(url, **kwargs):
-            return FakeResponse()
+            return FakeHttpResponse(status_code=500)
 
-        fake_httpx = SimpleNamespace(get=fake_get)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(get=fake_get)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(provider="ollama")
         provider = OllamaProvider(config)
@@ -1516,23 +1557,14 @@ def test_call_ollama_success(self, monkeypatch: pytest.MonkeyPatch):
         """Ollama provider makes correct API call."""
         captured = {}
 
-        class FakeResponse:
-            status_code = 200
-
-            def raise_for_status(self):
-                pass
-
-            def json(self):
-                return {"response": "test response"}
-
         def fake_post(url, **kwargs):
             captured["url"] = url
             captured["json"] = kwargs.get("json")
             captured["timeout"] = kwargs.get("timeout")
-            return FakeResponse()
+            return FakeHttpResponse({"response": "test response"})
 
-        fake_httpx = SimpleNamespace(post=fake_post)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(post=fake_post)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(
             provider="ollama",
@@ -1556,19 +1588,12 @@ def test_call_ollama_uses_default_model(self, monkeypatch: pytest.MonkeyPatch):
         """Ollama provider uses default model when not specified."""
         captured = {}
 
-        class FakeResponse:
-            def raise_for_status(self):
-                pass
-
-            def json(self):
-                return {"response": "ok"}
-
         def fake_post(url, **kwargs):
             captured["json"] = kwargs.get("json")
-            return FakeResponse()
+            return FakeHttpResponse({"response": "ok"})
 
-        fake_httpx = SimpleNamespace(post=fake_post)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(post=fake_post)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(provider="ollama", model="")  # Empty model
         provider = OllamaProvider(config)
@@ -1577,111 +1602,107 @@ def fake_post(url, **kwargs):
 
         assert captured["json"]["model"] == "llama3.2"  # Default model
 
-    def test_annotate_success_full_flow(self, monkeypatch: pytest.MonkeyPatch):
-        """Ollama provider full annotation flow with mocked HTTP."""
+    def test_call_ollama_reuses_client(self, monkeypatch: pytest.MonkeyPatch):
+        """Ollama provider creates one HTTP client and reuses it for every call."""
+        clients = []
 
-        class FakeResponse:
-            def raise_for_status(self):
-                pass
-
-            def json(self):
-                return {
-                    "response": json.dumps(
-                        {
-                            "scenario": "Tests user login",
-                            "why_needed": "Prevents auth bugs",
-                            "key_assertions": ["check status", "validate token"],
-                        }
-                    )
-                }
+        def make_client(**_kwargs):
+            client = SimpleNamespace(post=lambda url, **kw: FakeHttpResponse())
+            clients.append(client)
+            return client
+
+        monkeypatch.setitem(sys.modules, "httpx", SimpleNamespace(Client=make_client))
+        provider = OllamaProvider(Config(provider="ollama"))
+
+        provider._call_ollama("one", "system")
+        provider._call_ollama("two", "system")
+
+        assert len(clients) == 1
+
+    def test_close_releases_client(self, monkeypatch: pytest.MonkeyPatch):
+        """Ollama provider closes its HTTP client and recreates it on next use."""
+        closed = []
+
+        def make_client(**_kwargs):
+            return SimpleNamespace(close=lambda: closed.append(True))
+
+        monkeypatch.setitem(sys.modules, "httpx", SimpleNamespace(Client=make_client))
+        provider = OllamaProvider(Config(provider="ollama"))
+        provider.close()  # Nothing to close yet
+
+        first = provider._get_client()
+        provider.close()
+
+        assert closed == [True]
+        assert provider._get_client() is not first
+
+    def test_annotate_success_full_flow(
+        self, login_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Ollama provider full annotation flow with mocked HTTP."""
 
         def fake_post(url, **kwargs):
-            return FakeResponse()
+            return FakeHttpResponse({"response": _LOGIN_RESPONSE_JSON})
 
-        fake_httpx = SimpleNamespace(post=fake_post)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(post=fake_post)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(provider="ollama", model="llama3.2")
         provider = OllamaProvider(config)
-        test = CaseResult(nodeid="tests/test_auth.py::test_login", outcome="passed")
 
-        annotation = provider.annotate(test, "def test_login(): assert True")
+        annotation = provider.annotate(login_case, "def test_login(): assert True")
 
-        assert annotation.scenario == "Tests user login"
-        assert annotation.why_needed == "Prevents auth bugs"
-        assert annotation.key_assertions == ["check status", "validate token"]
+        assert annotation.scenario == _LOGIN_PAYLOAD["scenario"]
+        assert annotation.why_needed == _LOGIN_PAYLOAD["why_needed"]
+        assert annotation.key_assertions == list(_LOGIN_PAYLOAD["key_assertions"])
         assert annotation.error is None
 
-    def test_annotate_with_token_usage(self, monkeypatch: pytest.MonkeyPatch):
+    def test_annotate_with_token_usage(
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """Ollama provider extracts token usage from response."""
 
-        class FakeResponse:
-            def raise_for_status(self):
-                pass
-
-            def json(self):
-                return {
-                    "response": json.dumps(
-                        {
-                            "scenario": "Test scenario",
-                            "why_needed": "Test reason",
-                            "key_assertions": ["assert 1"],
-                        }
-                    ),
+        def fake_post(url, **kwargs):
+            return FakeHttpResponse(
+                {
+                    "response": _OK_RESPONSE_JSON,
                     "prompt_eval_count": 100,
                     "eval_count": 50,
                 }
+            )
 
-        def fake_post(url, **kwargs):
-            return FakeResponse()
-
-        fake_httpx = SimpleNamespace(post=fake_post)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(post=fake_post)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(provider="ollama", model="llama3.2")
         provider = OllamaProvider(config)
-        test = CaseResult(nodeid="tests/test.py::test_case", outcome="passed")
 
-        annotation = provider.annotate(test, "def test_case(): pass")
+        annotation = provider.annotate(sample_case, "def test_case(): pass")
 
         assert annotation.token_usage is not None
         assert annotation.token_usage.prompt_tokens == 100
         assert annotation.token_usage.completion_tokens == 50
         assert annotation.token_usage.total_tokens == 150
 
-    def test_annotate_with_prompt_override(self, monkeypatch: pytest.MonkeyPatch):
+    def test_annotate_with_prompt_override(
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
+    ):
         """Ollama provider uses prompt_override when provided."""
         captured_prompts = []
 
-        class FakeResponse:
-            def raise_for_status(self):
-                pass
-
-            def json(self):
-                return {
-                    "response": json.dumps(
-                        {
-                            "scenario": "ok",
-                            "why_needed": "ok",
-                            "key_assertions": ["a"],
-                        }
-                    )
-                }
-
         def fake_post(url, **kwargs):
             captured_prompts.append(kwargs.get("json", {}).get("prompt"))
-            return FakeResponse()
+            return FakeHttpResponse({"response": _OK_RESPONSE_JSON})
 
-        fake_httpx = SimpleNamespace(post=fake_post)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(post=fake_post)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(provider="ollama")
         provider = OllamaProvider(config)
-        test = CaseResult(nodeid="t", outcome="passed")
 
         # Use the internal method that accepts prompt_override
         annotation = provider._annotate_internal(
-            test, "source", None, prompt_override="CUSTOM PROMPT"
+            sample_case, "source", None, prompt_override="CUSTOM PROMPT"
         )
 
         assert annotation.error is None
@@ -1692,17 +1713,11 @@ def test_get_max_context_tokens_from_parameters(
     ):
         """Ollama provider extracts context length from parameters."""
 
-        class FakeResponse:
-            status_code = 200
-
-            def json(self):
-                return {"parameters": "num_ctx 8192\nstop hello"}
-
         def fake_post(url, **kwargs):
-            return FakeResponse()
+            return FakeHttpResponse({"parameters": "num_ctx 8192\nstop hello"})
 
-        fake_httpx = SimpleNamespace(post=fake_post)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(post=fake_post)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(provider="ollama", model="llama3.2")
         provider = OllamaProvider(config)
@@ -1715,17 +1730,11 @@ def test_get_max_context_tokens_from_model_info(
     ):
         """Ollama provider extracts context length from model_info."""
 
-        class FakeResponse:
-            status_code = 200
-
-            def json(self):
-                return {"model_info": {"llama.context_length": 4096}}
-
         def fake_post(url, **kwargs):
-            return FakeResponse()
+            return FakeHttpResponse({"model_info": {"llama.context_length": 4096}})
 
-        fake_httpx = SimpleNamespace(post=fake_post)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(post=fake_post)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(provider="ollama", model="llama3.2")
         provider = OllamaProvider(config)
@@ -1738,17 +1747,11 @@ def test_get_max_context_tokens_context_length_key(
     ):
         """Ollama provider fallback to context_length key."""
 
-        class FakeResponse:
-            status_code = 200
-
-            def json(self):
-                return {"model_info": {"context_length": 2048}}
-
         def fake_post(url, **kwargs):
-            return FakeResponse()
+            return FakeHttpResponse({"model_info": {"context_length": 2048}})
 
-        fake_httpx = SimpleNamespace(post=fake_post)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(post=fake_post)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(provider="ollama")
         provider = OllamaProvider(config)
@@ -1764,8 +1767,8 @@ def test_get_max_context_tokens_fallback_on_error(
         def fake_post(url, **kwargs):
             raise ConnectionError("Server down")
 
-        fake_httpx = SimpleNamespace(post=fake_post)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(post=fake_post)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(provider="ollama")
         provider = OllamaProvider(config)
@@ -1778,14 +1781,11 @@ def test_get_max_context_tokens_non_200_status(
     ):
         """Ollama provider returns default on non-200 response."""
 
-        class FakeResponse:
-            status_code = 404
-
         def fake_post(url, **kwargs):
-            return FakeResponse()
+            return FakeHttpResponse(status_code=404)
 
-        fake_httpx = SimpleNamespace(post=fake_post)
-        monkeypatch.setitem(__import__("sys").modules, "httpx", fake_httpx)
+        fake_httpx = fake_httpx_module(post=fake_post)
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
 
         config = Config(provider="ollama")
         provider = OllamaProvider(config)
@@ -1794,19 +1794,18 @@ def fake_post(url, **kwargs):
         assert result == 4096  # Default fallback
 
     def test_annotate_runtime_error_immediate_fail(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, sample_case: CaseResult, monkeypatch: pytest.MonkeyPatch
     ):
         """Ollama provider fails immediately on RuntimeError."""
-        monkeypatch.setitem(__import__("sys").modules, "httpx", SimpleNamespace())
+        monkeypatch.setitem(sys.modules, "httpx", SimpleNamespace())
 
         config = Config(provider="ollama", llm_max_retries=3)
         provider = OllamaProvider(config)
-        test = CaseResult(nodeid="t", outcome="passed")
 
         def fake_call(prompt, system):
             raise RuntimeError("Code bug")
 
         monkeypatch.setattr(provider, "_call_ollama", fake_call)
-        annotation = provider._annotate_internal(test, "src")
+        annotation = provider._annotate_internal(sample_case, "src")
 
         assert annotation.error == "Code bug"
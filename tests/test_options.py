@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -52,6 +52,13 @@ def test_is_llm_enabled(self):
         cfg.provider = "ollama"
         assert cfg.is_llm_enabled()
 
+    def test_slotted_instances(self):
+        """Config uses slots, so instances carry no per-instance __dict__."""
+        cfg = Config()
+        assert not hasattr(cfg, "__dict__")
+        with pytest.raises(AttributeError):
+            cfg.not_a_field = True
+
     def test_get_default_config(self):
         """Test the factory function."""
         cfg = get_default_config()
@@ -110,38 +117,45 @@ def test_validate_numeric_ranges(self):
         assert "llm_max_retries must be 0 or positive" in errors
 
 
+# CLI options left unset (None) in the fake pytest config
+_CLI_ATTRS = (
+    "llm_report_html",
+    "llm_report_json",
+    "llm_report_pdf",
+    "llm_evidence_bundle",
+    "llm_dependency_snapshot",
+    "llm_requests_per_minute",
+    "llm_aggregate_dir",
+    "llm_aggregate_policy",
+    "llm_aggregate_run_id",
+    "llm_aggregate_group_id",
+    "llm_coverage_source",
+    "llm_max_retries",
+    "llm_provider",
+    "llm_model",
+    "llm_context_mode",
+    # Token Optimization CLI Flags
+    "llm_prompt_tier",
+    "llm_batch_parametrized",
+    "llm_context_compression",
+)
+
+
+def _pytest_config(rootpath, **options) -> SimpleNamespace:
+    """Build a lightweight stand-in for ``pytest.Config``.
+
+    Args:
+        rootpath: Directory searched for pyproject.toml.
+        **options: CLI option values overriding the unset defaults.
+    """
+    option = SimpleNamespace(**{**dict.fromkeys(_CLI_ATTRS), **options})
+    return SimpleNamespace(option=option, rootpath=rootpath)
+
+
 class TestLoadConfig:
     @pytest.fixture
     def mock_pytest_config(self, tmp_path):
-        config = MagicMock()
-        # Mock CLI options as an object with attributes
-        config.option = MagicMock()
-        # Set all potential CLI options to None by default
-        for attr in [
-            "llm_report_html",
-            "llm_report_json",
-            "llm_report_pdf",
-            "llm_evidence_bundle",
-            "llm_dependency_snapshot",
-            "llm_requests_per_minute",
-            "llm_aggregate_dir",
-            "llm_aggregate_policy",
-            "llm_aggregate_run_id",
-            "llm_aggregate_group_id",
-            "llm_coverage_source",
-            "llm_max_retries",
-            "llm_provider",
-            "llm_model",
-            "llm_context_mode",
-            # Token Optimization CLI Flags
-            "llm_prompt_tier",
-            "llm_batch_parametrized",
-            "llm_context_compression",
-        ]:
-            setattr(config.option, attr, None)
-
-        config.rootpath = tmp_path
-        return config
+        return _pytest_config(tmp_path)
 
     def test_load_defaults(self, mock_pytest_config):
         """Test loading configuration when no options are set."""
@@ -163,36 +177,7 @@ def test_load_from_pyproject(self, tmp_path):
 max_retries = 2
 """)
 
-        # Mock config
-        from unittest.mock import MagicMock
-
-        mock_pytest_config = MagicMock()
-        for attr in [
-            "llm_report_html",
-            "llm_report_json",
-            "llm_report_pdf",
-            "llm_evidence_bundle",
-            "llm_dependency_snapshot",
-            "llm_requests_per_minute",
-            "llm_aggregate_dir",
-            "llm_aggregate_policy",
-            "llm_aggregate_run_id",
-            "llm_aggregate_group_id",
-            "llm_coverage_source",
-            "llm_max_retries",
-            # New Core CLI Flags
-            "llm_provider",
-            "llm_model",
-            "llm_context_mode",
-            # Token Optimization CLI Flags
-            "llm_prompt_tier",
-            "llm_batch_parametrized",
-            "llm_context_compression",
-        ]:
-            setattr(mock_pytest_config.option, attr, None)
-        mock_pytest_config.rootpath = tmp_path
-
-        cfg = load_config(mock_pytest_config)
+        cfg = load_config(_pytest_config(tmp_path))
         assert cfg.provider == "ollama"
         assert cfg.model == "llama3"
         assert cfg.llm_context_mode == "balanced"
@@ -201,42 +186,13 @@ def test_load_from_pyproject(self, tmp_path):
 
     def test_load_config_missing_pyproject(self, tmp_path):
         """Test handling when pyproject.toml doesn't exist."""
-        from unittest.mock import MagicMock
-
-        mock_pytest_config = MagicMock()
-        for attr in [
-            "llm_report_html",
-            "llm_report_json",
-            "llm_report_pdf",
-            "llm_evidence_bundle",
-            "llm_dependency_snapshot",
-            "llm_requests_per_minute",
-            "llm_aggregate_dir",
-            "llm_aggregate_policy",
-            "llm_aggregate_run_id",
-            "llm_aggregate_group_id",
-            "llm_coverage_source",
-            "llm_max_retries",
-            # New Core CLI Flags
-            "llm_provider",
-            "llm_model",
-            "llm_context_mode",
-            # Token Optimization CLI Flags
-            "llm_prompt_tier",
-            "llm_batch_parametrized",
-            "llm_context_compression",
-        ]:
-            setattr(mock_pytest_config.option, attr, None)
-        mock_pytest_config.rootpath = tmp_path  # No pyproject.toml here
-
-        cfg = load_config(mock_pytest_config)
+        # No pyproject.toml in tmp_path
+        cfg = load_config(_pytest_config(tmp_path))
         # Should fallback to defaults
         assert cfg.llm_max_retries == 10
 
     def test_load_from_cli_overrides_pyproject(self, tmp_path):
         """Test that CLI options override pyproject.toml options."""
-        from unittest.mock import MagicMock
-
         # Create pyproject.toml
         pyproject = tmp_path / "pyproject.toml"
         pyproject.write_text("""
@@ -244,35 +200,13 @@ def test_load_from_cli_overrides_pyproject(self, tmp_path):
 provider = "ollama"
 """)
 
-        # Mock config
-        mock_pytest_config = MagicMock()
-        # Set CLI values
-        mock_pytest_config.option.llm_report_html = "cli_report.html"
-        mock_pytest_config.option.llm_requests_per_minute = 100
-        for attr in [
-            "llm_report_json",
-            "llm_report_pdf",
-            "llm_evidence_bundle",
-            "llm_dependency_snapshot",
-            "llm_aggregate_dir",
-            "llm_aggregate_policy",
-            "llm_aggregate_run_id",
-            "llm_aggregate_group_id",
-            "llm_coverage_source",
-            "llm_max_retries",
-            # New Core CLI Flags
-            "llm_provider",
-            "llm_model",
-            "llm_context_mode",
-            # Token Optimization CLI Flags
-            "llm_prompt_tier",
-            "llm_batch_parametrized",
-            "llm_context_compression",
-        ]:
-            setattr(mock_pytest_config.option, attr, None)
-        mock_pytest_config.rootpath = tmp_path
-
-        cfg = load_config(mock_pytest_config)
+        cfg = load_config(
+            _pytest_config(
+                tmp_path,
+                llm_report_html="cli_report.html",
+                llm_requests_per_minute=100,
+            )
+        )
 
         # CLI should win for html
         assert cfg.report_html == "cli_report.html"
@@ -281,8 +215,6 @@ def test_load_from_cli_overrides_pyproject(self, tmp_path):
 
     def test_load_from_cli_provider_override(self, tmp_path):
         """Test that CLI provider option overrides pyproject.toml."""
-        from unittest.mock import MagicMock
-
         # Create pyproject.toml
         pyproject = tmp_path / "pyproject.toml"
         pyproject.write_text("""
@@ -291,40 +223,9 @@ def test_load_from_cli_provider_override(self, tmp_path):
 model = "base"
 """)
 
-        # Mock config
-        mock_pytest_config = MagicMock()
-
-        # Reset other options
-        for attr in [
-            "llm_report_html",
-            "llm_report_json",
-            "llm_report_pdf",
-            "llm_evidence_bundle",
-            "llm_dependency_snapshot",
-            "llm_requests_per_minute",
-            "llm_aggregate_dir",
-            "llm_aggregate_policy",
-            "llm_aggregate_run_id",
-            "llm_aggregate_group_id",
-            "llm_coverage_source",
-            "llm_max_retries",
-            # New Core CLI Flags
-            "llm_provider",
-            "llm_model",
-            "llm_context_mode",
-            # Token Optimization CLI Flags
-            "llm_prompt_tier",
-            "llm_batch_parametrized",
-            "llm_context_compression",
-        ]:
-            setattr(mock_pytest_config.option, attr, None)
-        mock_pytest_config.rootpath = tmp_path
-
-        # Set overrides
-        mock_pytest_config.option.llm_provider = "ollama"
-        mock_pytest_config.option.llm_model = "llama3"
-
-        cfg = load_config(mock_pytest_config)
+        cfg = load_config(
+            _pytest_config(tmp_path, llm_provider="ollama", llm_model="llama3")
+        )
 
         assert cfg.provider == "ollama"
         assert cfg.model == "llama3"
@@ -548,6 +548,12 @@ def test_validate_batch_max_tests_too_small(self):
         errors = cfg.validate()
         assert any("batch_max_tests must be at least 1" in e for e in errors)
 
+    def test_validate_llm_batch_size_too_small(self):
+        """Test validation with llm_batch_size < 1."""
+        cfg = Config(llm_batch_size=0)
+        errors = cfg.validate()
+        assert any("llm_batch_size must be at least 1" in e for e in errors)
+
     def test_validate_context_line_padding_negative(self):
         """Test validation with negative context_line_padding."""
         cfg = Config(context_line_padding=-1)
@@ -615,6 +621,16 @@ def test_load_batch_max_tests(self, tmp_path):
         cfg = load_config(self._make_mock_config(tmp_path))
         assert cfg.batch_max_tests == 10
 
+    def test_load_batch_size(self, tmp_path):
+        """Test loading batch_size from pyproject.toml."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("""
+[tool.pytest_llm_report]
+batch_size = 4
+""")
+        cfg = load_config(self._make_mock_config(tmp_path))
+        assert cfg.llm_batch_size == 4
+
     def test_load_context_compression(self, tmp_path):
         """Test loading context_compression from pyproject.toml."""
         pyproject = tmp_path / "pyproject.toml"
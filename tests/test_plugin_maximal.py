@@ -221,8 +221,11 @@ def test_pytest_configure_worker_skip(self):
         mock_config = MagicMock()
         mock_config.workerinput = {"workerid": "gw0"}
 
-        # Should return early without calling addinivalue_line
-        pytest_configure(mock_config)
+        # Should return early without loading or storing configuration
+        with patch("pytest_llm_report.options.load_config") as mock_load:
+            pytest_configure(mock_config)
+        mock_load.assert_not_called()
+        mock_config.stash.__setitem__.assert_not_called()
         # addinivalue_line is still called for markers before worker check
         assert mock_config.addinivalue_line.called
 
@@ -72,6 +72,41 @@ def test_should_exclude(self):
         assert assembler._should_exclude("secret/key.txt") is True
         assert assembler._should_exclude("public/readme.md") is False
 
+    def test_should_exclude_without_globs(self):
+        config = Config(llm_context_exclude_globs=[])
+        assembler = ContextAssembler(config)
+
+        assert assembler._should_exclude("secret/key.txt") is False
+
+    def test_exclude_matchers_are_shared(self):
+        first = ContextAssembler(Config())
+        second = ContextAssembler(Config())
+
+        assert first._exclude_re is second._exclude_re
+        assert first._exclude_prefixes is second._exclude_prefixes
+
+    def test_should_exclude_matches_fnmatch(self):
+        import fnmatch
+
+        globs = Config().llm_context_exclude_globs + ["src/gen/*", "a?c.py"]
+        assembler = ContextAssembler(Config(llm_context_exclude_globs=globs))
+        paths = [
+            ".env",
+            ".env.local",
+            "app/.env",
+            ".git/config",
+            "__pycache__/mod.cpython-312.pyc",
+            "src/gen/deep/x.py",
+            "src/general.py",
+            "abc.py",
+            "certs/server.pem",
+            "src/app.py",
+        ]
+
+        for path in paths:
+            expected = any(fnmatch.fnmatch(path, glob) for glob in globs)
+            assert assembler._should_exclude(path) is expected, path
+
     def test_balanced_context_limits(self, tmp_path):
         config = Config(
             llm_context_mode="balanced",
@@ -9,6 +9,8 @@
 - Line 149: File matches exclude pattern
 """
 
+import pytest
+
 from pytest_llm_report.models import CoverageEntry, TestCaseResult
 from pytest_llm_report.options import Config
 from pytest_llm_report.prompts import ContextAssembler
@@ -72,6 +74,297 @@ def test_second():
         assert "def test_first" in result
         assert "test_second" not in result
 
+    def test_get_test_source_reuses_file_until_modified(self, tmp_path, monkeypatch):
+        """Tests from one file read it once; a newer mtime rereads it."""
+        import os
+        from pathlib import Path
+
+        test_file = tmp_path / "test_many.py"
+        test_file.write_text("def test_a():\n    pass\n\ndef test_b():\n    pass\n")
+        config = Config(repo_root=tmp_path)
+        assembler = ContextAssembler(config)
+        reads = []
+        read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self)
+            return read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+        assert "test_a" in assembler._get_test_source("test_many.py::test_a", tmp_path)
+        assert "test_b" in assembler._get_test_source("test_many.py::test_b", tmp_path)
+        assert len(reads) == 1
+
+        test_file.write_text("def test_c():\n    pass\n")
+        stat = test_file.stat()
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert "test_c" in assembler._get_test_source("test_many.py::test_c", tmp_path)
+        assert len(reads) == 2
+
+    def test_get_test_source_uses_definition_index(self, tmp_path):
+        """Each test starts at its own definition, not a similarly named one."""
+        test_file = tmp_path / "test_index.py"
+        test_file.write_text(
+            "def helper():\n"
+            "    return 'def test_b('\n"
+            "\n"
+            "def test_b_extra():\n"
+            "    pass\n"
+            "\n"
+            "class TestB:\n"
+            "    def test_b(self, x):\n"
+            "        assert x\n"
+            "\n"
+            "def test_c():\n"
+            "    pass\n"
+        )
+        config = Config(repo_root=tmp_path)
+        assembler = ContextAssembler(config)
+
+        assert assembler._get_test_source("test_index.py::helper", tmp_path) == (
+            "def helper():\n    return 'def test_b('\n"
+        )
+        assert assembler._get_test_source("test_index.py::test_b_extra", tmp_path) == (
+            "def test_b_extra():\n    pass\n"
+        )
+        assert assembler._get_test_source("test_index.py::TestB::test_c", tmp_path) == (
+            "def test_c():\n    pass\n"
+        )
+        _, def_index = assembler._read_source(test_file)
+        assert def_index["test_b"] == 1
+
+    def test_balanced_context_reads_shared_file_once(self, tmp_path, monkeypatch):
+        """A file covered by many tests is read and prepared once."""
+        from pathlib import Path
+
+        (tmp_path / "utils.py").write_text("def util():\n    return 1\n")
+        config = Config(llm_context_mode="balanced", repo_root=tmp_path)
+        assembler = ContextAssembler(config)
+        reads = []
+        read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self.name)
+            return read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        coverage = [
+            CoverageEntry(file_path="utils.py", line_ranges="1-2", line_count=2),
+            CoverageEntry(file_path="missing.py", line_ranges="1", line_count=1),
+        ]
+
+        for name in ("test_a", "test_b"):
+            test = TestCaseResult(nodeid=f"t.py::{name}", outcome="passed")
+            test.coverage = coverage
+            context = assembler._get_balanced_context(test, tmp_path)
+            assert list(context) == ["utils.py"]
+
+        assert reads == ["utils.py", "missing.py"]
+
+    def test_prefetch_reads_covered_files_ahead(self, tmp_path, monkeypatch):
+        """Prefetched files are assembled without reading them again."""
+        from pathlib import Path
+
+        (tmp_path / "utils.py").write_text("def util():\n    return 1\n")
+        (tmp_path / "secret.py").write_text("KEY = 1\n")
+        config = Config(llm_context_mode="balanced", repo_root=tmp_path)
+        assembler = ContextAssembler(config)
+        coverage = [
+            CoverageEntry(file_path=name, line_ranges="1", line_count=1)
+            for name in ("utils.py", "secret.py", "missing.py")
+        ]
+        balanced = TestCaseResult(nodeid="t.py::test_a", outcome="passed")
+        balanced.coverage = coverage
+        minimal = TestCaseResult(
+            nodeid="t.py::test_b", outcome="passed", llm_context_override="minimal"
+        )
+        minimal.coverage = [
+            CoverageEntry(file_path="other.py", line_ranges="1", line_count=1)
+        ]
+
+        assembler.prefetch([balanced, minimal])
+
+        assert assembler._prefetched == {
+            (str(tmp_path / "utils.py"), None),
+            (str(tmp_path / "missing.py"), None),
+        }
+        reads = []
+        read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self.name)
+            return read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        context = assembler._get_balanced_context(balanced, tmp_path)
+
+        assert list(context) == ["utils.py"]
+        assert reads == []
+        assert assembler._prefetched == set()
+
+    def test_prefetch_honors_file_limit_and_budget(self, tmp_path):
+        """Prefetch reads only the files and characters assembly will use."""
+        for name in ("a.py", "b.py"):
+            (tmp_path / name).write_text("x" * 5000)
+        config = Config(
+            llm_context_mode="balanced",
+            repo_root=tmp_path,
+            llm_context_bytes=1000,
+            llm_context_file_limit=1,
+            llm_strip_docstrings=False,
+        )
+        assembler = ContextAssembler(config)
+        test = TestCaseResult(
+            nodeid="t.py::test_a",
+            outcome="passed",
+            coverage=[
+                CoverageEntry(file_path=name, line_ranges="1", line_count=1)
+                for name in ("a.py", "b.py")
+            ],
+        )
+
+        assembler.prefetch([test])
+
+        key = (str(tmp_path / "a.py"), 1001)
+        assert assembler._prefetched == {key}
+        assert len(assembler._context_sources[key][0]) == 1001
+
+    @pytest.mark.parametrize("mode", ["balanced", "complete"])
+    def test_assemble_uses_prefetched_files(self, tmp_path, mode):
+        """Assembly reads the exact entries prefetch loaded, in every mode."""
+        (tmp_path / "utils.py").write_text("def util():\n    return 1\n")
+        config = Config(
+            llm_context_mode=mode, repo_root=tmp_path, llm_strip_docstrings=False
+        )
+        assembler = ContextAssembler(config)
+        test = TestCaseResult(
+            nodeid="t.py::test_a",
+            outcome="passed",
+            coverage=[
+                CoverageEntry(file_path="utils.py", line_ranges="1", line_count=1)
+            ],
+        )
+
+        assembler.prefetch([test])
+        prefetched = set(assembler._prefetched)
+        _, context = assembler.assemble(test, tmp_path)
+
+        assert len(prefetched) == 1
+        assert set(assembler._context_sources) == prefetched
+        assert assembler._prefetched == set()
+        assert context == {"utils.py": "def util():\n    return 1\n"}
+
+    def test_release_prefetched_drops_unused_files(self, tmp_path):
+        """Files past the byte budget are released after assembly."""
+        for name in ("a.py", "b.py"):
+            (tmp_path / name).write_text("x" * 5000)
+        config = Config(
+            llm_context_mode="balanced",
+            repo_root=tmp_path,
+            llm_context_bytes=1000,
+            llm_strip_docstrings=False,
+        )
+        assembler = ContextAssembler(config)
+        test = TestCaseResult(
+            nodeid="t.py::test_a",
+            outcome="passed",
+            coverage=[
+                CoverageEntry(file_path=name, line_ranges="1", line_count=1)
+                for name in ("a.py", "b.py")
+            ],
+        )
+
+        assembler.prefetch([test])
+        context = assembler._get_balanced_context(test, tmp_path)
+        assembler.release_prefetched()
+
+        assert list(context) == ["a.py"]
+        assert list(assembler._context_sources) == [(str(tmp_path / "a.py"), 1001)]
+        assert assembler._prefetched == set()
+
+    def test_balanced_context_stops_at_file_limit(self, tmp_path, monkeypatch):
+        """Coverage entries past the file limit are never read."""
+        from pathlib import Path
+
+        for i in range(15):
+            (tmp_path / f"mod_{i}.py").write_text(f"value = {i}\n")
+        config = Config(
+            repo_root=tmp_path, llm_context_mode="balanced", llm_context_file_limit=5
+        )
+        assembler = ContextAssembler(config)
+        loaded = []
+        load = assembler._load_context_source
+
+        def recording_load(path, *args):
+            loaded.append(Path(path).name)
+            return load(path, *args)
+
+        monkeypatch.setattr(assembler, "_load_context_source", recording_load)
+        test = TestCaseResult(
+            nodeid="test.py::test_foo",
+            outcome="passed",
+            coverage=[
+                CoverageEntry(file_path=f"mod_{i}.py", line_ranges="1", line_count=1)
+                for i in range(15)
+            ],
+        )
+
+        context = assembler._get_balanced_context(test, tmp_path)
+
+        assert len(context) == 5
+        assert loaded == [f"mod_{i}.py" for i in range(5)]
+
+    def test_balanced_context_negative_file_limit(self, tmp_path):
+        """A negative file limit slices coverage like a list slice would."""
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text("value = 1\n")
+        config = Config(
+            repo_root=tmp_path, llm_context_mode="balanced", llm_context_file_limit=-1
+        )
+        test = TestCaseResult(
+            nodeid="test.py::test_foo",
+            outcome="passed",
+            coverage=[
+                CoverageEntry(file_path=name, line_ranges="1", line_count=1)
+                for name in ("a.py", "b.py", "c.py")
+            ],
+        )
+
+        context = ContextAssembler(config)._get_balanced_context(test, tmp_path)
+
+        assert list(context) == ["a.py", "b.py"]
+
+    def test_balanced_context_reads_only_the_budget(self, tmp_path):
+        """Without stripping or line extraction, only the budget is read."""
+        (tmp_path / "large_module.py").write_text("x = 1\n" * 10_000)
+        config = Config(
+            repo_root=tmp_path,
+            llm_context_mode="balanced",
+            llm_context_bytes=100,
+            context_compression="none",
+            llm_strip_docstrings=False,
+        )
+        assembler = ContextAssembler(config)
+        test = TestCaseResult(
+            nodeid="test.py::test_foo",
+            outcome="passed",
+            coverage=[
+                CoverageEntry(
+                    file_path="large_module.py", line_ranges="1-10", line_count=10
+                )
+            ],
+        )
+
+        context = assembler._get_balanced_context(test, tmp_path)
+
+        assert context["large_module.py"] == ("x = 1\n" * 17)[:100] + (
+            "\n# ... truncated"
+        )
+        [(content, _lines)] = assembler._context_sources.values()
+        assert len(content) == 101
+
     def test_balanced_context_max_bytes_limit(self, tmp_path):
         """Test that balanced context respects max bytes limit."""
         # Create a source file
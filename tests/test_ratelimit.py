@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: MIT
+"""Tests for the LLM request rate limiter."""
+
+import pytest
+
+from pytest_llm_report.llm.ratelimit import TokenBucket
+
+
+class FakeTime:
+    """Clock whose sleep advances monotonic time."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_time(monkeypatch: pytest.MonkeyPatch) -> FakeTime:
+    """Patch the clock used by the rate limiter."""
+    clock = FakeTime()
+    monkeypatch.setattr(
+        "pytest_llm_report.llm.ratelimit.time.monotonic", clock.monotonic
+    )
+    monkeypatch.setattr("pytest_llm_report.llm.ratelimit.time.sleep", clock.sleep)
+    return clock
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_first_request_does_not_wait(self, fake_time: FakeTime):
+        """A full bucket lets the first request start immediately."""
+        TokenBucket(rate_per_minute=30).acquire()
+
+        assert fake_time.sleeps == []
+
+    def test_spaces_requests_by_rate(self, fake_time: FakeTime):
+        """Back-to-back requests wait one interval each."""
+        bucket = TokenBucket(rate_per_minute=30)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        assert fake_time.sleeps == [2.0, 2.0]
+
+    def test_idle_time_refills_tokens(self, fake_time: FakeTime):
+        """Requests spaced wider than the interval never wait."""
+        bucket = TokenBucket(rate_per_minute=60)
+
+        bucket.acquire()
+        fake_time.now += 5.0
+        bucket.acquire()
+
+        assert fake_time.sleeps == []
+
+    def test_burst_allows_immediate_requests(self, fake_time: FakeTime):
+        """Up to ``burst`` requests start without waiting."""
+        bucket = TokenBucket(rate_per_minute=60, burst=3)
+
+        for _ in range(4):
+            bucket.acquire()
+
+        assert fake_time.sleeps == [1.0]
+
+    def test_waiting_callers_reserve_later_slots(self, monkeypatch: pytest.MonkeyPatch):
+        """Callers arriving together each get their own slot."""
+        sleeps: list[float] = []
+        monkeypatch.setattr(
+            "pytest_llm_report.llm.ratelimit.time.monotonic", lambda: 0.0
+        )
+        monkeypatch.setattr("pytest_llm_report.llm.ratelimit.time.sleep", sleeps.append)
+        bucket = TokenBucket(rate_per_minute=60)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        assert sleeps == [1.0, 2.0]
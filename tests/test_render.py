@@ -14,6 +14,7 @@
     format_duration,
     outcome_to_css_class,
     render_fallback_html,
+    render_html,
 )
 
 
@@ -49,6 +50,38 @@ def test_unknown_outcome(self):
         assert outcome_to_css_class("unknown") == "outcome-unknown"
 
 
+class TestRenderHtml:
+    """Tests for render_html function."""
+
+    def test_reuses_compiled_templates(self, monkeypatch):
+        """Repeated renders share one environment and compile templates once."""
+        from jinja2 import Environment
+
+        from pytest_llm_report import render
+
+        render._shared_jinja_env.cache_clear()
+        compiled = []
+        compile_templates = Environment.compile
+
+        def counting_compile(self, *args, **kwargs):
+            compiled.append(args[1] if len(args) > 1 else kwargs.get("name"))
+            return compile_templates(self, *args, **kwargs)
+
+        monkeypatch.setattr(Environment, "compile", counting_compile)
+        report = ReportRoot(
+            tests=[TestCaseResult(nodeid="test::passed", outcome="passed")]
+        )
+
+        first = render_html(report)
+        count = len(compiled)
+        second = render_html(report)
+
+        assert "test::passed" in first
+        assert first == second
+        assert count > 0
+        assert len(compiled) == count
+
+
 class TestRenderFallbackHtml:
     """Tests for render_fallback_html function."""
 
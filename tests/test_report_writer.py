@@ -1,9 +1,12 @@
 # SPDX-License-Identifier: MIT
 """Tests for pytest_llm_report.report_writer module."""
 
+import json
 from datetime import UTC, datetime
 from pathlib import Path
 
+import pytest
+
 from pytest_llm_report.__about__ import __version__
 from pytest_llm_report.errors import WarningCode
 from pytest_llm_report.models import CoverageEntry, SourceCoverageEntry, TestCaseResult
@@ -26,6 +29,12 @@ def test_different_content(self):
         hash1 = compute_sha256(b"hello")
         hash2 = compute_sha256(b"world")
         assert hash1 != hash2
+        assert (
+            hash1 == "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824"
+        )
+        assert (
+            hash2 == "486ea46224d1bb4fb680f34f7c9ad96a8f24ec88be73ea8e5a6c65260e9cb8a7"
+        )
 
 
 class TestReportWriter:
@@ -182,6 +191,42 @@ def test_write_json_creates_file(self, tmp_path):
         # Should have artifact tracked
         assert len(writer.artifacts) >= 1
 
+    def test_write_json_embeds_hash_of_unhashed_report(self, tmp_path):
+        """Embedded hash covers the report without it; layout is unchanged."""
+        json_path = tmp_path / "report.json"
+        writer = ReportWriter(Config(report_json=str(json_path)))
+
+        writer.write_report([TestCaseResult(nodeid="test1", outcome="passed")])
+
+        content = json_path.read_text()
+        data = json.loads(content)
+        sha256 = data.pop("sha256")
+        assert content == json.dumps(
+            {**data, "sha256": sha256}, indent=2, sort_keys=True
+        )
+        unhashed = json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+        assert sha256 == compute_sha256(unhashed)
+        assert writer.artifacts[0].sha256 == sha256
+
+    def test_write_json_is_stdlib_layout(self, tmp_path):
+        """Floats and non-ASCII text are written exactly as the stdlib encodes them."""
+        json_path = tmp_path / "report.json"
+        writer = ReportWriter(Config(report_json=str(json_path)))
+
+        writer.write_report(
+            [TestCaseResult(nodeid="test_é", outcome="passed", duration=1e-05)]
+        )
+
+        content = json_path.read_text()
+        data = json.loads(content)
+        assert data["tests"][0]["duration"] == 1e-05
+        assert '"duration": 1e-05' in content
+        assert "test_\\u00e9" in content
+        assert content == json.dumps(data, indent=2, sort_keys=True)
+        sha256 = data.pop("sha256")
+        unhashed = json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+        assert sha256 == compute_sha256(unhashed)
+
     def test_write_html_creates_file(self, tmp_path):
         """Should create HTML file."""
         html_path = str(tmp_path / "report.html")
@@ -212,6 +257,39 @@ def test_write_html_creates_file(self, tmp_path):
         assert "XPassed" in html
         assert "Errors" in html
 
+    def test_write_html_streams_with_matching_artifact(self, tmp_path, monkeypatch):
+        """Streamed HTML is hashed and sized from the bytes written."""
+        from pytest_llm_report import render
+
+        monkeypatch.setattr(render, "_STREAM_CHUNK_CHARS", 64)
+        html_path = tmp_path / "report.html"
+        writer = ReportWriter(Config(report_html=str(html_path)))
+
+        report = writer.write_report([TestCaseResult(nodeid="test1", outcome="passed")])
+
+        content = html_path.read_bytes()
+        assert content.decode("utf-8") == render.render_html(report)
+        assert len(list(render.iter_html(report))) > 1
+        [artifact] = writer.artifacts
+        assert artifact.sha256 == compute_sha256(content)
+        assert artifact.size_bytes == len(content)
+
+    def test_write_html_render_error_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        """A template error while streaming removes the partial temp file."""
+        from pytest_llm_report import render
+
+        def failing_iter_html(report):
+            yield "<html>"
+            raise RuntimeError("template error")
+
+        monkeypatch.setattr(render, "iter_html", failing_iter_html)
+        writer = ReportWriter(Config(report_html=str(tmp_path / "report.html")))
+
+        with pytest.raises(RuntimeError, match="template error"):
+            writer.write_report([TestCaseResult(nodeid="test1", outcome="passed")])
+
+        assert list(tmp_path.iterdir()) == []
+
     def test_write_html_includes_xfail_summary(self, tmp_path):
         """Should include xfail outcomes in the HTML summary."""
         html_path = str(tmp_path / "report.html")
@@ -255,6 +333,7 @@ def test_atomic_write_fallback(self, tmp_path):
 
         assert (tmp_path / "report.json").exists()
         assert any(w.code == "W203" for w in writer.warnings)
+        assert not list(tmp_path.glob("*.tmp"))
 
     def test_ensure_dir_failure(self, tmp_path):
         """Should capture warning if directory creation fails."""
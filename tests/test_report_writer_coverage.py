@@ -7,6 +7,7 @@
 - Lines 449-451: _resolve_pdf_html_source when no existing HTML
 """
 
+import subprocess
 from unittest.mock import MagicMock, patch
 
 from pytest_llm_report.models import ReportRoot, RunMeta, Summary, TestCaseResult
@@ -35,6 +36,28 @@ def test_git_info_from_nonexistent_path(self, tmp_path):
         assert sha is None
         assert dirty is None
 
+    def test_git_info_reports_head_and_dirty_state(self, tmp_path):
+        """Test sha and dirty flag come from a single git status call."""
+
+        def git(*args):
+            return subprocess.check_output(
+                ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                cwd=tmp_path,
+                text=True,
+            ).strip()
+
+        git("init", "-q")
+        assert get_git_info(tmp_path) == (None, None)
+
+        (tmp_path / "a.txt").write_text("a")
+        git("add", "a.txt")
+        git("commit", "-q", "-m", "init")
+        head = git("rev-parse", "HEAD")
+        assert get_git_info(tmp_path) == (head, False)
+
+        (tmp_path / "a.txt").write_text("b")
+        assert get_git_info(tmp_path) == (head, True)
+
 
 class TestGetPluginGitInfo:
     """Tests for get_plugin_git_info function."""
@@ -1,7 +1,10 @@
 # SPDX-License-Identifier: MIT
 """Tests for LLM schemas."""
 
-from pytest_llm_report.llm.schemas import AnnotationSchema
+from pytest_llm_report.llm.schemas import (
+    AnnotationSchema,
+    extract_json_from_response,
+)
 
 
 class TestAnnotationSchema:
@@ -32,3 +35,17 @@ def test_to_dict_full(self):
         assert data["why_needed"] == "Catch auth bugs"
         assert data["key_assertions"] == ["assert 200", "assert token"]
         assert data["confidence"] == 0.95
+
+
+class TestExtractJsonFromResponse:
+    def test_bare_object_is_returned_whole(self):
+        """Bare JSON objects skip fence matching, even with fences inside strings."""
+        response = '  {"scenario": "Shows ```json {} ``` in docs"}\n'
+
+        assert extract_json_from_response(response) == response.strip()
+
+    def test_fenced_object_is_unwrapped(self):
+        """JSON wrapped in a markdown fence is extracted from the fence."""
+        response = 'Here you go:\n```json\n{"scenario": "x"}\n```'
+
+        assert extract_json_from_response(response) == '{"scenario": "x"}'
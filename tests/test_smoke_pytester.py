@@ -277,11 +277,11 @@ def test_multiple_xfail_outcomes(self, pytester: pytest.Pytester):
             import pytest
 
             @pytest.mark.xfail
-            def test_xfail_one():
+            def test_xfail_two():
                 assert False
 
             @pytest.mark.xfail
-            def test_xfail_two():
+            def test_xfail_one():
                 assert False
             """
         )
@@ -293,6 +293,11 @@ def test_xfail_two():
         assert data["summary"]["xfailed"] == 2
         outcomes = [test["outcome"] for test in data["tests"]]
         assert outcomes == ["xfailed", "xfailed"]
+        # Tests are listed in sorted nodeid order, not definition order
+        assert [test["nodeid"] for test in data["tests"]] == [
+            "test_multiple_xfail_outcomes.py::test_xfail_one",
+            "test_multiple_xfail_outcomes.py::test_xfail_two",
+        ]
 
 
 class TestParametrization: